@@ -14,4 +14,4 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from src.agents.gcp_security.cli import main
 
 if __name__ == "__main__":
-    main()
+    main(sys.argv[1:])
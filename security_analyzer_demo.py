@@ -7,8 +7,9 @@ a configuration file for security poisoning.
 
 import os
 import json
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
+from rich.text import Text
 from rich.markdown import Markdown
 from dotenv import load_dotenv
 
@@ -68,12 +69,14 @@ def main():
             console.print(f"Found [bold red]{len(results['findings'])}[/bold red] security issues in configuration.")
             console.print()
             
-            # Display findings
+            # Display findings in a single render pass
+            renderables = []
             for i, finding in enumerate(results["findings"], 1):
-                console.print(f"[bold]Issue {i}: {finding['type'].replace('_', ' ').title()}[/bold]")
-                console.print(f"  Matched: [yellow]{finding['matched_text']}[/yellow]")
-                console.print(f"  Context: {finding['context'][:50]}...")
-                console.print()
+                renderables.append(Text.from_markup(f"[bold]Issue {i}: {finding['type'].replace('_', ' ').title()}[/bold]"))
+                renderables.append(Text.from_markup(f"  Matched: [yellow]{finding['matched_text']}[/yellow]"))
+                renderables.append(Text.from_markup(f"  Context: {finding['context'][:50]}..."))
+                renderables.append(Text())
+            console.print(Group(*renderables))
             
             # Display LLM explanation if available
             if "explanation" in results:
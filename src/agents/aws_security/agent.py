@@ -10,29 +10,31 @@ import os
 import sys
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
+from operator import itemgetter
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_core.messages import SystemMessage, HumanMessage
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich import box
-
 # Add root to path to import root-level modules
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../..'))
 
 from aws_security_agent import AWSSecurityAgent as RootAWSSecurityAgent
-from src.audit.exporters import JSONExporter, CSVExporter, HTMLExporter
 from src.remediation import PlaybookExecutor, PlaybookLibrary
-from src.audit import AWSAuditReport
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-console = Console()
+
+# Rich, the exporters and the audit generator are imported on first use so
+# that constructing the agent (or exporting a single format) does not pay
+# for the whole rendering/export stack.
+@lru_cache(maxsize=1)
+def _console():
+    """Return the shared Rich console, creating it on first use."""
+    from rich.console import Console
+    return Console()
 
 
 class AWSSecurityAgent(RootAWSSecurityAgent):
@@ -55,15 +57,28 @@ class AWSSecurityAgent(RootAWSSecurityAgent):
         """
         super().__init__(aws_profile=aws_profile, aws_region=aws_region)
         
-        # Initialize exporters
-        self.json_exporter = JSONExporter()
-        self.csv_exporter = CSVExporter()
-        self.html_exporter = HTMLExporter()
-        
         # Initialize remediation
         self.playbook_executor = PlaybookExecutor()
         self.playbooks = PlaybookLibrary.get_all_playbooks()
     
+    @cached_property
+    def json_exporter(self):
+        """JSON exporter, imported and built on first use."""
+        from src.audit.exporters.json_exporter import JSONExporter
+        return JSONExporter()
+    
+    @cached_property
+    def csv_exporter(self):
+        """CSV exporter, imported and built on first use."""
+        from src.audit.exporters.csv_exporter import CSVExporter
+        return CSVExporter()
+    
+    @cached_property
+    def html_exporter(self):
+        """HTML exporter, imported and built on first use."""
+        from src.audit.exporters.html_exporter import HTMLExporter
+        return HTMLExporter()
+    
     def export_report(self, findings: Dict[str, Any], format: str = "json", 
                       output_path: Optional[str] = None) -> str:
         """
@@ -81,21 +96,18 @@ class AWSSecurityAgent(RootAWSSecurityAgent):
             account_id = self.aws_profile or os.getenv("AWS_ACCOUNT_ID", "unknown")
             
             if format == "json":
-                exporter = JSONExporter()
                 file_path = output_path or f"reports/aws_report_{account_id}.json"
-                exporter.export_report(findings, file_path)
+                self.json_exporter.export_report(findings, file_path)
                 return f"✅ JSON export successful: {file_path}"
                 
             elif format == "csv":
-                exporter = CSVExporter()
                 file_path = output_path or f"reports/aws_findings_{account_id}.csv"
-                exporter.export_findings_to_csv(findings.get("findings", []), file_path)
+                self.csv_exporter.export_findings_to_csv(findings.get("findings", []), file_path)
                 return f"✅ CSV export successful: {file_path}"
                 
             elif format == "html":
-                exporter = HTMLExporter()
                 file_path = output_path or f"reports/aws_report_{account_id}.html"
-                exporter.export_email_template(findings, file_path)
+                self.html_exporter.export_email_template(findings, file_path)
                 return f"✅ HTML export successful: {file_path}"
                 
             else:
@@ -154,12 +166,38 @@ class AWSSecurityAgent(RootAWSSecurityAgent):
                 "error": str(e)
             }
     
-    def get_playbooks_for_account(self) -> Dict[str, Any]:
+    def remediate_findings(self, finding_ids: List[str], dry_run: bool = True,
+                           max_workers: int = 8) -> List[Dict[str, Any]]:
         """
-        Get all AWS-specific remediation playbooks available for this account.
+        Execute remediation playbooks for several findings concurrently.
+        
+        Each finding is handled by remediate_finding, which builds its own
+        PlaybookExecutor, so the worker threads share no executor state.
+        
+        Args:
+            finding_ids: Finding IDs to remediate
+            dry_run: Test without making changes
+            max_workers: Maximum number of concurrent remediations
         
         Returns:
-            Dictionary of available playbooks
+            Execution status dictionaries, in the same order as finding_ids
+        """
+        if not finding_ids:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(finding_ids))) as pool:
+            return list(pool.map(
+                lambda finding_id: self.remediate_finding(finding_id, dry_run=dry_run),
+                finding_ids
+            ))
+    
+    @cached_property
+    def playbooks_for_account(self) -> Dict[str, Any]:
+        """
+        AWS-specific remediation playbooks available for this account.
+        
+        Built once per agent since self.playbooks does not change after
+        __init__; call invalidate_playbook_cache() if it is reloaded.
         """
         aws_playbooks = {}
         for pb_name, pb in self.playbooks.items():
@@ -173,6 +211,19 @@ class AWSSecurityAgent(RootAWSSecurityAgent):
                 }
         return aws_playbooks
     
+    def get_playbooks_for_account(self) -> Dict[str, Any]:
+        """
+        Get all AWS-specific remediation playbooks available for this account.
+        
+        Returns:
+            Dictionary of available playbooks
+        """
+        return self.playbooks_for_account
+    
+    def invalidate_playbook_cache(self) -> None:
+        """Drop the cached playbook summary so it is rebuilt on next access."""
+        self.__dict__.pop("playbooks_for_account", None)
+    
     def generate_and_export_audit(self, export_format: str = "json") -> Dict[str, Any]:
         """
         Generate a complete AWS security audit and export it.
@@ -184,6 +235,8 @@ class AWSSecurityAgent(RootAWSSecurityAgent):
             Audit and export results
         """
         try:
+            from src.audit import AWSAuditReport
+            
             # Generate audit
             audit_report = AWSAuditReport(account_id=self.aws_profile)
             audit_data = audit_report.generate()
@@ -207,6 +260,10 @@ class AWSSecurityAgent(RootAWSSecurityAgent):
     
     def display_remediation_summary(self):
         """Display available remediation playbooks and their status."""
+        from rich.table import Table
+        from rich import box
+        
+        console = _console()
         aws_playbooks = self.get_playbooks_for_account()
         
         if not aws_playbooks:
@@ -226,7 +283,7 @@ class AWSSecurityAgent(RootAWSSecurityAgent):
             "LOW": "[bold green]LOW[/bold green]"
         }
         
-        for pb_name, pb_info in sorted(aws_playbooks.items()):
+        for pb_name, pb_info in sorted(aws_playbooks.items(), key=itemgetter(0)):
             severity_display = severity_colors.get(pb_info["severity"], pb_info["severity"])
             table.add_row(
                 pb_info["name"],
@@ -7,599 +7,884 @@ Supports IAM (Entra ID), Storage security, Compute security, and networking.
 """
 
 import os
+import re
+import sys
+import asyncio
+import contextlib
+import copy
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_core.messages import SystemMessage, HumanMessage
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich import box
-
-from src.audit import AzureAuditReport
-from src.audit.exporters import JSONExporter, CSVExporter, HTMLExporter
 from src.remediation import PlaybookExecutor, PlaybookLibrary
+from src.utils import TTLCache, estimate_tokens, hash_key
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-console = Console()
+# User recorded as the initiator of remediation runs
+_RUN_USER = os.environ.get("USER", "system")
 
 
-class AzureSecurityAgent:
-    """
-    An agent for assessing and analyzing security in Microsoft Azure.
-    Supports Entra ID (formerly Azure AD), Storage, Compute, SQL, and Networking security checks.
-    """
-    
-    def __init__(self, subscription_id: Optional[str] = None, google_api_key: Optional[str] = None):
-        """
-        Initialize the Azure Security Agent.
-        
-        Args:
-            subscription_id: Azure subscription ID (defaults to environment variable)
-            google_api_key: Google API key for Gemini LLM
-        """
-        self.subscription_id = subscription_id or os.getenv("AZURE_SUBSCRIPTION_ID")
-        self.tenant_id = os.getenv("AZURE_TENANT_ID")
-        
-        if not self.subscription_id:
-            logger.warning(
-                "Azure subscription ID not found. Set AZURE_SUBSCRIPTION_ID environment variable "
-                "or pass subscription_id parameter."
-            )
-        
-        if not self.tenant_id:
-            logger.warning(
-                "Azure tenant ID not found. Set AZURE_TENANT_ID environment variable."
-            )
-        
-        # Initialize Azure clients would go here (when Azure SDK is available)
-        # For now, we provide security recommendations based on best practices
-        self.azure_clients = {}
-        
-        # Initialize Gemini LLM for security analysis
-        self.api_key = google_api_key or os.getenv("GOOGLE_API_KEY")
-        if self.api_key:
-            self.llm = ChatGoogleGenerativeAI(
-                model="gemini-2.5-flash",
-                temperature=0.2,
-                google_api_key=self.api_key
-            )
-        else:
-            self.llm = None
-            logger.warning("Google API key not found. LLM features will be disabled.")
-    
-    def process_command(self, user_input: str) -> str:
-        """
-        Process a user command and provide security analysis.
-        
-        Args:
-            user_input: User's natural language query or command
-            
-        Returns:
-            Analysis and recommendations as a formatted string
-        """
-        # Check for full audit request
-        if "full audit" in user_input.lower() or "perform a full audit" in user_input.lower():
-            try:
-                with console.status("Running comprehensive Azure audit (this may take a few minutes)..."):
-                    audit_result = self.perform_full_audit(export_pdf=True)
-                
-                response = f"✅ Azure Audit Complete!\n\n"
-                response += f"Subscription ID: {audit_result['subscription_id']}\n"
-                response += f"PDF Report: {audit_result['pdf_path']}\n"
-                
-                return response
-            except Exception as e:
-                error = f"❌ Error performing audit: {str(e)}"
-                console.print(f"[red]{error}[/red]")
-                return error
-        
-        # Map natural language to specific security checks
-        commands = self._parse_command(user_input)
-        
-        results = []
-        for command_type, params in commands:
-            if command_type == "iam_analysis":
-                result = self.analyze_entra_id_security(**params)
-            elif command_type == "storage_analysis":
-                result = self.analyze_storage_security(**params)
-            elif command_type == "compute_analysis":
-                result = self.analyze_compute_security(**params)
-            elif command_type == "database_analysis":
-                result = self.analyze_database_security(**params)
-            elif command_type == "network_analysis":
-                result = self.analyze_network_security(**params)
-            else:
-                result = self._get_llm_response(user_input)
-            
-            results.append(result)
-        
-        return "\n\n".join(results)
-    
-    def _parse_command(self, user_input: str) -> List[tuple]:
-        """
-        Parse user input and map to security analysis commands.
-        
-        Args:
-            user_input: User's query
-            
-        Returns:
-            List of (command_type, params) tuples
-        """
-        user_lower = user_input.lower()
-        commands = []
-        
-        # Map keywords to analysis types
-        if any(kw in user_lower for kw in ["entra", "azure ad", "identity", "iam", "rbac", "user", "role", "principal"]):
-            commands.append(("iam_analysis", {}))
-        
-        if any(kw in user_lower for kw in ["storage", "blob", "file share", "data", "backup"]):
-            commands.append(("storage_analysis", {}))
-        
-        if any(kw in user_lower for kw in ["vm", "virtual machine", "compute", "instance", "app service"]):
-            commands.append(("compute_analysis", {}))
-        
-        if any(kw in user_lower for kw in ["database", "sql", "cosmos", "postgres", "mysql", "sql server"]):
-            commands.append(("database_analysis", {}))
-        
-        if any(kw in user_lower for kw in ["network", "vnet", "nsg", "firewall", "security group", "routing"]):
-            commands.append(("network_analysis", {}))
-        
-        # If no specific commands matched, return general LLM response
-        if not commands:
-            commands.append(("llm_response", {}))
-        
-        return commands
-    
-    def perform_full_audit(self, export_pdf: bool = True) -> Dict[str, Any]:
-        """
-        Perform a comprehensive full audit of Azure infrastructure.
-        Covers VMs, Storage, Databases, Networking, and Entra ID.
-        
-        Args:
-            export_pdf: Whether to export results as PDF
-            
-        Returns:
-            Audit report dictionary with results and PDF path
-        """
-        console.print("[bold cyan]Starting Comprehensive Azure Audit...[/bold cyan]\n")
-        
-        # Create audit report
-        audit_report = AzureAuditReport(self.subscription_id)
-        
-        # 1. Entra ID (Azure AD) Security Analysis
-        console.print("[yellow]Analyzing Entra ID Security...[/yellow]")
-        entra_analysis = self._audit_entra_id_security()
-        audit_report.add_iam_analysis(entra_analysis)
-        
-        # 2. Storage Account Security Analysis
-        console.print("[yellow]Analyzing Storage Account Security...[/yellow]")
-        storage_analysis = self._audit_storage_security()
-        audit_report.add_storage_analysis(storage_analysis)
-        
-        # 3. Virtual Machines & Compute Security Analysis
-        console.print("[yellow]Analyzing Virtual Machines & Compute Security...[/yellow]")
-        compute_analysis = self._audit_compute_security()
-        audit_report.add_compute_analysis(compute_analysis)
-        
-        # 4. SQL Databases & Data Security Analysis
-        console.print("[yellow]Analyzing Database Security...[/yellow]")
-        database_analysis = self._audit_database_security()
-        audit_report.add_database_analysis(database_analysis)
-        
-        # 5. Network Security (vNets, NSGs, Firewalls)
-        console.print("[yellow]Analyzing Network Security...[/yellow]")
-        network_analysis = self._audit_network_security()
-        audit_report.add_network_analysis(network_analysis)
-        
-        console.print()
-        
-        # Display summary
-        audit_report.display_summary()
-        
-        # Generate PDF if requested
-        pdf_path = None
-        if export_pdf:
-            console.print("\n[cyan]Generating PDF report...[/cyan]")
-            pdf_path = audit_report.generate_pdf()
-        
-        return {
-            "subscription_id": self.subscription_id,
-            "report": audit_report,
-            "pdf_path": pdf_path,
-            "summary": audit_report.summary_data
-        }
+@lru_cache(maxsize=None)
+def _env(name: str, default: Optional[str] = None) -> Optional[str]:
+    """Resolve an environment variable once per process."""
+    return os.environ.get(name, default)
+
+
+# Gemini, Rich, the exporters and the audit generator are imported on first
+# use so that importing or constructing the agent stays cheap.
+@lru_cache(maxsize=1)
+def _console():
+    """Return the shared Rich console, creating it on first use."""
+    from rich.console import Console
+    return Console()
+
+
+def _print_panel(message: str) -> None:
+    """Print a message inside a Rich panel, or as a plain line when not on a terminal."""
+    console = _console()
+    if not console.is_terminal:
+        console.print(message)
+        return
     
-    def _audit_entra_id_security(self) -> Dict[str, Any]:
-        """Audit Entra ID (Azure AD) security"""
-        findings = []
-        
-        findings.append({
+    from rich.panel import Panel
+    console.print(Panel(message))
+
+
+def _status(console, message: str):
+    """Show a spinner while work runs, skipped when output is not a terminal."""
+    if not console.is_terminal:
+        return contextlib.nullcontext()
+    return console.status(message)
+
+
+# Static best-practice findings for each audit section. The audit methods
+# return deep copies so a report that edits its findings can't change
+# later audits.
+# Entra ID (Azure AD) security findings
+_ENTRA_ID_REPORT = {
+    "description": "This section analyzes Entra ID (Azure AD) security, including user management, roles, MFA, and conditional access.",
+    "findings": [
+        {
             "severity": "High",
             "title": "Enable Multi-Factor Authentication (MFA)",
             "description": "MFA should be required for all users, especially administrators.",
             "recommendation": "Enforce MFA through Conditional Access policies for all users."
-        })
-        
-        findings.append({
+        },
+        {
             "severity": "High",
             "title": "Review Privileged Access Management (PAM)",
             "description": "Privileged accounts need heightened security controls.",
             "recommendation": "Use Azure AD Privileged Identity Management (PIM) for just-in-time access."
-        })
-        
-        findings.append({
+        },
+        {
             "severity": "Medium",
             "title": "Enable Sign-in Risk Detection",
             "description": "Detect and respond to risky sign-in attempts.",
             "recommendation": "Enable Azure AD Identity Protection to monitor risky sign-ins and user risks."
-        })
-        
-        findings.append({
+        },
+        {
             "severity": "Medium",
             "title": "Review Application Permissions",
             "description": "Third-party applications should have minimal permissions.",
             "recommendation": "Audit and restrict permissions granted to applications in Entra ID."
-        })
-        
-        findings.append({
+        },
+        {
             "severity": "Low",
             "title": "Monitor Admin Role Assignments",
             "description": "Track who has administrative privileges.",
             "recommendation": "Regularly review Azure AD role assignments and remove unnecessary admins."
-        })
-        
-        return {
-            "description": "This section analyzes Entra ID (Azure AD) security, including user management, roles, MFA, and conditional access.",
-            "findings": findings,
-            "summary": [
-                "Enable MFA for all users",
-                "Use Privileged Identity Management (PIM)",
-                "Enable Identity Protection",
-                "Review and restrict application permissions",
-                "Monitor administrative role assignments"
-            ]
         }
-    
-    def _audit_storage_security(self) -> Dict[str, Any]:
-        """Audit Azure Storage security"""
-        findings = []
-        
-        findings.append({
+    ],
+    "summary": [
+        "Enable MFA for all users",
+        "Use Privileged Identity Management (PIM)",
+        "Enable Identity Protection",
+        "Review and restrict application permissions",
+        "Monitor administrative role assignments"
+    ]
+}
+
+# Azure Storage security findings
+_STORAGE_REPORT = {
+    "description": "This section analyzes Azure Storage security, including access controls, encryption, and monitoring.",
+    "findings": [
+        {
             "severity": "High",
             "title": "Enforce HTTPS Only",
             "description": "All storage accounts should require HTTPS for data in transit.",
             "recommendation": "Set 'Secure transfer required' to enabled on all storage accounts."
-        })
-        
-        findings.append({
+        },
+        {
             "severity": "High",
             "title": "Enable Storage Encryption",
             "description": "Data at rest should be encrypted.",
             "recommendation": "Enable Storage Service Encryption (SSE) and use customer-managed keys (CMK) for sensitive data."
-        })
-        
-        findings.append({
+        },
+        {
             "severity": "High",
             "title": "Restrict Public Access",
             "description": "Storage accounts should not allow anonymous public access by default.",
             "recommendation": "Disable 'Allow Blob public access' and configure proper access controls."
-        })
-        
-        findings.append({
+        },
+        {
             "severity": "Medium",
             "title": "Enable Storage Firewalls",
             "description": "Restrict storage account access to specific networks.",
             "recommendation": "Configure storage account firewalls and virtual network service endpoints."
-        })
-        
-        findings.append({
+        },
+        {
             "severity": "Medium",
             "title": "Enable Storage Logging & Monitoring",
             "description": "Monitor access and changes to storage accounts.",
             "recommendation": "Enable Azure Storage logging and integrate with Azure Monitor/Log Analytics."
-        })
-        
-        findings.append({
+        },
+        {
             "severity": "Low",
             "title": "Implement Blob Versioning",
             "description": "Protect against accidental deletion or modification.",
             "recommendation": "Enable blob versioning and soft delete policies on all containers."
-        })
-        
-        return {
-            "description": "This section analyzes Azure Storage security, including access controls, encryption, and monitoring.",
-            "findings": findings,
-            "summary": [
-                "Enforce HTTPS-only connections",
-                "Enable encryption at rest with CMK",
-                "Disable public blob access",
-                "Configure storage firewalls",
-                "Enable comprehensive logging and monitoring",
-                "Implement versioning and soft delete"
-            ]
         }
-    
-    def _audit_compute_security(self) -> Dict[str, Any]:
-        """Audit Azure Virtual Machines & Compute security"""
-        findings = []
-        
-        findings.append({
+    ],
+    "summary": [
+        "Enforce HTTPS-only connections",
+        "Enable encryption at rest with CMK",
+        "Disable public blob access",
+        "Configure storage firewalls",
+        "Enable comprehensive logging and monitoring",
+        "Implement versioning and soft delete"
+    ]
+}
+
+# Azure Virtual Machines & Compute security findings
+_COMPUTE_REPORT = {
+    "description": "This section analyzes Azure Virtual Machines security, including encryption, access controls, and patching.",
+    "findings": [
+        {
             "severity": "High",
             "title": "Enable Disk Encryption",
             "description": "Virtual machine disks should be encrypted at rest.",
             "recommendation": "Enable Azure Disk Encryption or enable encryption at host for all VMs."
-        })
-        
-        findings.append({
+        },
+        {
             "severity": "High",
             "title": "Enable Just-In-Time (JIT) VM Access",
             "description": "Limit RDP/SSH access to specific times and IP addresses.",
             "recommendation": "Enable Azure Security Center Just-in-Time VM access controls."
-        })
-        
-        findings.append({
+        },
+        {
             "severity": "High",
             "title": "Use Managed Identities",
             "description": "VMs should use managed identities instead of storing credentials.",
             "recommendation": "Assign managed identities to all VMs and use them for Azure resource access."
-        })
-        
-        findings.append({
+        },
+        {
             "severity": "Medium",
             "title": "Restrict Network Access",
             "description": "Virtual machines should be protected by Network Security Groups (NSGs).",
             "recommendation": "Apply NSGs to all VMs and restrict inbound rules to necessary ports only."
-        })
-        
-        findings.append({
+        },
+        {
             "severity": "Medium",
             "title": "Enable Operating System Updates",
             "description": "Keep OS and applications patched and up-to-date.",
             "recommendation": "Enable automatic OS patching through Azure Update Management."
-        })
-        
-        findings.append({
+        },
+        {
             "severity": "Medium",
             "title": "Enable Antimalware Protection",
             "description": "Protect VMs from malware and threats.",
             "recommendation": "Install and enable Microsoft Antimalware or third-party antivirus on all VMs."
-        })
-        
-        findings.append({
+        },
+        {
             "severity": "Low",
             "title": "Enable Azure Monitor & Logging",
             "description": "Monitor VM health and security.",
             "recommendation": "Enable Azure Monitor, Azure Diagnostics, and log forwarding to Log Analytics."
-        })
-        
-        return {
-            "description": "This section analyzes Azure Virtual Machines security, including encryption, access controls, and patching.",
-            "findings": findings,
-            "summary": [
-                "Enable disk encryption (ADE/encryption at host)",
-                "Implement Just-in-Time VM access",
-                "Use managed identities for authentication",
-                "Apply Network Security Groups",
-                "Enable OS patching and updates",
-                "Enable antimalware protection",
-                "Enable comprehensive monitoring"
-            ]
         }
-    
-    def _audit_database_security(self) -> Dict[str, Any]:
-        """Audit Azure Database security"""
-        findings = []
-        
-        findings.append({
+    ],
+    "summary": [
+        "Enable disk encryption (ADE/encryption at host)",
+        "Implement Just-in-Time VM access",
+        "Use managed identities for authentication",
+        "Apply Network Security Groups",
+        "Enable OS patching and updates",
+        "Enable antimalware protection",
+        "Enable comprehensive monitoring"
+    ]
+}
+
+# Azure Database security findings
+_DATABASE_REPORT = {
+    "description": "This section analyzes Azure Database security, including encryption, access controls, and threat detection.",
+    "findings": [
+        {
             "severity": "High",
             "title": "Enable Database Encryption",
             "description": "Databases should be encrypted at rest.",
             "recommendation": "Enable Transparent Data Encryption (TDE) for SQL databases."
-        })
-        
-        findings.append({
+        },
+        {
             "severity": "High",
             "title": "Configure Firewall Rules",
             "description": "Database servers should restrict access to specific IPs/networks.",
             "recommendation": "Configure firewall rules and use private endpoints for databases."
-        })
-        
-        findings.append({
+        },
+        {
             "severity": "High",
             "title": "Enable SQL Advanced Threat Protection",
             "description": "Detect and respond to database threats.",
             "recommendation": "Enable Azure Defender for SQL to detect suspicious activities."
-        })
-        
-        findings.append({
+        },
+        {
             "severity": "Medium",
             "title": "Audit Database Access",
             "description": "Track who accesses databases and what changes are made.",
             "recommendation": "Enable SQL Server Auditing or Azure SQL Auditing."
-        })
-        
-        findings.append({
+        },
+        {
             "severity": "Medium",
             "title": "Use Azure AD Authentication",
             "description": "Use Entra ID for database authentication instead of SQL logins.",
             "recommendation": "Configure Azure AD authentication for SQL databases."
-        })
-        
-        findings.append({
+        },
+        {
             "severity": "Medium",
             "title": "Enable Backup & Restore",
             "description": "Ensure databases can be recovered from failures.",
             "recommendation": "Configure automatic backups with appropriate retention policies."
-        })
-        
-        return {
-            "description": "This section analyzes Azure Database security, including encryption, access controls, and threat detection.",
-            "findings": findings,
-            "summary": [
-                "Enable Transparent Data Encryption (TDE)",
-                "Configure restrictive firewall rules",
-                "Use private endpoints for databases",
-                "Enable Azure Defender for SQL",
-                "Implement SQL auditing",
-                "Use Entra ID authentication",
-                "Configure automatic backups"
-            ]
         }
-    
-    def _audit_network_security(self) -> Dict[str, Any]:
-        """Audit Azure Network security"""
-        findings = []
-        
-        findings.append({
+    ],
+    "summary": [
+        "Enable Transparent Data Encryption (TDE)",
+        "Configure restrictive firewall rules",
+        "Use private endpoints for databases",
+        "Enable Azure Defender for SQL",
+        "Implement SQL auditing",
+        "Use Entra ID authentication",
+        "Configure automatic backups"
+    ]
+}
+
+# Azure Network security findings
+_NETWORK_REPORT = {
+    "description": "This section analyzes Azure Network security, including VNets, NSGs, firewalls, and monitoring.",
+    "findings": [
+        {
             "severity": "High",
             "title": "Implement Network Segmentation",
             "description": "Use subnets and NSGs to segment network traffic.",
             "recommendation": "Create separate subnets for different workloads and apply NSGs with least privilege rules."
-        })
-        
-        findings.append({
+        },
+        {
             "severity": "High",
             "title": "Use Azure Firewall",
             "description": "Central firewall for network filtering and threat protection.",
             "recommendation": "Deploy Azure Firewall for centralized network protection and logging."
-        })
-        
-        findings.append({
+        },
+        {
             "severity": "High",
             "title": "Enable DDoS Protection",
             "description": "Protect against Distributed Denial of Service attacks.",
             "recommendation": "Enable Azure DDoS Protection Standard on critical resources."
-        })
-        
-        findings.append({
+        },
+        {
             "severity": "Medium",
             "title": "Use VPN Gateway for Remote Access",
             "description": "Secure remote access to Azure resources.",
             "recommendation": "Configure Azure VPN Gateway with Point-to-Site or Site-to-Site VPN."
-        })
-        
-        findings.append({
+        },
+        {
             "severity": "Medium",
             "title": "Enable Network Watcher",
             "description": "Monitor network traffic and diagnose issues.",
             "recommendation": "Enable Network Watcher and configure NSG flow logs."
-        })
-        
-        findings.append({
+        },
+        {
             "severity": "Medium",
             "title": "Use Private Link/Endpoints",
             "description": "Access Azure services privately without internet exposure.",
             "recommendation": "Use Azure Private Link and Private Endpoints for internal access."
-        })
-        
-        return {
-            "description": "This section analyzes Azure Network security, including VNets, NSGs, firewalls, and monitoring.",
-            "findings": findings,
-            "summary": [
-                "Implement network segmentation with subnets and NSGs",
-                "Deploy Azure Firewall for centralized control",
-                "Enable DDoS Protection Standard",
-                "Configure VPN for remote access",
-                "Enable Network Watcher and NSG flow logs",
-                "Use Private Link for internal connectivity",
-                "Regular firewall rule audits"
-            ]
         }
+    ],
+    "summary": [
+        "Implement network segmentation with subnets and NSGs",
+        "Deploy Azure Firewall for centralized control",
+        "Enable DDoS Protection Standard",
+        "Configure VPN for remote access",
+        "Enable Network Watcher and NSG flow logs",
+        "Use Private Link for internal connectivity",
+        "Regular firewall rule audits"
+    ]
+}
+
+
+def _render_analysis(heading: str, report: Dict[str, Any]) -> str:
+    """Render an audit section as the text returned by the analyze_* methods."""
+    lines = [
+        f"[{finding.get('severity', 'Unknown')}] {finding.get('title', 'Untitled')}\n"
+        for finding in report['findings']
+    ]
+    return f"[bold cyan]{heading}[/bold cyan]\n\n{report['description']}\n\n" + "".join(lines)
+
+
+# Analysis sections: key -> (progress message, rendered analysis). The
+# findings are static, so each analysis is rendered once at import.
+_ANALYSIS_SECTIONS = {
+    "entra_id": (
+        "[bold blue]Analyzing Entra ID Security...[/bold blue]",
+        _render_analysis("Entra ID Security Analysis", _ENTRA_ID_REPORT)
+    ),
+    "storage": (
+        "[bold blue]Analyzing Azure Storage Security...[/bold blue]",
+        _render_analysis("Azure Storage Security Analysis", _STORAGE_REPORT)
+    ),
+    "compute": (
+        "[bold blue]Analyzing Azure Compute Security...[/bold blue]",
+        _render_analysis("Azure Compute Security Analysis", _COMPUTE_REPORT)
+    ),
+    "database": (
+        "[bold blue]Analyzing Azure Database Security...[/bold blue]",
+        _render_analysis("Azure Database Security Analysis", _DATABASE_REPORT)
+    ),
+    "network": (
+        "[bold blue]Analyzing Azure Network Security...[/bold blue]",
+        _render_analysis("Azure Network Security Analysis", _NETWORK_REPORT)
+    ),
+}
+
+# Parsed command types answered by a built-in analysis section
+_COMMAND_SECTIONS = {
+    "iam_analysis": "entra_id",
+    "storage_analysis": "storage",
+    "compute_analysis": "compute",
+    "database_analysis": "database",
+    "network_analysis": "network",
+}
+
+
+@lru_cache(maxsize=None)
+def _get_exporter(format: str):
+    """
+    Return the exporter for a format, importing it on first use.
     
-    def analyze_entra_id_security(self, check_type: str = "overview") -> str:
+    Exporters are stateless, so one instance per format is shared by all calls.
+    """
+    if format == "json":
+        from src.audit.exporters.json_exporter import JSONExporter
+        return JSONExporter()
+    if format == "csv":
+        from src.audit.exporters.csv_exporter import CSVExporter
+        return CSVExporter()
+    if format == "html":
+        from src.audit.exporters.html_exporter import HTMLExporter
+        return HTMLExporter()
+    raise ValueError(f"Unknown format: {format}")
+
+
+# Each format maps to (label, default output path, export function)
+_EXPORT_HANDLERS = {
+    "json": (
+        "JSON",
+        "reports/azure_report_{}.json",
+        lambda findings, path: _get_exporter("json").export_report(findings, path)
+    ),
+    "csv": (
+        "CSV",
+        "reports/azure_findings_{}.csv",
+        lambda findings, path: _get_exporter("csv").export_findings_to_csv(findings.get("findings", []), path)
+    ),
+    "html": (
+        "HTML",
+        "reports/azure_report_{}.html",
+        lambda findings, path: _get_exporter("html").export_email_template(findings, path)
+    ),
+}
+
+_DEFAULT_AZURE_PLAYBOOK = "AZURE-BLOB-PUBLIC"
+
+
+@lru_cache(maxsize=None)
+def _get_azure_playbooks() -> Dict[str, Any]:
+    """
+    Index the Azure remediation playbooks by name, built once per process.
+    
+    Playbooks are only read during execution, so they can be shared.
+    """
+    return {
+        name: playbook for name, playbook in PlaybookLibrary.get_all_playbooks().items()
+        if name.startswith("AZURE")
+    }
+
+
+# System prompt for general Azure security questions sent to Gemini
+_LLM_SYSTEM_PROMPT = """
+        You are an expert Microsoft Azure security advisor.
+        Provide concise, actionable security recommendations for Azure resources.
+        Focus on Entra ID, Storage, Compute, Databases, and Networking security.
+        """
+
+
+@lru_cache(maxsize=1)
+def _get_system_message():
+    """Build the (immutable) system message once and reuse it for every request."""
+    from langchain_core.messages import SystemMessage
+    return SystemMessage(content=_LLM_SYSTEM_PROMPT)
+
+
+# Input budget for gemini-2.5-flash; checked locally before any API call
+_LLM_MAX_INPUT_TOKENS = 1_000_000
+
+# Successful Gemini answers, keyed by a hash of the prompt, reused for 5 minutes
+_LLM_RESPONSE_CACHE = TTLCache(maxsize=1024, ttl=300)
+
+
+def _llm_cache_key(user_input: str) -> str:
+    """Cache key for a general security question."""
+    return hash_key(_LLM_SYSTEM_PROMPT, user_input)
+
+
+@lru_cache(maxsize=None)
+def _get_shared_llm(api_key: str):
+    """
+    Return the Gemini client for an API key, creating it once per process.
+    
+    Agents share the client, and with it the underlying connection pool,
+    instead of each opening new connections. The client is safe to use
+    from multiple threads.
+    """
+    from langchain_google_genai import ChatGoogleGenerativeAI
+    
+    return ChatGoogleGenerativeAI(
+        model="gemini-2.5-flash",
+        temperature=0.2,
+        google_api_key=api_key
+    )
+
+
+# Keywords that map a user query to each analysis type, in dispatch order
+_COMMAND_KEYWORDS = (
+    ("iam_analysis", ("entra", "azure ad", "identity", "iam", "rbac", "user", "role", "principal")),
+    ("storage_analysis", ("storage", "blob", "file share", "data", "backup")),
+    ("compute_analysis", ("vm", "virtual machine", "compute", "instance", "app service")),
+    ("database_analysis", ("database", "sql", "cosmos", "postgres", "postgresql", "mysql", "sql server")),
+    ("network_analysis", ("network", "networking", "vnet", "nsg", "firewall", "security group", "routing")),
+)
+
+# Keyword sets for whole-word lookup; multi-word keywords match word pairs
+_COMMAND_KEYWORD_SETS = tuple(
+    (command_type, frozenset(keywords)) for command_type, keywords in _COMMAND_KEYWORDS
+)
+
+_WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def _singular(word: str) -> str:
+    """Strip a plural ending from a word ("identities" -> "identity", "vms" -> "vm")."""
+    if word.endswith("ies") and len(word) > 4:
+        return word[:-3] + "y"
+    if word.endswith("s") and not word.endswith("ss") and len(word) > 2:
+        return word[:-1]
+    return word
+
+
+def _query_terms(user_lower: str) -> set:
+    """
+    Split a lowercased query into words and adjacent word pairs.
+    
+    Plurals are also reduced to their singular form ("vms", "file shares",
+    "identities") so they match singular keywords.
+    """
+    words = _WORD_PATTERN.findall(user_lower)
+    singular = [_singular(word) for word in words]
+    terms = set(words)
+    terms.update(singular)
+    for first, second, second_singular in zip(words, words[1:], singular[1:]):
+        terms.add(f"{first} {second}")
+        terms.add(f"{first} {second_singular}")
+    return terms
+
+
+@lru_cache(maxsize=512)
+def _classify_command(user_lower: str) -> tuple:
+    """
+    Map a lowercased query to the analysis types it mentions.
+    
+    Keywords are matched as whole words first. When none match, keywords
+    inside longer words ("networking", "postgresql") are accepted as
+    before, and only then does it fall back to ("llm_response",). Results
+    are cached since interactive sessions repeat the same queries.
+    """
+    terms = _query_terms(user_lower)
+    matched = tuple(
+        command_type for command_type, keywords in _COMMAND_KEYWORD_SETS
+        if not terms.isdisjoint(keywords)
+    )
+    if not matched:
+        matched = tuple(
+            command_type for command_type, keywords in _COMMAND_KEYWORDS
+            if any(keyword in user_lower for keyword in keywords)
+        )
+    return matched or ("llm_response",)
+
+
+class AzureSecurityAgent:
+    """
+    An agent for assessing and analyzing security in Microsoft Azure.
+    Supports Entra ID (formerly Azure AD), Storage, Compute, SQL, and Networking security checks.
+    """
+    
+    def __init__(self, subscription_id: Optional[str] = None, google_api_key: Optional[str] = None):
         """
-        Analyze Entra ID (Azure AD) security configuration.
+        Initialize the Azure Security Agent.
         
         Args:
-            check_type: Type of analysis
+            subscription_id: Azure subscription ID (defaults to environment variable)
+            google_api_key: Google API key for Gemini LLM
+        """
+        self.subscription_id = subscription_id or _env("AZURE_SUBSCRIPTION_ID")
+        self.tenant_id = _env("AZURE_TENANT_ID")
+        
+        if not self.subscription_id:
+            logger.warning(
+                "Azure subscription ID not found. Set AZURE_SUBSCRIPTION_ID environment variable "
+                "or pass subscription_id parameter."
+            )
+        
+        if not self.tenant_id:
+            logger.warning(
+                "Azure tenant ID not found. Set AZURE_TENANT_ID environment variable."
+            )
+        
+        # Initialize Azure clients would go here (when Azure SDK is available)
+        # For now, we provide security recommendations based on best practices
+        self.azure_clients = {}
+        
+        # Initialize Gemini LLM for security analysis
+        self.api_key = google_api_key or _env("GOOGLE_API_KEY")
+        if self.api_key:
+            self.llm = _get_shared_llm(self.api_key)
+        else:
+            self.llm = None
+            logger.warning("Google API key not found. LLM features will be disabled.")
+    
+    def process_command(self, user_input: str, stream: bool = False) -> str:
+        """
+        Process a user command and provide security analysis.
+        
+        Args:
+            user_input: User's natural language query or command
+            stream: Print LLM answers to the terminal as they are generated
+                (only when stdout is a TTY)
             
         Returns:
-            Analysis as formatted string
+            Analysis and recommendations as a formatted string
+        """
+        # Check for full audit request
+        if "full audit" in user_input.lower() or "perform a full audit" in user_input.lower():
+            console = _console()
+            try:
+                with _status(console, "Running comprehensive Azure audit (this may take a few minutes)..."):
+                    audit_result = self.perform_full_audit(export_pdf=True)
+                
+                return "".join([
+                    "✅ Azure Audit Complete!\n\n",
+                    f"Subscription ID: {audit_result['subscription_id']}\n",
+                    f"PDF Report: {audit_result['pdf_path']}\n",
+                ])
+            except Exception as e:
+                error = f"❌ Error performing audit: {str(e)}"
+                console.print(f"[red]{error}[/red]")
+                return error
+        
+        # Map natural language to specific security checks
+        commands = self._parse_command(user_input)
+        
+        results = []
+        for command_type, params in commands:
+            section = _COMMAND_SECTIONS.get(command_type)
+            if section is not None:
+                result = self.analyze(section, **params)
+            elif stream and sys.stdout.isatty():
+                result = self._get_llm_response_streaming(user_input)
+            else:
+                result = self._get_llm_response(user_input)
+            
+            results.append(result)
+        
+        return "\n\n".join(results)
+    
+    async def process_command_async(self, user_input: str) -> str:
         """
-        console.print(Panel("[bold blue]Analyzing Entra ID Security...[/bold blue]"))
+        Async variant of process_command.
         
-        analysis = self._audit_entra_id_security()
+        The Gemini call is awaited with ainvoke and the full audit runs in a
+        worker thread, so several queries can be processed concurrently with
+        asyncio.gather without blocking the event loop on network I/O.
         
-        result = f"[bold cyan]Entra ID Security Analysis[/bold cyan]\n\n"
-        result += f"{analysis['description']}\n\n"
+        Args:
+            user_input: User's natural language query or command
+            
+        Returns:
+            Analysis and recommendations as a formatted string
+        """
+        if "full audit" in user_input.lower():
+            return await asyncio.to_thread(self.process_command, user_input)
         
-        for finding in analysis['findings']:
-            severity = finding.get('severity', 'Unknown')
-            title = finding.get('title', 'Untitled')
-            result += f"[{severity}] {title}\n"
+        if self.is_general_question(user_input):
+            return await self._get_llm_response_async(user_input)
         
-        return result
+        # Built-in analyses are local and cheap
+        return self.process_command(user_input)
     
-    def analyze_storage_security(self, check_type: str = "overview") -> str:
-        """Analyze Azure Storage security"""
-        console.print(Panel("[bold blue]Analyzing Azure Storage Security...[/bold blue]"))
+    def process_commands(self, user_inputs: List[str]) -> List[str]:
+        """
+        Process several user commands, sending the ones that need the LLM together.
         
-        analysis = self._audit_storage_security()
+        Queries that map to a built-in analysis are answered as in
+        process_command; the remaining general questions go through
+        llm.batch, which still makes one Gemini request per question but
+        runs them concurrently instead of one after another.
         
-        result = f"[bold cyan]Azure Storage Security Analysis[/bold cyan]\n\n"
-        result += f"{analysis['description']}\n\n"
+        Args:
+            user_inputs: User queries or commands
+            
+        Returns:
+            Responses, in the same order as user_inputs
+        """
+        results: List[Optional[str]] = []
+        llm_indexes = []
+        for user_input in user_inputs:
+            if self.is_general_question(user_input):
+                llm_indexes.append(len(results))
+                results.append(None)
+            else:
+                results.append(self.process_command(user_input))
         
-        for finding in analysis['findings']:
-            severity = finding.get('severity', 'Unknown')
-            title = finding.get('title', 'Untitled')
-            result += f"[{severity}] {title}\n"
+        if llm_indexes:
+            llm_results = self._get_llm_responses([user_inputs[i] for i in llm_indexes])
+            for i, result in zip(llm_indexes, llm_results):
+                results[i] = result
         
-        return result
+        return results
     
-    def analyze_compute_security(self, check_type: str = "overview") -> str:
-        """Analyze Azure Compute security"""
-        console.print(Panel("[bold blue]Analyzing Azure Compute Security...[/bold blue]"))
+    def is_general_question(self, user_input: str) -> bool:
+        """
+        Check whether a query is answered by the LLM rather than a built-in analysis.
+        
+        Args:
+            user_input: User's query
+            
+        Returns:
+            True if process_command would send the query to Gemini
+        """
+        user_lower = user_input.lower()
+        return "full audit" not in user_lower and _classify_command(user_lower) == ("llm_response",)
+    
+    def _parse_command(self, user_input: str) -> List[tuple]:
+        """
+        Parse user input and map to security analysis commands.
+        
+        Args:
+            user_input: User's query
+            
+        Returns:
+            List of (command_type, params) tuples
+        """
+        return [(command_type, {}) for command_type in _classify_command(user_input.lower())]
+    
+    def perform_full_audit(self, export_pdf: bool = True) -> Dict[str, Any]:
+        """
+        Perform a comprehensive full audit of Azure infrastructure.
+        Covers VMs, Storage, Databases, Networking, and Entra ID.
         
-        analysis = self._audit_compute_security()
+        Args:
+            export_pdf: Whether to export results as PDF
+            
+        Returns:
+            Audit report dictionary with results and PDF path
+        """
+        from src.audit import AzureAuditReport
+        
+        console = _console()
+        console.print("[bold cyan]Starting Comprehensive Azure Audit...[/bold cyan]\n")
+        
+        # Create audit report
+        audit_report = AzureAuditReport(self.subscription_id)
         
-        result = f"[bold cyan]Azure Compute Security Analysis[/bold cyan]\n\n"
-        result += f"{analysis['description']}\n\n"
+        # Section audits are independent, so run them concurrently. Progress
+        # is reported as each finishes; the report (not thread-safe) is only
+        # updated from this thread, in the canonical section order.
+        sections = self._audit_sections(audit_report)
         
-        for finding in analysis['findings']:
-            severity = finding.get('severity', 'Unknown')
-            title = finding.get('title', 'Untitled')
-            result += f"[{severity}] {title}\n"
+        with ThreadPoolExecutor(max_workers=len(sections)) as executor:
+            futures = {}
+            for label, audit_section, _ in sections:
+                console.print(f"[yellow]Analyzing {label}...[/yellow]")
+                futures[executor.submit(audit_section)] = label
+            
+            for future in as_completed(futures):
+                console.print(f"[green]✓ {futures[future]} complete[/green]")
+            
+            for future, (_, _, add_analysis) in zip(futures, sections):
+                add_analysis(future.result())
         
-        return result
+        return self._finish_audit(audit_report, export_pdf)
     
-    def analyze_database_security(self, check_type: str = "overview") -> str:
-        """Analyze Azure Database security"""
-        console.print(Panel("[bold blue]Analyzing Azure Database Security...[/bold blue]"))
+    async def perform_full_audit_async(self, export_pdf: bool = True) -> Dict[str, Any]:
+        """
+        Async variant of perform_full_audit.
+        
+        Section audits run concurrently in worker threads via asyncio.gather,
+        and PDF generation is awaited off the event loop.
         
-        analysis = self._audit_database_security()
+        Args:
+            export_pdf: Whether to export results as PDF
+            
+        Returns:
+            Audit report dictionary with results and PDF path
+        """
+        from src.audit import AzureAuditReport
         
-        result = f"[bold cyan]Azure Database Security Analysis[/bold cyan]\n\n"
-        result += f"{analysis['description']}\n\n"
+        console = _console()
+        console.print("[bold cyan]Starting Comprehensive Azure Audit...[/bold cyan]\n")
         
-        for finding in analysis['findings']:
-            severity = finding.get('severity', 'Unknown')
-            title = finding.get('title', 'Untitled')
-            result += f"[{severity}] {title}\n"
+        audit_report = AzureAuditReport(self.subscription_id)
+        sections = self._audit_sections(audit_report)
+        for label, _, _ in sections:
+            console.print(f"[yellow]Analyzing {label}...[/yellow]")
+        
+        # gather preserves order, so sections are added in canonical order
+        results = await asyncio.gather(
+            *(asyncio.to_thread(audit_section) for _, audit_section, _ in sections)
+        )
+        for (_, _, add_analysis), result in zip(sections, results):
+            add_analysis(result)
+        
+        return await asyncio.to_thread(self._finish_audit, audit_report, export_pdf)
+    
+    def _audit_sections(self, audit_report) -> List[tuple]:
+        """
+        List the audit sections in report order.
         
-        return result
+        Args:
+            audit_report: Report the section results are added to
+            
+        Returns:
+            List of (label, audit function, report add method) tuples
+        """
+        return [
+            # 1. Entra ID (Azure AD) Security Analysis
+            ("Entra ID Security", self._audit_entra_id_security, audit_report.add_iam_analysis),
+            # 2. Storage Account Security Analysis
+            ("Storage Account Security", self._audit_storage_security, audit_report.add_storage_analysis),
+            # 3. Virtual Machines & Compute Security Analysis
+            ("Virtual Machines & Compute Security", self._audit_compute_security, audit_report.add_compute_analysis),
+            # 4. SQL Databases & Data Security Analysis
+            ("Database Security", self._audit_database_security, audit_report.add_database_analysis),
+            # 5. Network Security (vNets, NSGs, Firewalls)
+            ("Network Security", self._audit_network_security, audit_report.add_network_analysis),
+        ]
     
-    def analyze_network_security(self, check_type: str = "overview") -> str:
-        """Analyze Azure Network security"""
-        console.print(Panel("[bold blue]Analyzing Azure Network Security...[/bold blue]"))
+    def _finish_audit(self, audit_report, export_pdf: bool) -> Dict[str, Any]:
+        """
+        Render the summary and optional PDF for a populated audit report.
         
-        analysis = self._audit_network_security()
+        Args:
+            audit_report: Report with all sections added
+            export_pdf: Whether to export results as PDF
+            
+        Returns:
+            Audit report dictionary with results and PDF path
+        """
+        console = _console()
+        console.print()
         
-        result = f"[bold cyan]Azure Network Security Analysis[/bold cyan]\n\n"
-        result += f"{analysis['description']}\n\n"
+        # Generate the PDF (if requested) in the background while the
+        # summary is rendered
+        pdf_path = None
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pdf_future = None
+            if export_pdf:
+                console.print("[cyan]Generating PDF report...[/cyan]\n")
+                pdf_future = executor.submit(audit_report.generate_pdf)
+            
+            # Display summary (the Rich table is only worth rendering on a terminal)
+            if console.is_terminal:
+                audit_report.display_summary()
+            else:
+                logger.info(f"Azure audit summary: {audit_report.summary_data}")
+            
+            if pdf_future is not None:
+                pdf_path = pdf_future.result()
+        
+        return {
+            "subscription_id": self.subscription_id,
+            "report": audit_report,
+            "pdf_path": pdf_path,
+            "summary": audit_report.summary_data
+        }
+    
+    def _audit_entra_id_security(self) -> Dict[str, Any]:
+        """Audit Entra ID (Azure AD) security"""
+        return copy.deepcopy(_ENTRA_ID_REPORT)
+    
+    def _audit_storage_security(self) -> Dict[str, Any]:
+        """Audit Azure Storage security"""
+        return copy.deepcopy(_STORAGE_REPORT)
+    
+    def _audit_compute_security(self) -> Dict[str, Any]:
+        """Audit Azure Virtual Machines & Compute security"""
+        return copy.deepcopy(_COMPUTE_REPORT)
+    
+    def _audit_database_security(self) -> Dict[str, Any]:
+        """Audit Azure Database security"""
+        return copy.deepcopy(_DATABASE_REPORT)
+    
+    def _audit_network_security(self) -> Dict[str, Any]:
+        """Audit Azure Network security"""
+        return copy.deepcopy(_NETWORK_REPORT)
+    
+    def analyze(self, section: str, check_type: str = "overview") -> str:
+        """
+        Analyze one Azure security section.
         
-        for finding in analysis['findings']:
-            severity = finding.get('severity', 'Unknown')
-            title = finding.get('title', 'Untitled')
-            result += f"[{severity}] {title}\n"
+        Args:
+            section: Section key ('entra_id', 'storage', 'compute', 'database', 'network')
+            check_type: Type of analysis
+            
+        Returns:
+            Analysis as formatted string
+        """
+        progress_message, analysis = _ANALYSIS_SECTIONS[section]
+        _print_panel(progress_message)
         
-        return result
+        return analysis
+    
+    def analyze_entra_id_security(self, check_type: str = "overview") -> str:
+        """Analyze Entra ID (Azure AD) security configuration."""
+        return self.analyze("entra_id", check_type)
+    
+    def analyze_storage_security(self, check_type: str = "overview") -> str:
+        """Analyze Azure Storage security"""
+        return self.analyze("storage", check_type)
+    
+    def analyze_compute_security(self, check_type: str = "overview") -> str:
+        """Analyze Azure Compute security"""
+        return self.analyze("compute", check_type)
+    
+    def analyze_database_security(self, check_type: str = "overview") -> str:
+        """Analyze Azure Database security"""
+        return self.analyze("database", check_type)
+    
+    def analyze_network_security(self, check_type: str = "overview") -> str:
+        """Analyze Azure Network security"""
+        return self.analyze("network", check_type)
     
     def export_report(self, findings: Dict[str, Any], format: str = "json", output_path: Optional[str] = None) -> str:
         """
@@ -613,30 +898,56 @@ class AzureSecurityAgent:
         Returns:
             Export status message
         """
+        handler = _EXPORT_HANDLERS.get(format)
+        if handler is None:
+            return f"❌ Unknown format: {format}"
+        
+        label, default_path, export = handler
         try:
-            if format == "json":
-                exporter = JSONExporter()
-                file_path = output_path or f"reports/azure_report_{self.subscription_id}.json"
-                exporter.export_report(findings, file_path)
-                return f"✅ JSON export successful: {file_path}"
-                
-            elif format == "csv":
-                exporter = CSVExporter()
-                file_path = output_path or f"reports/azure_findings_{self.subscription_id}.csv"
-                exporter.export_findings_to_csv(findings.get("findings", []), file_path)
-                return f"✅ CSV export successful: {file_path}"
-                
-            elif format == "html":
-                exporter = HTMLExporter()
-                file_path = output_path or f"reports/azure_report_{self.subscription_id}.html"
-                exporter.export_email_template(findings, file_path)
-                return f"✅ HTML export successful: {file_path}"
-                
-            else:
-                return f"❌ Unknown format: {format}"
+            file_path = output_path or default_path.format(self.subscription_id)
+            export(findings, file_path)
+            return f"✅ {label} export successful: {file_path}"
         except Exception as e:
             return f"❌ Export error: {str(e)}"
     
+    def export_all_formats(self, findings: Dict[str, Any], base_path: Optional[str] = None,
+                           audit_report: Optional[Any] = None) -> Dict[str, str]:
+        """
+        Export security findings to JSON, CSV and HTML (and PDF) concurrently.
+        
+        Args:
+            findings: Security findings dictionary
+            base_path: Output path without extension (defaults per format)
+            audit_report: Optional AzureAuditReport to also render as PDF
+        
+        Returns:
+            Dictionary mapping each format to its export status message
+        """
+        formats = list(_EXPORT_HANDLERS)
+        with ThreadPoolExecutor(max_workers=len(formats) + 1) as executor:
+            futures = {
+                fmt: executor.submit(
+                    self.export_report, findings, fmt,
+                    f"{base_path}.{fmt}" if base_path else None
+                )
+                for fmt in formats
+            }
+            if audit_report is not None:
+                futures["pdf"] = executor.submit(audit_report.generate_pdf)
+            
+            results = {}
+            for fmt, future in futures.items():
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = f"❌ Export error: {str(e)}"
+                else:
+                    if fmt == "pdf":
+                        result = f"✅ PDF export successful: {result}"
+                results[fmt] = result
+        
+        return results
+    
     def remediate_finding(self, finding_id: str, dry_run: bool = True) -> Dict[str, Any]:
         """
         Execute remediation playbook for a finding.
@@ -650,23 +961,16 @@ class AzureSecurityAgent:
         """
         try:
             executor = PlaybookExecutor()
-            playbooks = PlaybookLibrary.get_all_playbooks()
+            playbooks = _get_azure_playbooks()
             
-            # Find matching playbook
-            matching_playbook = None
-            for pb_name, pb in playbooks.items():
-                if "AZURE" in pb_name:
-                    matching_playbook = pb
-                    break
-            
-            if not matching_playbook:
-                matching_playbook = playbooks.get("AZURE-BLOB-PUBLIC")
+            # Use the playbook named by the finding, else the default one
+            matching_playbook = playbooks.get(finding_id) or playbooks[_DEFAULT_AZURE_PLAYBOOK]
             
             # Execute
             execution = executor.execute_playbook(
                 playbook=matching_playbook,
                 finding_data={"id": finding_id, "subscription": self.subscription_id},
-                initiated_by=os.getenv("USER", "system"),
+                initiated_by=_RUN_USER,
                 dry_run=dry_run
             )
             
@@ -683,26 +987,138 @@ class AzureSecurityAgent:
                 "error": str(e)
             }
     
+    def _build_llm_messages(self, user_input: str) -> list:
+        """Build the chat messages for a general security question."""
+        from langchain_core.messages import HumanMessage
+        
+        return [
+            _get_system_message(),
+            HumanMessage(content=user_input)
+        ]
+    
+    def _check_llm_budget(self, user_input: str) -> Optional[str]:
+        """Return an error message if the prompt exceeds the model's input budget."""
+        prompt_tokens = estimate_tokens(_LLM_SYSTEM_PROMPT) + estimate_tokens(user_input)
+        if prompt_tokens > _LLM_MAX_INPUT_TOKENS:
+            return (
+                f"Error getting response: question is too long "
+                f"(~{prompt_tokens} tokens, limit {_LLM_MAX_INPUT_TOKENS})"
+            )
+        return None
+    
     def _get_llm_response(self, user_input: str) -> str:
         """Get LLM response for general security questions."""
         if not self.llm:
             return "LLM service not available. Please check your Google API key."
         
-        system_prompt = """
-        You are an expert Microsoft Azure security advisor.
-        Provide concise, actionable security recommendations for Azure resources.
-        Focus on Entra ID, Storage, Compute, Databases, and Networking security.
-        """
+        try:
+            budget_error = self._check_llm_budget(user_input)
+            if budget_error:
+                return budget_error
+            
+            cache_key = _llm_cache_key(user_input)
+            cached = _LLM_RESPONSE_CACHE.get(cache_key)
+            if cached is not None:
+                return cached
+            
+            response = self.llm.invoke(self._build_llm_messages(user_input))
+            _LLM_RESPONSE_CACHE.set(cache_key, response.content)
+            return response.content
+        except Exception as e:
+            return f"Error getting response: {str(e)}"
+    
+    def _get_llm_response_streaming(self, user_input: str) -> str:
+        """Get LLM response for a general security question, printing tokens as they arrive."""
+        console = _console()
+        if not self.llm:
+            message = "LLM service not available. Please check your Google API key."
+            console.print(message, markup=False)
+            return message
+        
+        chunks = []
+        try:
+            budget_error = self._check_llm_budget(user_input)
+            if budget_error:
+                console.print(budget_error, markup=False)
+                return budget_error
+            
+            cache_key = _llm_cache_key(user_input)
+            cached = _LLM_RESPONSE_CACHE.get(cache_key)
+            if cached is not None:
+                console.print(cached, markup=False)
+                return cached
+            
+            for chunk in self.llm.stream(self._build_llm_messages(user_input)):
+                # Partial chunks may split markup tags, so print them verbatim
+                console.print(chunk.content, end="", markup=False, highlight=False)
+                chunks.append(chunk.content)
+            console.print()
+        except Exception as e:
+            message = f"Error getting response: {str(e)}"
+            console.print(f"\n{message}", markup=False)
+            return message
+        
+        response = "".join(chunks)
+        _LLM_RESPONSE_CACHE.set(cache_key, response)
+        return response
+    
+    async def _get_llm_response_async(self, user_input: str) -> str:
+        """Get LLM response for a general security question without blocking the event loop."""
+        if not self.llm:
+            return "LLM service not available. Please check your Google API key."
         
         try:
-            messages = [
-                SystemMessage(content=system_prompt),
-                HumanMessage(content=user_input)
-            ]
-            response = self.llm.invoke(messages)
+            budget_error = self._check_llm_budget(user_input)
+            if budget_error:
+                return budget_error
+            
+            cache_key = _llm_cache_key(user_input)
+            cached = _LLM_RESPONSE_CACHE.get(cache_key)
+            if cached is not None:
+                return cached
+            
+            response = await self.llm.ainvoke(self._build_llm_messages(user_input))
+            _LLM_RESPONSE_CACHE.set(cache_key, response.content)
             return response.content
         except Exception as e:
             return f"Error getting response: {str(e)}"
+    
+    def _get_llm_responses(self, user_inputs: List[str]) -> List[str]:
+        """
+        Get LLM responses for several general security questions.
+        
+        Cached answers are reused; the misses are sent with llm.batch, which
+        issues one request per question concurrently (not a single combined
+        request).
+        """
+        if not self.llm:
+            return ["LLM service not available. Please check your Google API key."] * len(user_inputs)
+        
+        cache_keys = [_llm_cache_key(user_input) for user_input in user_inputs]
+        results = [
+            self._check_llm_budget(user_input) or _LLM_RESPONSE_CACHE.get(cache_key)
+            for user_input, cache_key in zip(user_inputs, cache_keys)
+        ]
+        misses = [i for i, result in enumerate(results) if result is None]
+        if not misses:
+            return results
+        
+        try:
+            responses = self.llm.batch(
+                [self._build_llm_messages(user_inputs[i]) for i in misses],
+                return_exceptions=True
+            )
+        except Exception as e:
+            responses = [e] * len(misses)
+        
+        for i, response in zip(misses, responses):
+            if isinstance(response, Exception):
+                results[i] = f"Error getting response: {str(response)}"
+            else:
+                results[i] = response.content
+                _LLM_RESPONSE_CACHE.set(cache_keys[i], response.content)
+        
+        return results
 
 
 if __name__ == "__main__":
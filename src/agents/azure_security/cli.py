@@ -7,26 +7,53 @@ Interactive command-line interface for Azure security analysis and auditing.
 
 import os
 import sys
+import asyncio
+import difflib
+import json
+from collections import Counter, OrderedDict
+from functools import lru_cache, partial
+from pathlib import Path
 from typing import Optional
 
 import typer
-from rich.console import Console
-from rich.prompt import Prompt
-from rich.panel import Panel
-from rich.table import Table
-from dotenv import load_dotenv
 
-from .agent import AzureSecurityAgent
+# Rich, dotenv and the agent are imported when the CLI actually runs, so
+# that `--help` and importing this module stay fast.
+app = typer.Typer(help="Azure Security Agent CLI")
 
-# Load environment variables
-load_dotenv()
+# How often each built-in command is used, persisted across sessions so
+# the help table lists a user's most used commands first
+_CMD_STATS_PATH = Path.home() / ".cloudsec-agent" / "cmd_stats.json"
+_CMD_HITS: Counter = Counter()
+_COMMAND_ALIASES = {"?": "help", "cls": "clear", "quit": "exit"}
 
-app = typer.Typer(help="Azure Security Agent CLI")
-console = Console()
+_HELP_ROWS = (
+    ("entra", "Analyze Entra ID security"),
+    ("storage", "Analyze Storage Account security"),
+    ("compute", "Analyze Virtual Machine security"),
+    ("database", "Analyze Database security"),
+    ("network", "Analyze Network security"),
+    ("audit", "Perform full Azure audit (generates PDF)"),
+    ("clear", "Clear the screen"),
+    ("help", "Show this help message"),
+    ("exit", "Exit the application"),
+)
+# Help rows in display order; sorted by usage once the saved stats are
+# loaded at startup, so the layout stays fixed for the rest of the session
+_help_rows = list(_HELP_ROWS)
+
+
+@lru_cache(maxsize=1)
+def _console():
+    """Return the shared Rich console, creating it on first use."""
+    from rich.console import Console
+    return Console()
 
 
-def display_welcome():
+def display_welcome(console):
     """Display welcome message."""
+    from rich.panel import Panel
+    
     console.print(Panel(
         "[bold blue]Azure Security Agent[/bold blue]\n"
         "[dim]Powered by Gemini LLM and Azure APIs[/dim]",
@@ -37,21 +64,16 @@ def display_welcome():
     console.print()
 
 
-def display_help():
+def display_help(console):
     """Display available commands."""
+    from rich.table import Table
+    
     table = Table(title="Available Commands")
     table.add_column("Command", style="green")
     table.add_column("Description")
     
-    table.add_row("entra", "Analyze Entra ID security")
-    table.add_row("storage", "Analyze Storage Account security")
-    table.add_row("compute", "Analyze Virtual Machine security")
-    table.add_row("database", "Analyze Database security")
-    table.add_row("network", "Analyze Network security")
-    table.add_row("audit", "Perform full Azure audit (generates PDF)")
-    table.add_row("clear", "Clear the screen")
-    table.add_row("help", "Show this help message")
-    table.add_row("exit", "Exit the application")
+    for command, description in _help_rows:
+        table.add_row(command, description)
     table.add_row("[natural language]", "Ask anything in natural language")
     
     console.print(table)
@@ -64,8 +86,128 @@ def display_help():
     console.print()
 
 
+def _load_cmd_stats(console):
+    """Load command usage counts saved by previous sessions and order the help rows by them."""
+    try:
+        with open(_CMD_STATS_PATH) as f:
+            saved = json.load(f)
+        _CMD_HITS.update({str(k): int(v) for k, v in saved.items()})
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        console.print(f"[yellow]Ignoring command usage stats in {_CMD_STATS_PATH}: {str(e)}[/yellow]")
+    
+    # Most used commands first; ties keep the default order
+    _help_rows.sort(key=lambda row: -_CMD_HITS[row[0]])
+
+
+def _save_cmd_stats(console):
+    """Persist command usage counts for the next session."""
+    if not _CMD_HITS:
+        return
+    try:
+        _CMD_STATS_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(_CMD_STATS_PATH, "w") as f:
+            json.dump(dict(_CMD_HITS), f, indent=2)
+    except Exception as e:
+        console.print(f"[yellow]Could not save command usage stats: {str(e)}[/yellow]")
+
+
+def _show_help(agent, console):
+    """Handle the help command."""
+    display_help(console)
+
+
+def _clear_screen(agent, console):
+    """Handle the clear command."""
+    console.clear()
+    display_welcome(console)
+
+
+def _analyze_section(section, agent, console):
+    """Handle a single-section analysis command."""
+    console.print(agent.analyze(section))
+
+
+def _run_audit(agent, console):
+    """Handle the audit command."""
+    from rich.panel import Panel
+    
+    with console.status("Running full Azure audit..."):
+        audit_result = asyncio.run(agent.perform_full_audit_async(export_pdf=True))
+    console.print()
+    console.print(Panel(
+        f"[green]✓ Audit Complete![/green]\n"
+        f"Subscription: {audit_result['subscription_id']}\n"
+        f"PDF Report: {audit_result['pdf_path']}",
+        border_style="green"
+    ))
+
+
+_EXIT_COMMANDS = frozenset({"exit", "quit"})
+
+# Built-in commands, keyed by their lowercased name
+_DISPATCH = {
+    "help": _show_help,
+    "?": _show_help,
+    "clear": _clear_screen,
+    "cls": _clear_screen,
+    "entra": partial(_analyze_section, "entra_id"),
+    "storage": partial(_analyze_section, "storage"),
+    "compute": partial(_analyze_section, "compute"),
+    "database": partial(_analyze_section, "database"),
+    "network": partial(_analyze_section, "network"),
+    "audit": _run_audit,
+}
+_KNOWN_COMMANDS = tuple(_DISPATCH) + tuple(sorted(_EXIT_COMMANDS))
+
+
+def _suggest_command(cmd: str) -> Optional[str]:
+    """
+    Return the built-in command a single mistyped word most likely meant.
+    
+    Equally close matches are resolved in favour of the most used command.
+    """
+    if " " in cmd:
+        return None
+    matches = difflib.get_close_matches(cmd, _KNOWN_COMMANDS, n=len(_KNOWN_COMMANDS), cutoff=0.8)
+    if not matches:
+        return None
+    
+    def closeness(candidate):
+        return difflib.SequenceMatcher(None, cmd, candidate).ratio()
+    
+    best = closeness(matches[0])
+    tied = [match for match in matches if closeness(match) == best]
+    return max(tied, key=lambda match: _CMD_HITS[_COMMAND_ALIASES.get(match, match)])
+
+
+# Session cache of answers to general questions, keyed by normalized prompt
+_PROMPT_CACHE_SIZE = 64
+_UNCACHEABLE_PREFIXES = ("Error", "LLM service not available")
+
+
+def _remember_answer(prompt_cache: OrderedDict, key: str, answer: str):
+    """Store an LLM answer in the session cache, skipping error messages."""
+    if not answer or answer.startswith(_UNCACHEABLE_PREFIXES):
+        return
+    prompt_cache[key] = answer
+    prompt_cache.move_to_end(key)
+    if len(prompt_cache) > _PROMPT_CACHE_SIZE:
+        prompt_cache.popitem(last=False)
+
+
 def main():
     """Main CLI entry point."""
+    from dotenv import load_dotenv
+    from rich.prompt import Prompt
+    
+    from .agent import AzureSecurityAgent
+    
+    # Load environment variables
+    load_dotenv()
+    console = _console()
+    
     # Get subscription ID from environment
     subscription_id = os.getenv("AZURE_SUBSCRIPTION_ID")
     
@@ -80,7 +222,9 @@ def main():
         console.print(f"[red]Error initializing Azure Security Agent: {str(e)}[/red]")
         return
     
-    display_welcome()
+    _load_cmd_stats(console)
+    display_welcome(console)
+    prompt_cache: "OrderedDict[str, str]" = OrderedDict()
     
     # Main command loop
     try:
@@ -88,43 +232,36 @@ def main():
             # Get command
             command = Prompt.ask("[bold blue]Azure Security>[/bold blue]")
             
-            if command.lower() in ["exit", "quit"]:
+            cmd = command.strip().lower()
+            handler = _DISPATCH.get(cmd)
+            suggestion = None if handler else _suggest_command(cmd)
+            key = " ".join(cmd.split())
+            is_general = handler is None and not suggestion and agent.is_general_question(command)
+            
+            if handler is not None or cmd in _EXIT_COMMANDS:
+                _CMD_HITS[_COMMAND_ALIASES.get(cmd, cmd)] += 1
+            
+            if cmd in _EXIT_COMMANDS:
                 break
-            elif command.lower() in ["help", "?"]:
-                display_help()
-            elif command.lower() in ["clear", "cls"]:
-                console.clear()
-                display_welcome()
-            elif command.lower() == "entra":
-                result = agent.analyze_entra_id_security()
-                console.print(result)
-            elif command.lower() == "storage":
-                result = agent.analyze_storage_security()
-                console.print(result)
-            elif command.lower() == "compute":
-                result = agent.analyze_compute_security()
-                console.print(result)
-            elif command.lower() == "database":
-                result = agent.analyze_database_security()
-                console.print(result)
-            elif command.lower() == "network":
-                result = agent.analyze_network_security()
-                console.print(result)
-            elif command.lower() == "audit":
-                with console.status("Running full Azure audit..."):
-                    audit_result = agent.perform_full_audit(export_pdf=True)
-                console.print()
-                console.print(Panel(
-                    f"[green]✓ Audit Complete![/green]\n"
-                    f"Subscription: {audit_result['subscription_id']}\n"
-                    f"PDF Report: {audit_result['pdf_path']}",
-                    border_style="green"
-                ))
+            elif handler is not None:
+                handler(agent, console)
+            elif suggestion:
+                console.print(f"[yellow]Unknown command '{command}'. Did you mean [bold]{suggestion}[/bold]?[/yellow]")
+            elif is_general and key in prompt_cache:
+                # Replay an answer already given this session
+                prompt_cache.move_to_end(key)
+                console.print(prompt_cache[key], markup=False)
+                console.print("[dim](cached)[/dim]")
+            elif is_general and sys.stdout.isatty():
+                # General questions stream the answer as it is generated
+                _remember_answer(prompt_cache, key, agent.process_command(command, stream=True))
             else:
                 # Process as natural language
                 with console.status("Analyzing your query..."):
                     result = agent.process_command(command)
                 console.print(result)
+                if is_general:
+                    _remember_answer(prompt_cache, key, result)
             
             console.print()
     
@@ -132,6 +269,8 @@ def main():
         console.print("\n[yellow]Goodbye![/yellow]")
     except Exception as e:
         console.print(f"[red]Error: {str(e)}[/red]")
+    finally:
+        _save_cmd_stats(console)
 
 
 @app.command()
@@ -5,8 +5,13 @@ Azure Security Patterns and Utilities
 Provides security patterns, risk assessment, and recommendations for Azure.
 """
 
+import re
+import sys
+from collections import Counter
+from types import MappingProxyType
 from typing import Dict, List, Any
 from dataclasses import dataclass
+from enum import IntEnum
 
 
 @dataclass
@@ -25,13 +30,13 @@ class AzureSecurityPatterns:
     """
     
     # Risky roles and permissions
-    RISKY_ROLES = {
+    RISKY_ROLES = MappingProxyType({
         "Owner": "Full access to all resources - use sparingly",
         "Contributor": "Can create and modify all resources",
         "User Access Administrator": "Can manage user access - high risk",
         "Virtual Machine Administrator Login": "Admin access to VMs",
         "Storage Account Key Operator Service Role": "Can manage storage keys",
-    }
+    })
     
     # Risky permissions
     RISKY_PERMISSIONS = [
@@ -42,8 +47,12 @@ class AzureSecurityPatterns:
         "Microsoft.Sql/*/Write",
     ]
     
+    # Lowercased match strings and a single-pass matcher, built once
+    _RISKY_PERM_LOWER = tuple(p.replace("*", "").lower() for p in RISKY_PERMISSIONS)
+    _RISKY_PERM_RE = re.compile("|".join(re.escape(p) for p in _RISKY_PERM_LOWER))
+    
     # Azure services with security focus
-    SECURITY_SERVICES = {
+    SECURITY_SERVICES = MappingProxyType({
         "azure_security_center": "Azure Defender (formerly Security Center)",
         "azure_defender": "Advanced threat protection",
         "azure_policy": "Enforce organizational standards",
@@ -54,7 +63,7 @@ class AzureSecurityPatterns:
         "application_gateway": "Web application firewall",
         "azure_firewall": "Network-level protection",
         "ddos_protection": "DDoS attack mitigation",
-    }
+    })
     
     # Best practices
     BEST_PRACTICES = [
@@ -134,22 +143,50 @@ class AzureSecurityPatterns:
     @classmethod
     def is_risky_permission(cls, permission: str) -> bool:
         """Check if a permission is risky"""
-        for risky_perm in cls.RISKY_PERMISSIONS:
-            if risky_perm.replace("*", "").lower() in permission.lower():
-                return True
-        return False
+        permission_lower = permission.lower()
+        return any(risky_perm in permission_lower for risky_perm in cls._RISKY_PERM_LOWER)
+    
+    @classmethod
+    def filter_risky(cls, permissions: List[str]) -> List[bool]:
+        """
+        Check many permissions at once.
+        
+        Args:
+            permissions: Permission strings to check
+            
+        Returns:
+            One flag per permission, True where the permission is risky
+        """
+        search = cls._RISKY_PERM_RE.search
+        return [search(permission.lower()) is not None for permission in permissions]
+
+
+class Severity(IntEnum):
+    """Finding severities, in remediation priority order"""
+    CRITICAL = 0
+    HIGH = 1
+    MEDIUM = 2
+    LOW = 3
+    PASS = 4
+
+
+# Lowercased severity name -> Severity, for indexing fixed-size count lists
+_SEV_FROM_STR = MappingProxyType({sys.intern(sev.name.lower()): sev for sev in Severity})
 
 
 class AzureRiskAssessment:
     """Assess risk levels for Azure configurations"""
     
-    RISK_SCORES = {
-        "critical": 100,
-        "high": 75,
-        "medium": 50,
-        "low": 25,
-        "pass": 0,
-    }
+    # Read-only; severity keys are interned so lookups compare by identity
+    RISK_SCORES = MappingProxyType({
+        sys.intern("critical"): 100,
+        sys.intern("high"): 75,
+        sys.intern("medium"): 50,
+        sys.intern("low"): 25,
+        sys.intern("pass"): 0,
+    })
+    # Scores in Severity order
+    _SCORES = tuple(map(RISK_SCORES.__getitem__, _SEV_FROM_STR))
     
     @staticmethod
     def calculate_risk_score(findings: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -169,22 +206,18 @@ class AzureRiskAssessment:
                 "status": "pass"
             }
         
-        total_score = 0
-        severity_counts = {
-            "critical": 0,
-            "high": 0,
-            "medium": 0,
-            "low": 0,
-            "pass": 0
-        }
+        # Tally severities in one pass
+        tallies = Counter(sys.intern(finding.get("severity", "low").lower()) for finding in findings)
         
-        for finding in findings:
-            severity = finding.get("severity", "low").lower()
-            score = AzureRiskAssessment.RISK_SCORES.get(severity, 0)
-            total_score += score
-            
-            if severity in severity_counts:
-                severity_counts[severity] += 1
+        # Unknown severities score 0 and are not counted
+        counts = [0] * len(Severity)
+        for severity, count in tallies.items():
+            idx = _SEV_FROM_STR.get(severity)
+            if idx is not None:
+                counts[idx] += count
+        
+        total_score = sum(score * count for score, count in zip(AzureRiskAssessment._SCORES, counts))
+        severity_counts = {sev.name.lower(): counts[sev] for sev in Severity}
         
         # Calculate average risk
         num_findings = len(findings)
@@ -270,7 +303,7 @@ class AzureSecurityRecommendations:
 class AzureComplianceFrameworks:
     """Azure compliance and security frameworks"""
     
-    FRAMEWORKS = {
+    FRAMEWORKS = MappingProxyType({
         "cis_benchmarks": {
             "name": "CIS Microsoft Azure Foundations Benchmark",
             "description": "Best practices for Azure security configuration",
@@ -309,7 +342,7 @@ class AzureComplianceFrameworks:
             "description": "Information Security Management System",
             "azure_services": ["Azure Security Center", "Azure Policy", "Azure Advisor"]
         }
-    }
+    })
     
     @staticmethod
     def get_framework_recommendations(framework: str) -> Dict[str, Any]:
@@ -1,11 +1,56 @@
 # src/agents/compliance_bot/agent.py
 import os
 import re
-from typing import Optional, Dict, Any, List
+import time
+import pickle
+import asyncio
+import threading
+from functools import lru_cache
+from typing import Optional, Dict, Any, Iterator, List
 from .retriever import ComplianceRetriever
 from .search import SearchVerifier
 from .llm import ComplianceLLM
 from .web_search import WebSearcher
+from .semantic_cache import SemanticCache
+from src.utils import TTLCache, hash_key, run_sync
+
+# Paraphrased queries only reuse answers from near-deterministic generations
+_SEMANTIC_CACHE_MAX_TEMPERATURE = 0.3
+
+# Patterns that suggest a query is about an article or post
+_ARTICLE_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'(?:wrote|posted|published|authored|written).*(?:article|post|blog)',
+        r'(?:article|post|blog).*(?:by|from|written by).*',
+        r'(?:what|find).*(?:article|post|blog)',
+        r'(?:article|post|blog).*(?:about|regarding|on the topic of)',
+    )
+)
+_CAP_NAME_RE = re.compile(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b')
+_ARTICLE_TERMS = ("article", "post", "blog")
+
+# Canned reply when an article search finds nothing to summarize
+_NO_ARTICLES_RESPONSE = (
+    "I couldn't find matching articles. Try including the author's name, "
+    "publication, or a specific keyword from the title."
+)
+
+# One article's entry in the article-search LLM prompt
+_ARTICLE_TEMPLATE = "Article {i}:\nTitle: {title}\nSnippet: {snippet}\nSource: {source}\nLink: {link}\n{date}\n"
+
+
+@lru_cache(maxsize=4)
+def _load_retriever(embeddings_path: str) -> ComplianceRetriever:
+    """Load the vector store for a path once per process and share it between agents."""
+    return ComplianceRetriever(embeddings_path)
+
+
+@lru_cache(maxsize=4)
+def _get_llm(google_api_key: Optional[str]) -> ComplianceLLM:
+    """Create the Gemini wrapper once per API key; it holds no per-query state."""
+    return ComplianceLLM(api_key=google_api_key)
+
 
 class CloudComplianceAgent:
     """
@@ -17,7 +62,10 @@ class CloudComplianceAgent:
         embeddings_path: str = "data/embeddings/index",
         serpapi_key: Optional[str] = None,
         google_api_key: Optional[str] = None,
-        use_search: bool = True
+        use_search: bool = True,
+        cache_enabled: bool = True,
+        cache_ttl: float = 3600,
+        cache_maxsize: int = 1024
     ):
         """
         Initialize the compliance agent.
@@ -27,9 +75,12 @@ class CloudComplianceAgent:
             serpapi_key: SERPAPI API key (defaults to env variable)
             google_api_key: Google API key (defaults to env variable)
             use_search: Whether to use SERPAPI for cross-verification
+            cache_enabled: Whether to reuse responses for repeated identical queries
+            cache_ttl: Seconds a cached response stays valid
+            cache_maxsize: Maximum number of cached responses
         """
         # Initialize components
-        self.retriever = ComplianceRetriever(embeddings_path)
+        self.retriever = _load_retriever(embeddings_path)
         self.use_search = use_search
         self.serpapi_key = serpapi_key or os.getenv("SERPAPI_API_KEY")
         
@@ -52,7 +103,84 @@ class CloudComplianceAgent:
             self.web_searcher = None
         
         # Initialize LLM
-        self.llm = ComplianceLLM(api_key=google_api_key)
+        self.llm = _get_llm(google_api_key)
+        
+        # Exact-match response cache for repeated queries
+        self.cache_enabled = cache_enabled
+        self._response_cache = TTLCache(maxsize=cache_maxsize, ttl=cache_ttl)
+        self.stats = {"hits": 0, "misses": 0, "semantic_hits": 0}
+        # Queries may be answered from several threads at once (see server.py)
+        self._stats_lock = threading.Lock()
+        
+        # Similarity cache for paraphrased queries (low-temperature LLMs only)
+        self.semantic_cache_enabled = (
+            cache_enabled and self.llm.temperature <= _SEMANTIC_CACHE_MAX_TEMPERATURE
+        )
+        self._semantic_cache = SemanticCache(maxsize=256, threshold=0.95, ttl=cache_ttl)
+    
+    def save_cache(self, path: str) -> None:
+        """
+        Save cached responses to disk so a later session starts warm.
+        
+        Args:
+            path: Pickle file to write
+        """
+        if not self.cache_enabled:
+            return
+        
+        state = {
+            "saved_at": time.time(),
+            "responses": self._response_cache.dump(),
+            "semantic": self._semantic_cache.dump(),
+        }
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(path, "wb") as f:
+                pickle.dump(state, f)
+        except (OSError, pickle.PicklingError) as e:
+            print(f"Warning: could not save response cache: {e}")
+    
+    def load_cache(self, path: str) -> None:
+        """
+        Load cached responses saved by save_cache; expired entries are dropped.
+        
+        Args:
+            path: Pickle file to read (a missing file is ignored)
+        """
+        if not self.cache_enabled or not os.path.exists(path):
+            return
+        
+        try:
+            with open(path, "rb") as f:
+                state = pickle.load(f)
+        except Exception as e:
+            print(f"Warning: could not load response cache: {e}")
+            return
+        
+        elapsed = time.time() - state.get("saved_at", 0)
+        self._response_cache.load(
+            [(key, remaining - elapsed, value) for key, remaining, value in state.get("responses", [])]
+        )
+        if self.semantic_cache_enabled:
+            # Entries saved before expiry was tracked have no known age, so skip them
+            self._semantic_cache.load(
+                [(*entry[:3], entry[3] - elapsed) for entry in state.get("semantic", []) if len(entry) == 4]
+            )
+    
+    def _cache_get(self, key: str) -> Optional[Any]:
+        """Return a cached value and update hit/miss stats."""
+        if not self.cache_enabled:
+            return None
+        
+        value = self._response_cache.get(key)
+        with self._stats_lock:
+            self.stats["misses" if value is None else "hits"] += 1
+        return value
+    
+    def _cache_set(self, key: str, value: Any) -> None:
+        """Store a value in the response cache if caching is enabled."""
+        if self.cache_enabled:
+            self._response_cache.set(key, value)
     
     def is_article_search_query(self, query: str) -> bool:
         """
@@ -64,24 +192,14 @@ class CloudComplianceAgent:
         Returns:
             True if the query appears to be asking about an article or post
         """
-        # Define patterns that suggest article search queries
-        article_patterns = [
-            r'(?:wrote|posted|published|authored|written).*(?:article|post|blog)',
-            r'(?:article|post|blog).*(?:by|from|written by).*',
-            r'(?:what|find).*(?:article|post|blog)',
-            r'(?:article|post|blog).*(?:about|regarding|on the topic of)',
-        ]
-        
-        # Check for author names (capitalized words)
-        has_capitalized_name = bool(re.search(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b', query))
-        
         # Check for article patterns
-        for pattern in article_patterns:
-            if re.search(pattern, query, re.IGNORECASE):
+        for pattern in _ARTICLE_PATTERNS:
+            if pattern.search(query):
                 return True
-                
+        
         # If there's a capitalized name and mentions "article" or "post" or "blog", it's likely an article search
-        if has_capitalized_name and any(term in query.lower() for term in ["article", "post", "blog"]):
+        query_lower = query.lower()
+        if any(term in query_lower for term in _ARTICLE_TERMS) and _CAP_NAME_RE.search(query):
             return True
             
         return False
@@ -96,49 +214,108 @@ class CloudComplianceAgent:
         Returns:
             Dict with search results and LLM-generated response
         """
+        early_result, article_results, llm_prompt = self._prepare_article_search(query)
+        if early_result is not None:
+            return early_result
+        
+        # Generate LLM response, reusing it if the same prompt was seen recently
+        cache_key = hash_key("article", llm_prompt)
+        response = self._cache_get(cache_key)
+        if response is None:
+            response = self.llm.llm.invoke(llm_prompt).content
+            self._cache_set(cache_key, response)
+        
+        return self._article_result(query, response, article_results)
+    
+    def search_for_article_stream(self, query: str) -> Iterator[str]:
+        """
+        Search for articles, yielding the summary text as it is generated.
+        
+        The complete result dict (as returned by search_for_article) is the
+        generator's return value.
+        
+        Args:
+            query: The query about an article or post
+            
+        Yields:
+            Chunks of the response text
+        """
+        early_result, article_results, llm_prompt = self._prepare_article_search(query)
+        if early_result is not None:
+            yield early_result["response"]
+            return early_result
+        
+        cache_key = hash_key("article", llm_prompt)
+        response = self._cache_get(cache_key)
+        if response is not None:
+            yield response
+            return self._article_result(query, response, article_results)
+        
+        chunks = []
+        for chunk in self.llm.llm.stream(llm_prompt):
+            if chunk.content:
+                chunks.append(chunk.content)
+                yield chunk.content
+        
+        response = "".join(chunks)
+        self._cache_set(cache_key, response)
+        return self._article_result(query, response, article_results)
+    
+    def _prepare_article_search(self, query: str) -> tuple:
+        """
+        Run the article search and build the summary prompt.
+        
+        Args:
+            query: The query about an article or post
+            
+        Returns:
+            (final result or None, article search results, LLM prompt); the
+            final result is set when there is nothing for the LLM to summarize
+        """
         if not self.web_searcher:
-            return {
-                "query": query,
-                "response": "Sorry, I can't search for articles right now because the SERPAPI key is not configured.",
-                "retrieved_docs": [],
-                "search_results": [],
-                "is_article_search": True
-            }
+            return self._article_result(
+                query,
+                "Sorry, I can't search for articles right now because the SERPAPI key is not configured.",
+            ), None, None
             
         # Get article search results
         article_results = self.web_searcher.search_specific_content(query)
         
+        # Nothing to summarize, so skip the LLM call
+        if not article_results.get("found") or not article_results.get("results"):
+            return self._article_result(query, _NO_ARTICLES_RESPONSE), article_results, None
+        
         # Extract content from results for the LLM to summarize
-        article_content = ""
-        if article_results.get("found") and article_results.get("results"):
-            for i, result in enumerate(article_results["results"], 1):
-                article_content += f"Article {i}:\nTitle: {result.get('title', '')}\n"
-                article_content += f"Snippet: {result.get('snippet', '')}\n"
-                article_content += f"Source: {result.get('source', '')}\n"
-                article_content += f"Link: {result.get('link', '')}\n"
-                if result.get('date'):
-                    article_content += f"Date: {result.get('date', '')}\n"
-                article_content += "\n"
-                
+        article_content = "".join(
+            _ARTICLE_TEMPLATE.format(
+                i=i,
+                title=result.get('title', ''),
+                snippet=result.get('snippet', ''),
+                source=result.get('source', ''),
+                link=result.get('link', ''),
+                date=f"Date: {result['date']}\n" if result.get('date') else "",
+            )
+            for i, result in enumerate(article_results["results"], 1)
+        )
+        
         # Get the LLM to generate a response about the articles
         llm_prompt = f"""
 Based on a search for articles related to the query: "{query}", 
 the following information was found:
 
-{article_content if article_content else "No specific articles were found."}
+{article_content}
 
 Please provide a helpful response to the user's query about these articles.
-If no articles were found, suggest alternative search terms or approaches.
 """
-        
-        # Generate LLM response
-        response = self.llm.llm.invoke(llm_prompt).content
-        
+        return None, article_results, llm_prompt
+    
+    def _article_result(self, query: str, response: str, article_results: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Build the result dict for an article search."""
         return {
             "query": query,
             "response": response,
             "retrieved_docs": [],  # No compliance docs used here
-            "search_results": article_results.get("results", []),
+            "search_results": article_results.get("results", []) if article_results else [],
             "is_article_search": True
         }
 
@@ -146,6 +323,24 @@ If no articles were found, suggest alternative search terms or approaches.
         """
         Process a user query and generate a response.
         
+        Args:
+            query: The user's query
+            k: Number of documents to retrieve
+            use_search: Override the default search setting
+            
+        Returns:
+            Dict with response and supporting information
+        """
+        return run_sync(self.process_query_async(query, k=k, use_search=use_search))
+    
+    async def process_query_async(self, query: str, k: int = 5, use_search: Optional[bool] = None) -> Dict[str, Any]:
+        """
+        Async variant of process_query.
+        
+        Vector retrieval (in a worker thread) and the web search run
+        concurrently, and the LLM call is awaited natively; blocking calls
+        never run on the event loop.
+        
         Args:
             query: The user's query
             k: Number of documents to retrieve
@@ -156,31 +351,183 @@ If no articles were found, suggest alternative search terms or approaches.
         """
         # Check if this is an article search query
         if self.is_article_search_query(query):
-            return self.search_for_article(query)
+            return await asyncio.to_thread(self.search_for_article, query)
             
         # Regular compliance query processing
         # Override search setting if provided
         should_use_search = use_search if use_search is not None else self.use_search
         
-        # Step 1: Retrieve relevant documents
-        retrieved_docs = self.retriever.retrieve_with_score(query, k=k)
+        # Return a cached result for an identical or paraphrased request
+        cache_key = hash_key("query", query, k, bool(should_use_search))
+        params = (k, bool(should_use_search))
+        embedding, cached = await asyncio.to_thread(self._lookup_cached, query, cache_key, params)
+        if cached is not None:
+            return cached
         
-        # Step 2: Get search results if enabled
-        search_results = None
-        if should_use_search:
-            try:
-                search_results = self.search.search(query, num_results=3)
-            except Exception as e:
-                print(f"Search error: {e}")
+        # Steps 1 and 2: Retrieve relevant documents and, if enabled, search the web
+        retrieved_docs, search_results = await self._gather_context(query, k, should_use_search, embedding)
         
         # Step 3: Generate response
-        response = self.llm.generate_response(
+        response = await self.llm.agenerate_response(
             query=query,
             retrieved_docs=retrieved_docs,
             search_results=search_results
         )
         
-        # Return complete result
+        return self._store_result(query, response, retrieved_docs, search_results, cache_key, params, embedding)
+    
+    def process_queries(self, queries: List[str], k: int = 5,
+                        use_search: Optional[bool] = None) -> List[Dict[str, Any]]:
+        """
+        Process several queries, batching embedding and LLM calls.
+        
+        Cached queries and article searches are answered individually; the
+        rest share one embedding call, concurrent web searches and one
+        batched LLM call.
+        
+        Args:
+            queries: The user's queries
+            k: Number of documents to retrieve per query
+            use_search: Override the default search setting
+            
+        Returns:
+            One result dict (as returned by process_query) per query, in order
+        """
+        should_use_search = use_search if use_search is not None else self.use_search
+        params = (k, bool(should_use_search))
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(queries)
+        pending = []
+        for i, query in enumerate(queries):
+            if self.is_article_search_query(query):
+                results[i] = self.search_for_article(query)
+                continue
+            
+            cache_key = hash_key("query", query, k, bool(should_use_search))
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.append((i, query, cache_key))
+        
+        if not pending:
+            return results
+        
+        pending_queries = [query for _, query, _ in pending]
+        docs_per_query, search_per_query = run_sync(
+            self._gather_batch_context(pending_queries, k, should_use_search)
+        )
+        
+        responses = self.llm.generate_responses(list(zip(pending_queries, docs_per_query, search_per_query)))
+        for (i, query, cache_key), docs, search_results, response in zip(
+            pending, docs_per_query, search_per_query, responses
+        ):
+            if isinstance(response, Exception):
+                # Report the failure without caching it, so a retry asks the LLM again
+                results[i] = self._query_result(
+                    query, f"Error generating response: {response}", docs, search_results
+                )
+            else:
+                results[i] = self._store_result(query, response, docs, search_results, cache_key, params, None)
+        
+        return results
+    
+    def process_query_stream(self, query: str, k: int = 5, use_search: Optional[bool] = None) -> Iterator[str]:
+        """
+        Process a user query, yielding the response text as it is generated.
+        
+        Cached answers are yielded in one piece. The complete result dict
+        (as returned by process_query) is the generator's return value.
+        
+        Args:
+            query: The user's query
+            k: Number of documents to retrieve
+            use_search: Override the default search setting
+            
+        Yields:
+            Chunks of the response text
+        """
+        if self.is_article_search_query(query):
+            return (yield from self.search_for_article_stream(query))
+        
+        should_use_search = use_search if use_search is not None else self.use_search
+        cache_key = hash_key("query", query, k, bool(should_use_search))
+        params = (k, bool(should_use_search))
+        embedding, cached = self._lookup_cached(query, cache_key, params)
+        if cached is not None:
+            yield cached["response"]
+            return cached
+        
+        retrieved_docs, search_results = run_sync(
+            self._gather_context(query, k, should_use_search, embedding)
+        )
+        
+        chunks = []
+        for chunk in self.llm.stream_response(query, retrieved_docs, search_results):
+            chunks.append(chunk)
+            yield chunk
+        
+        return self._store_result(query, "".join(chunks), retrieved_docs, search_results, cache_key, params, embedding)
+    
+    def _lookup_cached(self, query: str, cache_key: str, params: tuple) -> tuple:
+        """
+        Look up a query in the exact-match cache, then the semantic cache.
+        
+        Args:
+            query: The user's query
+            cache_key: Exact-match cache key for the request
+            params: (k, use_search) the request was made with
+            
+        Returns:
+            (query embedding or None, cached result or None)
+        """
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return None, cached
+        
+        # Look for a previously answered query with the same meaning
+        if not self.semantic_cache_enabled:
+            return None, None
+        
+        embedding = self.retriever.embed(query)
+        similar = self._semantic_cache.lookup(embedding, params)
+        if similar is None:
+            return embedding, None
+        
+        with self._stats_lock:
+            self.stats["semantic_hits"] += 1
+        return embedding, {**similar, "query": query, "from_semantic_cache": True}
+    
+    async def _gather_context(self, query: str, k: int, use_search: bool,
+                              embedding: Optional[List[float]] = None) -> tuple:
+        """
+        Retrieve documents and, if enabled, search the web concurrently.
+        
+        Returns:
+            (retrieved documents, search results or None)
+        """
+        retrieval = asyncio.to_thread(self.retriever.retrieve_with_score, query, k, embedding)
+        if not use_search:
+            return await retrieval, None
+        
+        return tuple(await asyncio.gather(retrieval, self._search_web(query)))
+    
+    async def _gather_batch_context(self, queries: List[str], k: int, use_search: bool) -> tuple:
+        """
+        Retrieve documents for several queries while their web searches run.
+        
+        Returns:
+            (retrieved documents per query, search results or None per query)
+        """
+        retrieval = asyncio.to_thread(self.retriever.retrieve_batch, queries, k)
+        if not use_search:
+            return await retrieval, [None] * len(queries)
+        
+        return tuple(await asyncio.gather(retrieval, self._search_web_many(queries)))
+    
+    def _query_result(self, query: str, response: str, retrieved_docs: List[Dict[str, Any]],
+                      search_results: Optional[List[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Build the result dict for a compliance query."""
         return {
             "query": query,
             "response": response,
@@ -188,3 +535,25 @@ If no articles were found, suggest alternative search terms or approaches.
             "search_results": search_results,
             "is_article_search": False
         }
+    
+    def _store_result(self, query: str, response: str, retrieved_docs: List[Dict[str, Any]],
+                      search_results: Optional[List[Dict[str, Any]]], cache_key: str,
+                      params: tuple, embedding: Optional[List[float]]) -> Dict[str, Any]:
+        """Build the result dict for a compliance query and add it to the caches."""
+        result = self._query_result(query, response, retrieved_docs, search_results)
+        self._cache_set(cache_key, result)
+        if embedding is not None:
+            self._semantic_cache.add(embedding, params, result)
+        return result
+    
+    async def _search_web_many(self, queries: List[str]) -> List[Optional[List[Dict[str, Any]]]]:
+        """Run the cross-verification searches for several queries concurrently."""
+        return list(await asyncio.gather(*(self._search_web(query) for query in queries)))
+    
+    async def _search_web(self, query: str) -> Optional[List[Dict[str, Any]]]:
+        """Run the cross-verification search, returning None if it fails."""
+        try:
+            return await self.search.asearch(query, num_results=3)
+        except Exception as e:
+            print(f"Search error: {e}")
+            return None
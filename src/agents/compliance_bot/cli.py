@@ -1,6 +1,7 @@
 # src/agents/compliance_bot/cli.py
 import os
 import sys
+import threading
 import typer
 from typing import Optional
 from rich.console import Console
@@ -9,7 +10,8 @@ from rich.markdown import Markdown
 from rich.table import Table
 from rich import box
 from rich.prompt import Prompt
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.live import Live
+from rich.spinner import Spinner
 from rich.syntax import Syntax
 from dotenv import load_dotenv
 
@@ -68,7 +70,43 @@ def display_article_results(result):
                 expand=False
             ))
 
-def display_response(result):
+def _truncate(text: str, limit: int) -> str:
+    """Shorten text to at most limit characters, marking the cut with an ellipsis."""
+    return text[:limit] + "..." if len(text) > limit else text
+
+def display_sources(result):
+    """Display a compact table of the top retrieved documents and search results."""
+    if result.get("retrieved_docs"):
+        docs_table = Table(title="Retrieved Documents", box=box.SIMPLE)
+        docs_table.add_column("Source", style="cyan", no_wrap=True)
+        docs_table.add_column("Relevance", style="magenta")
+        docs_table.add_column("Content", style="green")
+        
+        rows = [
+            (
+                _truncate(str(doc.get("metadata", {}).get("source", "Unknown")), 80),
+                f"{doc['score']:.2f}" if isinstance(doc.get("score"), float) else "N/A",
+                _truncate(doc.get("content", ""), 200),
+            )
+            for doc in result["retrieved_docs"][:3]  # Show top 3 docs
+        ]
+        for row in rows:
+            docs_table.add_row(*row)
+        
+        console.print(docs_table)
+    
+    # Display search results if available
+    if result.get("search_results"):
+        search_table = Table(title="Search Results", box=box.SIMPLE)
+        search_table.add_column("Title", style="cyan")
+        search_table.add_column("Snippet", style="green")
+        
+        for item in result["search_results"][:2]:  # Show top 2 search results
+            search_table.add_row(_truncate(item.get("title", "N/A"), 80), item.get("snippet", "N/A"))
+        
+        console.print(search_table)
+
+def display_response(result, show_sources: bool = True):
     """Display the response in a nicely formatted way."""
     # Check if this is an article search result
     if result.get("is_article_search", False):
@@ -83,50 +121,39 @@ def display_response(result):
         expand=False
     ))
     
-    # Option to show sources
-    if console.width > 100:  # Only offer detailed view on wider terminals
-        show_details = Prompt.ask("\n[dim]Show retrieved sources?[/dim]", choices=["y", "n"], default="n")
-        
-        if show_details.lower() == "y":
-            # Display retrieved documents
-            docs_table = Table(title="Retrieved Documents", box=box.ROUNDED)
-            docs_table.add_column("Source", style="cyan", no_wrap=True)
-            docs_table.add_column("Relevance", style="magenta")
-            docs_table.add_column("Content", style="green")
-            
-            for doc in result["retrieved_docs"][:3]:  # Show top 3 docs
-                source = doc.get("metadata", {}).get("source", "Unknown")
-                score = doc.get("score", "N/A")
-                score_str = f"{score:.2f}" if isinstance(score, float) else str(score)
-                content = doc.get("content", "")
-                # Truncate content if too long
-                content = content[:200] + "..." if len(content) > 200 else content
-                docs_table.add_row(source, score_str, content)
-            
-            console.print(docs_table)
-            
-            # Display search results if available
-            if result.get("search_results"):
-                search_table = Table(title="Search Results", box=box.ROUNDED)
-                search_table.add_column("Title", style="cyan")
-                search_table.add_column("Snippet", style="green")
-                
-                for item in result["search_results"][:2]:  # Show top 2 search results
-                    title = item.get("title", "N/A")
-                    snippet = item.get("snippet", "N/A")
-                    search_table.add_row(title, snippet)
-                
-                console.print(search_table)
+    if show_sources:
+        display_sources(result)
+
+def stream_response(agent: CloudComplianceAgent, query: str):
+    """Show the response live as it is generated and return the final result."""
+    stream = agent.process_query_stream(query)
+    chunks = []
+    
+    # The preview is transient; display_response prints the final panel
+    with Live(
+        Spinner("dots", text="[bold blue]Processing your question...[/bold blue]"),
+        console=console,
+        refresh_per_second=20,
+        transient=True,
+    ) as live:
+        while True:
+            try:
+                chunks.append(next(stream))
+            except StopIteration as stop:
+                return stop.value
+            live.update(Panel(
+                Markdown("".join(chunks)),
+                title="[bold green]Response[/bold green]",
+                border_style="green",
+                expand=False
+            ))
 
 def clear_screen():
     """Clear the terminal screen."""
-    # Clear screen - works for both Windows and Unix/Linux
-    if os.name == "nt":  # For Windows
-        os.system("cls")
-    else:  # For Unix/Linux/MacOS
-        os.system("clear")
+    # ANSI clear via Rich (works on Windows terminals too); no subprocess
+    console.clear()
 
-def interactive_mode(agent: CloudComplianceAgent):
+def interactive_mode(agent: CloudComplianceAgent, show_sources: bool = True):
     """Run the interactive CLI mode."""
     display_welcome()
     
@@ -149,19 +176,17 @@ def interactive_mode(agent: CloudComplianceAgent):
         if not query.strip():
             continue
             
-        # Show processing indicator
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[bold blue]Processing your question...[/bold blue]"),
-            transient=True,
-        ) as progress:
-            progress.add_task("Processing...", total=None)
-            
+        # Stream the answer on a terminal; otherwise show processing indicator
+        if console.is_terminal:
+            display_response(stream_response(agent, query), show_sources)
+            continue
+        
+        with console.status("[bold blue]Processing your question...[/bold blue]", spinner="dots"):
             # Process the query
             result = agent.process_query(query)
         
         # Display the response
-        display_response(result)
+        display_response(result, show_sources)
 
 @app.command()
 def chat(
@@ -175,6 +200,11 @@ def chat(
         "--use-search/--no-search",
         help="Whether to use SERPAPI for cross-verification"
     ),
+    show_sources: Optional[bool] = typer.Option(
+        None,
+        "--show-sources/--no-sources",
+        help="Show retrieved sources after each response (default: on for terminals wider than 100 columns)"
+    ),
     serpapi_key: Optional[str] = typer.Option(
         None, 
         "--serpapi-key", 
@@ -196,8 +226,13 @@ def chat(
             use_search=use_search
         )
         
+        # Load the vector store in the background while the user types
+        threading.Thread(target=agent.retriever.warm_up, daemon=True).start()
+        
         # Start interactive mode
-        interactive_mode(agent)
+        if show_sources is None:
+            show_sources = console.width > 100
+        interactive_mode(agent, show_sources)
         
     except Exception as e:
         console.print(f"[bold red]Error:[/bold red] {str(e)}")
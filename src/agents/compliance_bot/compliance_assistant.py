@@ -4,6 +4,8 @@ Compliance Assistant class for the unified CLI
 """
 
 import os
+import re
+import atexit
 from typing import Dict, Any, List, Optional
 
 from langchain_google_genai import ChatGoogleGenerativeAI
@@ -12,6 +14,17 @@ from langchain_core.messages import SystemMessage, HumanMessage
 from .agent import CloudComplianceAgent
 from .web_search import WebSearcher
 
+# Answers are kept for two hours and survive restarts of the unified CLI
+_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cloudsec-agent", "compliance_cache.pkl")
+_CACHE_TTL = 2 * 60 * 60
+_CACHE_MAXSIZE = 1000
+
+# Words that mark a query as asking about articles, blog posts or publications
+_ARTICLE_KEYWORDS_RE = re.compile(
+    r'\b(?:articles?|blogs?|posts?|publications?|wrote|authors?|authored|published|writes?|written)\b',
+    re.IGNORECASE
+)
+
 
 class ComplianceAssistant:
     """
@@ -21,7 +34,12 @@ class ComplianceAssistant:
     
     def __init__(self):
         """Initialize the Compliance Assistant with required components."""
-        self.compliance_agent = CloudComplianceAgent()
+        self.compliance_agent = CloudComplianceAgent(
+            cache_ttl=_CACHE_TTL,
+            cache_maxsize=_CACHE_MAXSIZE
+        )
+        self.compliance_agent.load_cache(_CACHE_PATH)
+        atexit.register(self.compliance_agent.save_cache, _CACHE_PATH)
         self.web_searcher = WebSearcher()
     
     def answer_question(self, query: str) -> str:
@@ -46,6 +64,31 @@ class ComplianceAssistant:
         result = self.compliance_agent.process_query(query)
         return result["response"]
     
+    def answer_questions(self, queries: List[str]) -> List[str]:
+        """
+        Answer several questions, batching the compliance ones.
+        
+        Args:
+            queries: The user's questions
+            
+        Returns:
+            One formatted response string per question, in order
+        """
+        answers: List[Optional[str]] = [None] * len(queries)
+        compliance = []
+        for i, query in enumerate(queries):
+            if self._is_article_search_query(query):
+                answers[i] = self.answer_question(query)
+            else:
+                compliance.append(i)
+        
+        if compliance:
+            results = self.compliance_agent.process_queries([queries[i] for i in compliance])
+            for i, result in zip(compliance, results):
+                answers[i] = result["response"]
+        
+        return answers
+    
     def _is_article_search_query(self, query: str) -> bool:
         """
         Determine if the query is asking about articles, blog posts, or publications.
@@ -56,17 +99,7 @@ class ComplianceAssistant:
         Returns:
             True if this appears to be an article search query
         """
-        article_keywords = [
-            "article", "blog", "post", "publication", "wrote", 
-            "author", "published", "write", "written"
-        ]
-        
-        query_lower = query.lower()
-        for keyword in article_keywords:
-            if keyword in query_lower:
-                return True
-                
-        return False
+        return _ARTICLE_KEYWORDS_RE.search(query) is not None
     
     def _format_article_results(self, results: Dict) -> str:
         """
@@ -78,15 +111,16 @@ class ComplianceAssistant:
         Returns:
             A formatted string with article information
         """
-        output = f"# Article Search Results for: {results['query']}\n\n"
-        
-        for i, result in enumerate(results["results"], 1):
-            output += f"## {i}. {result['title']}\n\n"
-            output += f"{result['snippet']}\n\n"
-            output += f"[Read more]({result['link']})\n\n"
-            output += "---\n\n"
+        parts = [f"# Article Search Results for: {results['query']}\n\n"]
+        parts.extend(
+            f"## {i}. {result['title']}\n\n"
+            f"{result['snippet']}\n\n"
+            f"[Read more]({result['link']})\n\n"
+            "---\n\n"
+            for i, result in enumerate(results["results"], 1)
+        )
         
         if not results["results"]:
-            output += "No articles found matching your query.\n"
+            parts.append("No articles found matching your query.\n")
         
-        return output
+        return "".join(parts)
\ No newline at end of file
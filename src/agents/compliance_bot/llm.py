@@ -1,13 +1,87 @@
 # src/agents/compliance_bot/llm.py
 import os
-from typing import Dict, List, Any, Optional
+import re
+import hashlib
+from functools import lru_cache
+from typing import Dict, List, Any, Iterator, Optional, Union
 import google.generativeai as genai
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.messages import SystemMessage, HumanMessage
 
+from src.utils import estimate_tokens
+
+_MODEL_NAME = "gemini-2.5-flash"
+
+# Prompt budget for retrieved documents, per document and in total
+_DOC_TOKEN_LIMIT = 500
+_CONTEXT_TOKEN_LIMIT = 4000
+
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+_WORD_RE = re.compile(r"\w+")
+
+
+def _trim_to_query(content: str, query_terms: set, limit: int) -> str:
+    """
+    Shorten a document to about limit tokens, preferring sentences that mention the query.
+    
+    Args:
+        content: Document text
+        query_terms: Lowercased words from the user's query
+        limit: Token budget for the document
+        
+    Returns:
+        The kept sentences in their original order
+    """
+    if estimate_tokens(content) <= limit:
+        return content
+    
+    sentences = _SENTENCE_SPLIT_RE.split(content)
+    # Stable sort: sentences sharing a word with the query first, otherwise document order
+    ranked = sorted(
+        range(len(sentences)),
+        key=lambda i: query_terms.isdisjoint(_WORD_RE.findall(sentences[i].lower()))
+    )
+    
+    kept, used = [], 0
+    for i in ranked:
+        tokens = estimate_tokens(sentences[i])
+        if used + tokens <= limit:
+            kept.append(i)
+            used += tokens
+    
+    return " ".join(sentences[i] for i in sorted(kept))
+
+
+@lru_cache(maxsize=None)
+def _configure_genai(api_key: str) -> None:
+    """Configure the genai SDK once per API key."""
+    genai.configure(api_key=api_key)
+
+
+@lru_cache(maxsize=4)
+def _chat_model(temperature: float) -> ChatGoogleGenerativeAI:
+    """Create the Gemini chat client once per process and share it between instances."""
+    return ChatGoogleGenerativeAI(model=_MODEL_NAME, temperature=temperature)
+
+
 class ComplianceLLM:
     """Handles interactions with the Gemini LLM for the compliance bot."""
     
+    # The system prompt never changes, so the message is built once
+    _SYSTEM_MESSAGE = SystemMessage(content="""You are a Cloud Security Compliance Expert assistant. Your purpose is to help users understand cloud security 
+compliance standards, best practices, and configurations.
+
+You have access to information from various compliance documents including CIS benchmarks for AWS services.
+
+When responding to questions:
+1. Be precise and accurate about compliance requirements
+2. Cite specific compliance standards and benchmarks when applicable
+3. Explain the security rationale behind compliance requirements
+4. Suggest practical implementation steps when relevant
+5. Note if there are conflicting requirements across different standards
+
+Focus on being helpful, educational, and providing actionable advice.""")
+    
     def __init__(self, api_key: Optional[str] = None):
         """
         Initialize the Gemini LLM.
@@ -20,19 +94,50 @@ class ComplianceLLM:
             # We'll use the application default credentials if no API key is provided
             pass
         else:
-            genai.configure(api_key=self.api_key)
+            _configure_genai(self.api_key)
         
-        self.llm = ChatGoogleGenerativeAI(
-            model="gemini-2.5-flash",
-            temperature=0.2
-        )
+        # Exposed so callers can tell whether responses are safe to reuse
+        self.temperature = 0.2
+        self.llm = _chat_model(self.temperature)
     
-    def generate_response(self, 
-                          query: str, 
-                          retrieved_docs: List[Dict[str, Any]], 
-                          search_results: Optional[List[Dict[str, Any]]] = None) -> str:
+    def _prepare_context(self, retrieved_docs: List[Dict[str, Any]], query: str) -> List[Dict[str, Any]]:
         """
-        Generate a response using Gemini LLM.
+        Drop duplicate documents and trim the rest to fit the prompt budget.
+        
+        Args:
+            retrieved_docs: Documents retrieved from the vector store, best first
+            query: The user's query
+            
+        Returns:
+            Documents to include in the prompt, with possibly shortened content
+        """
+        query_terms = {word for word in _WORD_RE.findall(query.lower()) if len(word) > 2}
+        seen = set()
+        prepared = []
+        budget = _CONTEXT_TOKEN_LIMIT
+        
+        for doc in retrieved_docs:
+            # Overlapping chunks of the same text share their opening
+            key = hashlib.blake2b(doc["content"][:256].encode("utf-8"), digest_size=16).digest()
+            if key in seen:
+                continue
+            seen.add(key)
+            
+            content = _trim_to_query(doc["content"], query_terms, _DOC_TOKEN_LIMIT)
+            tokens = estimate_tokens(content)
+            if tokens > budget:
+                break
+            budget -= tokens
+            prepared.append({**doc, "content": content})
+        
+        return prepared
+    
+    def _build_messages(self,
+                        query: str,
+                        retrieved_docs: List[Dict[str, Any]],
+                        search_results: Optional[List[Dict[str, Any]]] = None) -> list:
+        """
+        Build the chat messages for a compliance question.
         
         Args:
             query: The user's query
@@ -40,53 +145,107 @@ class ComplianceLLM:
             search_results: Optional search results for cross-verification
             
         Returns:
-            The generated response
+            System and human messages for the LLM
         """
-        # Prepare system prompt
-        system_prompt = """You are a Cloud Security Compliance Expert assistant. Your purpose is to help users understand cloud security 
-compliance standards, best practices, and configurations.
-
-You have access to information from various compliance documents including CIS benchmarks for AWS services.
-
-When responding to questions:
-1. Be precise and accurate about compliance requirements
-2. Cite specific compliance standards and benchmarks when applicable
-3. Explain the security rationale behind compliance requirements
-4. Suggest practical implementation steps when relevant
-5. Note if there are conflicting requirements across different standards
-
-Focus on being helpful, educational, and providing actionable advice."""
-        
         # Prepare context from retrieved documents
-        context = "\n\n".join([
+        context = "\n\n".join(
             f"Document {i+1}:\n{doc['content']}\nSource: {doc.get('metadata', {}).get('source', 'Unknown')}"
-            for i, doc in enumerate(retrieved_docs)
-        ])
+            for i, doc in enumerate(self._prepare_context(retrieved_docs, query))
+        )
         
         # Add search results if available
-        search_context = ""
+        search_section = ""
         if search_results:
-            search_context = "\n\n".join([
+            search_section = "Online search results for cross-verification:\n" + "\n\n".join(
                 f"Search Result {i+1}:\nTitle: {result.get('title', '')}\nSnippet: {result.get('snippet', '')}\nURL: {result.get('link', '')}"
                 for i, result in enumerate(search_results)
-            ])
+            )
         
         # Create context message
         context_content = f"""Context from compliance documents:
 {context}
 
-{("Online search results for cross-verification:\n" + search_context) if search_results else ""}
+{search_section}
 
 User Question: {query}
 
 Please provide a comprehensive, accurate response addressing the user's question about cloud compliance."""
 
         # Create messages using the proper LangChain message types
-        messages = [
-            SystemMessage(content=system_prompt),
+        return [
+            self._SYSTEM_MESSAGE,
             HumanMessage(content=context_content)
         ]
+    
+    def generate_response(self, 
+                          query: str, 
+                          retrieved_docs: List[Dict[str, Any]], 
+                          search_results: Optional[List[Dict[str, Any]]] = None) -> str:
+        """
+        Generate a response using Gemini LLM.
         
-        # Generate response
-        response = self.llm.invoke(messages)
+        Args:
+            query: The user's query
+            retrieved_docs: Documents retrieved from the vector store
+            search_results: Optional search results for cross-verification
+            
+        Returns:
+            The generated response
+        """
+        response = self.llm.invoke(self._build_messages(query, retrieved_docs, search_results))
         return response.content
+    
+    def generate_responses(self, requests: List[tuple]) -> List[Union[str, Exception]]:
+        """
+        Generate responses for several questions, sent to the model concurrently.
+        
+        Args:
+            requests: (query, retrieved_docs, search_results) tuples
+            
+        Returns:
+            One response per request, in order; a failed request gets the
+            exception it raised so callers can tell it from an answer
+        """
+        messages = [self._build_messages(*request) for request in requests]
+        responses = self.llm.batch(messages, return_exceptions=True)
+        return [
+            response if isinstance(response, Exception) else response.content
+            for response in responses
+        ]
+    
+    async def agenerate_response(self,
+                                 query: str,
+                                 retrieved_docs: List[Dict[str, Any]],
+                                 search_results: Optional[List[Dict[str, Any]]] = None) -> str:
+        """
+        Async variant of generate_response using the client's native ainvoke.
+        
+        Args:
+            query: The user's query
+            retrieved_docs: Documents retrieved from the vector store
+            search_results: Optional search results for cross-verification
+            
+        Returns:
+            The generated response
+        """
+        response = await self.llm.ainvoke(self._build_messages(query, retrieved_docs, search_results))
+        return response.content
+    
+    def stream_response(self,
+                        query: str,
+                        retrieved_docs: List[Dict[str, Any]],
+                        search_results: Optional[List[Dict[str, Any]]] = None) -> Iterator[str]:
+        """
+        Generate a response using Gemini LLM, yielding text as it is produced.
+        
+        Args:
+            query: The user's query
+            retrieved_docs: Documents retrieved from the vector store
+            search_results: Optional search results for cross-verification
+            
+        Yields:
+            Chunks of the generated response
+        """
+        for chunk in self.llm.stream(self._build_messages(query, retrieved_docs, search_results)):
+            if chunk.content:
+                yield chunk.content
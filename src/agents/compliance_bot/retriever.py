@@ -1,15 +1,153 @@
 # src/agents/compliance_bot/retriever.py
+import os
+import atexit
+import hashlib
+import pickle
+from functools import cached_property, lru_cache
 from langchain_google_genai import GoogleGenerativeAIEmbeddings
 from langchain_community.vectorstores import FAISS
-from typing import List
+from typing import List, Optional
+
+from src.data_pipeline.embedder import HNSW_EF_SEARCH, QUANTIZED_INDEX_NAME
+from src.utils import TTLCache
+
+
+@lru_cache(maxsize=1)
+def _embeddings_client() -> GoogleGenerativeAIEmbeddings:
+    """Create the Gemini embeddings client once per process."""
+    return GoogleGenerativeAIEmbeddings(model="models/embedding-001")
+
+
+def _read_index(index_file: str):
+    """
+    Read a FAISS index, memory-mapped so only the pages a search touches
+    are read; index types without mmap support are read fully instead.
+    """
+    import faiss
+    
+    try:
+        return faiss.read_index(index_file, faiss.IO_FLAG_MMAP)
+    except RuntimeError:
+        return faiss.read_index(index_file)
+
 
 class ComplianceRetriever:
     """Retrieves relevant compliance information from the vector store."""
     
-    def __init__(self, embeddings_path="data/embeddings/index"):
-        """Initialize the retriever with the path to embeddings."""
-        self.embeddings = GoogleGenerativeAIEmbeddings(model="models/embedding-001")
-        self.vectorstore = FAISS.load_local(embeddings_path, self.embeddings, allow_dangerous_deserialization=True)
+    def __init__(self, embeddings_path="data/embeddings/index", quantized=True):
+        """
+        Initialize the retriever with the path to embeddings.
+        
+        Args:
+            embeddings_path: Directory of the saved vector store
+            quantized: Search the 8-bit index copy when one has been built
+        """
+        # The embeddings client and vector store are created on first use
+        self.embeddings_path = embeddings_path
+        self.quantized = quantized
+        
+        # Query embeddings never change, so keep them (LRU-bounded) across
+        # sessions; full retrieval results are reused for an hour
+        self._embedding_cache = TTLCache(maxsize=10_000, ttl=float("inf"))
+        self._results_cache = TTLCache(maxsize=1024, ttl=3600)
+        self._embedding_cache_path = os.path.join(os.path.dirname(embeddings_path), "query_cache.pkl")
+        self._load_embedding_cache()
+        atexit.register(self.save_embedding_cache)
+    
+    @cached_property
+    def embeddings(self) -> GoogleGenerativeAIEmbeddings:
+        """The Gemini embeddings client, shared by all retrievers."""
+        return _embeddings_client()
+    
+    @cached_property
+    def vectorstore(self) -> FAISS:
+        """The FAISS vector store, loaded from disk on first use."""
+        # Same docstore pickle FAISS.save_local writes next to the index
+        with open(os.path.join(self.embeddings_path, "index.pkl"), "rb") as f:
+            docstore, index_to_docstore_id = pickle.load(f)
+        
+        index = None
+        index_file = os.path.join(self.embeddings_path, "index.faiss")
+        quantized_file = os.path.join(self.embeddings_path, QUANTIZED_INDEX_NAME)
+        if (self.quantized and os.path.exists(quantized_file)
+                and os.path.getmtime(quantized_file) >= os.path.getmtime(index_file)):
+            index = _read_index(quantized_file)
+            # A copy left over from an earlier index would map ids to the wrong chunks
+            if index.ntotal != len(index_to_docstore_id):
+                print(f"Warning: ignoring {quantized_file}, which does not match the saved docstore")
+                index = None
+        if index is None:
+            index = _read_index(index_file)
+        
+        # Pin the HNSW search beam width (see src.data_pipeline.embedder) whatever the index was saved with
+        hnsw = getattr(index, "hnsw", None)
+        if hnsw is not None:
+            hnsw.efSearch = HNSW_EF_SEARCH
+        
+        return FAISS(self.embeddings, index, docstore, index_to_docstore_id)
+    
+    def warm_up(self) -> None:
+        """Load the embeddings client and vector store ahead of the first query."""
+        self.vectorstore
+    
+    def embed(self, query: str) -> List[float]:
+        """
+        Embed a query with the same model used for the vector store.
+        
+        Args:
+            query: The user's query
+            
+        Returns:
+            The query embedding
+        """
+        key = hashlib.sha256(query.encode("utf-8")).hexdigest()
+        embedding = self._embedding_cache.get(key)
+        if embedding is None:
+            embedding = tuple(self.embeddings.embed_query(query))
+            self._embedding_cache.set(key, embedding)
+        return list(embedding)
+    
+    def embed_batch(self, queries: List[str]) -> List[List[float]]:
+        """
+        Embed several queries, sending all uncached ones in a single API call.
+        
+        Args:
+            queries: The user queries
+            
+        Returns:
+            One embedding per query, in order
+        """
+        keys = [hashlib.sha256(query.encode("utf-8")).hexdigest() for query in queries]
+        embeddings = [self._embedding_cache.get(key) for key in keys]
+        
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if missing:
+            # Same task type as embed_query, so vectors match the single-query path
+            vectors = self.embeddings.embed_documents(
+                [queries[i] for i in missing], task_type="retrieval_query"
+            )
+            for i, vector in zip(missing, vectors):
+                embeddings[i] = tuple(vector)
+                self._embedding_cache.set(keys[i], embeddings[i])
+        
+        return [list(embedding) for embedding in embeddings]
+    
+    def retrieve_batch(self, queries: List[str], k: int = 5) -> List[List[dict]]:
+        """
+        Retrieve documents with scores for several queries at once.
+        
+        Args:
+            queries: The user queries
+            k: Number of documents to retrieve per query
+            
+        Returns:
+            One list of retrieved documents (as retrieve_with_score) per query
+        """
+        embeddings = self.embed_batch(queries)
+        return [
+            self.retrieve_with_score(query, k=k, embedding=embedding)
+            for query, embedding in zip(queries, embeddings)
+        ]
     
     def retrieve(self, query: str, k: int = 5) -> List[dict]:
         """
@@ -22,8 +160,13 @@ class ComplianceRetriever:
         Returns:
             List of retrieved documents
         """
-        results = self.vectorstore.similarity_search(query, k=k)
-        return [
+        cache_key = ("retrieve", query, k)
+        cached = self._results_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        results = self.vectorstore.similarity_search_by_vector(self.embed(query), k=k)
+        docs = [
             {
                 "content": doc.page_content,
                 "metadata": doc.metadata,
@@ -31,20 +174,30 @@ class ComplianceRetriever:
             }
             for doc in results
         ]
+        self._results_cache.set(cache_key, docs)
+        return docs
     
-    def retrieve_with_score(self, query: str, k: int = 5) -> List[dict]:
+    def retrieve_with_score(self, query: str, k: int = 5, embedding: Optional[List[float]] = None) -> List[dict]:
         """
         Retrieve relevant documents with similarity scores.
         
         Args:
             query: The user's query
             k: Number of documents to retrieve
+            embedding: Precomputed query embedding (avoids embedding the query again)
             
         Returns:
             List of retrieved documents with scores
         """
-        results = self.vectorstore.similarity_search_with_score(query, k=k)
-        return [
+        cache_key = ("retrieve_with_score", query, k)
+        cached = self._results_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        if embedding is None:
+            embedding = self.embed(query)
+        results = self.vectorstore.similarity_search_with_score_by_vector(embedding, k=k)
+        docs = [
             {
                 "content": doc[0].page_content,
                 "metadata": doc[0].metadata,
@@ -52,3 +205,32 @@ class ComplianceRetriever:
             }
             for doc in results
         ]
+        self._results_cache.set(cache_key, docs)
+        return docs
+    
+    def save_embedding_cache(self) -> None:
+        """Write cached query embeddings next to the index for the next session."""
+        entries = self._embedding_cache.dump()
+        if not entries:
+            return
+        
+        try:
+            with open(self._embedding_cache_path, "wb") as f:
+                pickle.dump({key: value for key, _, value in entries}, f)
+        except OSError as e:
+            print(f"Warning: could not save query embedding cache: {e}")
+    
+    def _load_embedding_cache(self) -> None:
+        """Load query embeddings saved by a previous session, if any."""
+        if not os.path.exists(self._embedding_cache_path):
+            return
+        
+        try:
+            with open(self._embedding_cache_path, "rb") as f:
+                embeddings = pickle.load(f)
+        except Exception as e:
+            print(f"Warning: could not load query embedding cache: {e}")
+            return
+        
+        for key, embedding in embeddings.items():
+            self._embedding_cache.set(key, tuple(embedding))
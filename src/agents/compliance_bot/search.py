@@ -1,8 +1,27 @@
 # src/agents/compliance_bot/search.py
 import os
-from serpapi import GoogleSearch
+import asyncio
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 
+_SERPAPI_URL = "https://serpapi.com/search.json"
+
+
+@lru_cache(maxsize=1)
+def _http_session():
+    """
+    Return a shared HTTP session so SERPAPI lookups reuse keep-alive connections.
+    
+    urllib3 already sets TCP_NODELAY on its sockets, so only the pool needs configuring.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=10))
+    return session
+
+
 class SearchVerifier:
     """Uses SERPAPI to cross-verify compliance information."""
     
@@ -28,19 +47,39 @@ class SearchVerifier:
         Returns:
             List of search results
         """
-        # Add cloud security compliance keywords to the query
-        enhanced_query = f"cloud security compliance {query}"
+        response = _http_session().get(_SERPAPI_URL, params=self._search_params(query, num_results), timeout=10)
+        return self._parse_results(response.json(), num_results)
+    
+    async def asearch(self, query: str, num_results: int = 5) -> List[Dict[str, Any]]:
+        """
+        Async variant of search that runs the request in a worker thread.
+        
+        The shared session's keep-alive connections are reused across calls;
+        an aiohttp session could not be, since each process_query runs its
+        own event loop.
         
-        search_params = {
+        Args:
+            query: The search query
+            num_results: Number of results to return
+            
+        Returns:
+            List of search results
+        """
+        params = self._search_params(query, num_results)
+        response = await asyncio.to_thread(_http_session().get, _SERPAPI_URL, params=params, timeout=30)
+        return self._parse_results(response.json(), num_results)
+    
+    def _search_params(self, query: str, num_results: int) -> Dict[str, Any]:
+        """Build SERPAPI parameters, adding compliance keywords to the query."""
+        return {
             "engine": "google",
-            "q": enhanced_query,
+            "q": f"cloud security compliance {query}",
             "api_key": self.api_key,
             "num": num_results,
         }
-        
-        search = GoogleSearch(search_params)
-        results = search.get_dict()
-        
+    
+    def _parse_results(self, results: Dict[str, Any], num_results: int) -> List[Dict[str, Any]]:
+        """Extract organic results from a SERPAPI response."""
         if "error" in results:
             raise Exception(f"SERPAPI error: {results['error']}")
             
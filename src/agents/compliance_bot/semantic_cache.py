@@ -0,0 +1,139 @@
+# src/agents/compliance_bot/semantic_cache.py
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+
+class SemanticCache:
+    """
+    Caches responses by query embedding so paraphrased questions reuse an answer.
+    
+    Lookups use cosine similarity over a FAISS inner-product index of
+    normalized query vectors; entries expire after ttl seconds and are
+    evicted least-recently-used. Safe to share between threads.
+    """
+    
+    def __init__(self, maxsize: int = 256, threshold: float = 0.95, ttl: float = 3600.0):
+        """
+        Initialize the semantic cache.
+        
+        Args:
+            maxsize: Maximum number of cached responses
+            threshold: Minimum cosine similarity for a cache hit
+            ttl: Seconds a cached response stays valid
+        """
+        self.maxsize = maxsize
+        self.threshold = threshold
+        self.ttl = ttl
+        self._index = None
+        # id -> (params, response, embedding, expires_at)
+        self._entries: "OrderedDict[int, tuple]" = OrderedDict()
+        self._next_id = 0
+        # Guards the index and entries together; reentrant since load() calls add()
+        self._lock = threading.RLock()
+    
+    def _as_query_vector(self, embedding: List[float]):
+        """Convert an embedding into a normalized float32 row vector."""
+        import faiss
+        import numpy as np
+        
+        vector = np.asarray([embedding], dtype="float32")
+        faiss.normalize_L2(vector)
+        return vector
+    
+    def lookup(self, embedding: List[float], params: Hashable) -> Optional[Dict[str, Any]]:
+        """
+        Find a cached response for a similar query.
+        
+        Args:
+            embedding: Embedding of the incoming query
+            params: Request parameters that must match exactly (e.g. k, use_search)
+        
+        Returns:
+            The cached response dict, or None on a miss
+        """
+        vector = self._as_query_vector(embedding)
+        with self._lock:
+            if self._index is None or not self._entries:
+                return None
+            
+            scores, ids = self._index.search(vector, 1)
+            entry_id = int(ids[0][0])
+            if entry_id < 0 or scores[0][0] < self.threshold:
+                return None
+            
+            entry = self._entries.get(entry_id)
+            if entry is None or entry[0] != params:
+                return None
+            
+            if entry[3] <= time.monotonic():
+                self._remove(entry_id)
+                return None
+            
+            self._entries.move_to_end(entry_id)
+            return entry[1]
+    
+    def add(self, embedding: List[float], params: Hashable, response: Dict[str, Any],
+            ttl: Optional[float] = None) -> None:
+        """
+        Store a response under the query embedding.
+        
+        Args:
+            embedding: Embedding of the answered query
+            params: Request parameters the response was generated with
+            response: The response dict to cache
+            ttl: Seconds the response stays valid (defaults to the cache ttl)
+        """
+        import faiss
+        import numpy as np
+        
+        vector = self._as_query_vector(embedding)
+        with self._lock:
+            if self._index is None:
+                self._index = faiss.IndexIDMap(faiss.IndexFlatIP(vector.shape[1]))
+            
+            entry_id = self._next_id
+            self._next_id += 1
+            self._index.add_with_ids(vector, np.asarray([entry_id], dtype="int64"))
+            expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+            self._entries[entry_id] = (params, response, list(embedding), expires_at)
+            
+            while len(self._entries) > self.maxsize:
+                self._remove(next(iter(self._entries)))
+    
+    def _remove(self, entry_id: int) -> None:
+        """Drop an entry from the index and the entry map; the caller holds the lock."""
+        import numpy as np
+        
+        del self._entries[entry_id]
+        self._index.remove_ids(np.asarray([entry_id], dtype="int64"))
+    
+    def dump(self) -> List[Tuple[List[float], Hashable, Dict[str, Any], float]]:
+        """
+        Export unexpired entries, least recently used first.
+        
+        Returns:
+            List of (embedding, params, response, seconds until expiry) tuples,
+            suitable for load()
+        """
+        now = time.monotonic()
+        with self._lock:
+            return [
+                (embedding, params, response, expires_at - now)
+                for params, response, embedding, expires_at in self._entries.values()
+                if expires_at > now
+            ]
+    
+    def load(self, entries: List[Tuple[List[float], Hashable, Dict[str, Any], float]]) -> None:
+        """Restore entries exported by dump(), keeping their remaining lifetimes."""
+        with self._lock:
+            for embedding, params, response, remaining in entries:
+                if remaining > 0:
+                    self.add(embedding, params, response, ttl=remaining)
+    
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._index = None
+            self._entries.clear()
@@ -0,0 +1,197 @@
+# src/agents/compliance_bot/server.py
+"""
+Keep a compliance agent warm in a background process.
+
+`serve` loads the agent once and answers queries over a unix socket;
+`ask` sends a single query to it, so scripted use skips the cold start
+of loading the LLM clients and the vector store.
+"""
+import os
+import sys
+import json
+import stat
+import socket
+import http.client
+from typing import Optional
+
+import typer
+
+# Keep the socket in a directory only the current user can enter, since
+# anyone who can connect to it can spend the server's API keys
+_RUNTIME_DIR = os.environ.get("XDG_RUNTIME_DIR")
+_SOCKET_DIR = (
+    os.path.join(_RUNTIME_DIR, "cloudsec-agent") if _RUNTIME_DIR
+    else os.path.expanduser("~/.cloudsec-agent")
+)
+_SOCKET_PATH = os.path.join(_SOCKET_DIR, "compliance.sock")
+
+app = typer.Typer(help="Serve the compliance agent over a unix socket")
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection over a unix domain socket."""
+    
+    def __init__(self, socket_path: str, timeout: float = 120):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+    
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+def _remove_stale_socket(socket_path: str) -> None:
+    """
+    Remove a socket left behind by a server that is no longer running.
+    
+    Exits instead if a server is still listening on the path, or if the
+    path is not a socket.
+    """
+    if not os.path.exists(socket_path):
+        return
+    
+    if not stat.S_ISSOCK(os.stat(socket_path).st_mode):
+        print(f"{socket_path} exists and is not a socket; refusing to replace it.", file=sys.stderr)
+        raise typer.Exit(1)
+    
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(socket_path)
+    except ConnectionRefusedError:
+        # Nothing is listening, so the bind would fail on the leftover file
+        os.remove(socket_path)
+        return
+    finally:
+        probe.close()
+    
+    print(f"A compliance server is already listening on {socket_path}.", file=sys.stderr)
+    raise typer.Exit(1)
+
+
+def _bind_private_socket(socket_path: str) -> socket.socket:
+    """
+    Bind a unix socket that only the current user can connect to.
+    
+    The parent directory is created with mode 0700 and the socket itself
+    is restricted to 0600.
+    
+    Args:
+        socket_path: Path to bind the socket to
+        
+    Returns:
+        The bound socket
+    """
+    socket_dir = os.path.dirname(os.path.abspath(socket_path))
+    os.makedirs(socket_dir, mode=0o700, exist_ok=True)
+    if socket_dir == os.path.abspath(_SOCKET_DIR):
+        os.chmod(socket_dir, 0o700)
+    
+    _remove_stale_socket(socket_path)
+    
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    # Create the socket file without group/other access so there is no
+    # window where another user could connect
+    old_umask = os.umask(0o177)
+    try:
+        sock.bind(socket_path)
+    finally:
+        os.umask(old_umask)
+    os.chmod(socket_path, 0o600)
+    return sock
+
+
+@app.command()
+def serve(
+    embeddings_path: str = typer.Option(
+        "data/embeddings/index",
+        "--embeddings-path", "-e",
+        help="Path to the embeddings index"
+    ),
+    use_search: bool = typer.Option(
+        True,
+        "--use-search/--no-search",
+        help="Whether to use SERPAPI for cross-verification"
+    ),
+    socket_path: str = typer.Option(
+        _SOCKET_PATH,
+        "--socket",
+        help="Unix socket to listen on"
+    )
+):
+    """Load the compliance agent once and answer queries until stopped."""
+    import uvicorn
+    from dotenv import load_dotenv
+    from fastapi import FastAPI
+    from pydantic import BaseModel
+    
+    from .agent import CloudComplianceAgent
+    
+    load_dotenv()
+    agent = CloudComplianceAgent(embeddings_path=embeddings_path, use_search=use_search)
+    agent.retriever.warm_up()
+    
+    class QueryRequest(BaseModel):
+        query: str
+        k: int = 5
+        use_search: Optional[bool] = None
+    
+    api = FastAPI()
+    
+    # A sync endpoint runs in the worker thread pool, where process_query
+    # can start its own event loop
+    @api.post("/query")
+    def query(request: QueryRequest):
+        return agent.process_query(request.query, k=request.k, use_search=request.use_search)
+    
+    # Bind the socket here rather than passing `uds=`, which makes uvicorn
+    # open it up to every local user
+    sock = _bind_private_socket(socket_path)
+    try:
+        uvicorn.Server(uvicorn.Config(api)).run(sockets=[sock])
+    finally:
+        sock.close()
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+
+
+@app.command()
+def ask(
+    query: str = typer.Argument(..., help="The compliance question"),
+    socket_path: str = typer.Option(
+        _SOCKET_PATH,
+        "--socket",
+        help="Unix socket of a running `serve` process"
+    ),
+    as_json: bool = typer.Option(
+        False,
+        "--json",
+        help="Print the full result as JSON"
+    )
+):
+    """Send a query to a running compliance server and print the answer."""
+    conn = _UnixHTTPConnection(socket_path)
+    try:
+        conn.request(
+            "POST", "/query",
+            body=json.dumps({"query": query}),
+            headers={"Content-Type": "application/json"}
+        )
+        response = conn.getresponse()
+        body = response.read()
+    except (FileNotFoundError, ConnectionRefusedError):
+        print(f"No compliance server is listening on {socket_path}; start one with `serve`.", file=sys.stderr)
+        raise typer.Exit(1)
+    finally:
+        conn.close()
+    
+    if response.status != 200:
+        print(f"Error: server returned {response.status}: {body.decode(errors='replace')}", file=sys.stderr)
+        raise typer.Exit(1)
+    
+    result = json.loads(body)
+    print(json.dumps(result, indent=2) if as_json else result["response"])
+
+
+if __name__ == "__main__":
+    app()
@@ -1,12 +1,113 @@
 # src/agents/compliance_bot/web_search.py
 import os
+import asyncio
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
 from typing import List, Dict, Any, Optional
-from serpapi import GoogleSearch
+from urllib.parse import urlsplit
 import re
 import time
-from rich.console import Console
 
-console = Console()
+from src.utils import TTLCache, run_sync
+from .search import _SERPAPI_URL, _http_session
+
+
+# Rich is imported on first output, so importing this module stays cheap
+@lru_cache(maxsize=1)
+def _console():
+    """Return the shared Rich console, creating it on first use."""
+    from rich.console import Console
+    return Console()
+
+
+@lru_cache(maxsize=None)
+def _error_prefix(label: str):
+    """
+    Styled error prefix, built once instead of parsing markup per message.
+    
+    Messages printed after it use markup=False since they hold user text.
+    """
+    from rich.text import Text
+    return Text(label, style="bold red")
+
+
+# SERPAPI responses by request parameters; results change slowly and each
+# call costs quota, so identical searches are reused for an hour
+_SEARCH_CACHE = TTLCache(maxsize=512, ttl=3600)
+
+# Patterns used on every query and search result, compiled once
+_AUTHOR_RE = re.compile(r'(?:by|author|written by)\s+([^.,]+)', re.IGNORECASE)
+_TOPIC_RE = re.compile(r'(?:about|on|regarding|related to|topic)\s+([^.,]+)', re.IGNORECASE)
+_STRIP_RE = re.compile(r'(?:by|author|written by|about|on|regarding|related to)\s+([^.,]+)')
+_QUOTED_RE = re.compile(r'"([^"]*)"')
+_CAP_RE = re.compile(r'\b([A-Z][a-zA-Z]*(?:\s+[A-Z][a-zA-Z]*)*)\b')
+_DATE_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\s+\d{1,2},?\s+\d{4}\b',
+    r'\b\d{1,2}\s+(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*,?\s+\d{4}\b',
+    r'\b\d{4}-\d{2}-\d{2}\b'
+))
+_STOPWORDS = frozenset({
+    "a", "an", "the", "in", "on", "at", "by", "for", "with", "about", "regarding",
+    "to", "of", "from", "as", "posted", "wrote", "published", "shared", "created"
+})
+# Sentence punctuation stripped from the ends of query terms ("bucket?" ->
+# "bucket"); inside a term it is kept ("node.js", "example.com")
+_TERM_PUNCTUATION = ",.;:!?"
+_ARTICLE_INDICATORS = ("article", "blog", "post", "wrote", "published", "author")
+_NAMED_AUTHOR_RE = re.compile(r"by\s+([A-Z][a-z]+\s+[A-Z][a-z]+)", re.IGNORECASE)
+_AUTHOR_VERB_RE = re.compile(r'([A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)*)\s+(?:wrote|posted|published|authored)')
+_QUERY_TOPIC_RE = re.compile(r'(?:about|on|regarding|related to)\s+(.+?)(?:\.|\?|$)')
+
+# Organic result fields used for filtering, ranking and display
+_RESULT_FIELDS = ("title", "link", "snippet")
+
+
+# Results from the same site, and snippets repeated across fallback
+# queries, are common, so both extractors remember recent inputs
+@lru_cache(maxsize=2048)
+def _extract_date(text: str) -> str:
+    """Extract a publication date from text if present."""
+    for pattern in _DATE_RES:
+        match = pattern.search(text)
+        if match:
+            return match.group(0)
+    
+    return ""
+
+
+@lru_cache(maxsize=2048)
+def _extract_source(url: str) -> str:
+    """Extract the source (domain) from a URL."""
+    if not url:
+        return ""
+    
+    # Extract domain from URL (lowercased, without port or credentials)
+    try:
+        host = urlsplit(url).hostname or ""
+    except ValueError:  # malformed URL, e.g. an unclosed IPv6 bracket
+        return ""
+    return host[4:] if host.startswith("www.") else host
+
+
+def _slim_response(results: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Keep only the parts of a SERPAPI response the searcher reads.
+    
+    Full responses carry ads, knowledge graphs and pagination data and can
+    run to hundreds of KB, which would otherwise sit in the search cache.
+    """
+    if "error" in results:
+        return {"error": results["error"]}
+    if "organic_results" not in results:
+        return {}
+    return {
+        "organic_results": [
+            {field: result[field] for field in _RESULT_FIELDS if field in result}
+            for result in results["organic_results"]
+        ]
+    }
+
 
 class WebSearcher:
     """
@@ -25,19 +126,22 @@ class WebSearcher:
         if not self.api_key:
             raise ValueError("SERPAPI API key not found. Please set SERPAPI_API_KEY environment variable.")
     
-    def find_article(self, query: str) -> Dict[str, Any]:
+    def find_article(self, query: str, speculative: bool = False) -> Dict[str, Any]:
         """
         Find articles based on a user query. This is the main method used by the CLI.
         
         Args:
             query: User's search query
+            speculative: Send the broader fallback query alongside the specific
+                one, saving a round trip on a miss at the cost of an extra
+                SERPAPI credit on every call
             
         Returns:
             Dictionary with search results and metadata
         """
         # Extract key information from query
-        author_match = re.search(r'(?:by|author|written by)\s+([^.,]+)', query, re.IGNORECASE)
-        topic_match = re.search(r'(?:about|on|regarding|related to|topic)\s+([^.,]+)', query, re.IGNORECASE)
+        author_match = _AUTHOR_RE.search(query)
+        topic_match = _TOPIC_RE.search(query)
         
         author = author_match.group(1).strip() if author_match else None
         topic = topic_match.group(1).strip() if topic_match else None
@@ -51,15 +155,17 @@ class WebSearcher:
         elif topic:
             search_query = f"{topic} security article"
             
-        # Perform search
-        try:
-            results = self._general_search(search_query)
+        # Broader query to fall back on if the specific search finds nothing
+        broader_query = _STRIP_RE.sub('', query).strip()
+        queries = [search_query]
+        if broader_query and broader_query != query:
+            queries.append(broader_query)
             
-            if not results:
-                # Try a broader search if specific search didn't yield results
-                broader_query = re.sub(r'(?:by|author|written by|about|on|regarding|related to)\s+([^.,]+)', '', query).strip()
-                if broader_query and broader_query != query:
-                    results = self._general_search(broader_query)
+        # Perform search; the broader query only runs after a miss unless
+        # the caller opts into sending both at once
+        try:
+            searches = self._general_search_many(queries) if speculative else map(self._general_search, queries)
+            results = next((found for found in searches if found), [])
             
             return {
                 "found": bool(results),
@@ -69,7 +175,7 @@ class WebSearcher:
             }
         
         except Exception as e:
-            console.print(f"[bold red]Error searching for articles:[/bold red] {str(e)}")
+            _console().print(_error_prefix("Error searching for articles:"), str(e), markup=False)
             return {
                 "found": False,
                 "query": search_query,
@@ -101,35 +207,20 @@ class WebSearcher:
             "num": max_results * 2,  # Request more to filter down to quality results
         }
         
-        console.print(f"[dim]Searching for articles by {author}{' about ' + topic if topic else ''}...[/dim]")
+        _console().print(f"Searching for articles by {author}{' about ' + topic if topic else ''}...", style="dim", markup=False)
         
         # Perform the search
-        search = GoogleSearch(search_params)
-        results = search.get_dict()
+        results = self._serpapi_get(search_params)
         
         if "error" in results:
             raise Exception(f"SERPAPI error: {results['error']}")
             
         if "organic_results" not in results or len(results["organic_results"]) == 0:
-            console.print(f"[yellow]No articles found for {author}{' about ' + topic if topic else ''}[/yellow]")
+            _console().print(f"No articles found for {author}{' about ' + topic if topic else ''}", style="yellow", markup=False)
             return []
         
         # Extract and format article results
-        articles = []
-        for result in results["organic_results"][:max_results * 2]:  # Process more to get quality results
-            if self._looks_like_article(result):
-                articles.append({
-                    "title": result.get("title", ""),
-                    "link": result.get("link", ""),
-                    "snippet": result.get("snippet", ""),
-                    "date": self._extract_date(result.get("snippet", "")),
-                    "source": self._extract_source(result.get("link", ""))
-                })
-                
-                if len(articles) >= max_results:
-                    break
-        
-        return articles
+        return self._filter_articles(results, max_results)
     
     def search_specific_content(self, query: str, max_results: int = 5) -> Dict[str, Any]:
         """
@@ -161,11 +252,10 @@ class WebSearcher:
             "num": max_results * 2,
         }
         
-        console.print(f"[dim]Searching for: {search_query}...[/dim]")
+        _console().print(f"Searching for: {search_query}...", style="dim", markup=False)
         
         # Perform the search
-        search = GoogleSearch(search_params)
-        results = search.get_dict()
+        results = self._serpapi_get(search_params)
         
         if "error" in results:
             raise Exception(f"SERPAPI error: {results['error']}")
@@ -196,95 +286,70 @@ class WebSearcher:
     def _extract_entities(self, query: str) -> List[str]:
         """Extract potential named entities from the query string."""
         # Extract quoted content first
-        quoted = re.findall(r'"([^"]*)"', query)
+        quoted = _QUOTED_RE.findall(query)
         
         # Remove quotes from the query
-        clean_query = re.sub(r'"[^"]*"', '', query)
+        clean_query = _QUOTED_RE.sub('', query)
         
         # Extract capitalized terms (potential names)
-        capitalized = re.findall(r'\b([A-Z][a-zA-Z]*(?:\s+[A-Z][a-zA-Z]*)*)\b', clean_query)
-        
-        # Extract other potentially important terms
-        important_terms = [word for word in clean_query.split() if word.lower() not in 
-                          {"a", "an", "the", "in", "on", "at", "by", "for", "with", "about", "regarding",
-                           "to", "of", "from", "as", "posted", "wrote", "published", "shared", "created"}]
+        capitalized = _CAP_RE.findall(clean_query)
         
         # Combine all entities, prioritizing quoted and capitalized
         all_entities = quoted + capitalized
         
+        # Terms never contain whitespace, so a substring of the newline-joined
+        # entities is a substring of one of them
+        lowered = "\n".join(entity.lower() for entity in all_entities)
+        
         # Add other important terms that aren't already included
-        for term in important_terms:
-            if not any(term.lower() in entity.lower() for entity in all_entities):
-                all_entities.append(term)
+        for term in clean_query.split():
+            term = term.strip(_TERM_PUNCTUATION)
+            term_lower = term.lower()
+            if not term or term_lower in _STOPWORDS or term_lower in lowered:
+                continue
+            all_entities.append(term)
+            lowered += "\n" + term_lower
                 
         return all_entities
     
     def _looks_like_article(self, result: Dict[str, Any]) -> bool:
         """Check if a search result looks like it points to an article."""
-        snippet = result.get("snippet", "").lower()
-        title = result.get("title", "").lower()
+        snippet = result.get("snippet", "")
         
-        # Check if title or snippet contains article-like indicators
-        article_indicators = ["article", "blog", "post", "wrote", "published", "author"]
-        date_pattern = r'\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\s+\d{1,2},?\s+\d{4}\b'
-        
-        # Check for indicators
-        for indicator in article_indicators:
-            if indicator in title or indicator in snippet:
-                return True
-                
-        # Check for dates (often indicates an article)
-        if re.search(date_pattern, snippet, re.IGNORECASE):
+        # Check if title or snippet contains article-like indicators; one
+        # lowered blob, with a newline so a match can't span the two
+        blob = f'{result.get("title", "")}\n{snippet}'.lower()
+        if any(indicator in blob for indicator in _ARTICLE_INDICATORS):
             return True
-            
-        return False
+                
+        # Check for dates (often indicates an article); the pattern ignores case
+        return _DATE_RES[0].search(snippet) is not None
     
     def _extract_date(self, text: str) -> str:
         """Extract a publication date from text if present."""
-        date_patterns = [
-            r'\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\s+\d{1,2},?\s+\d{4}\b',
-            r'\b\d{1,2}\s+(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*,?\s+\d{4}\b',
-            r'\b\d{4}-\d{2}-\d{2}\b'
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(0)
-                
-        return ""
+        return _extract_date(text)
     
     def _extract_source(self, url: str) -> str:
         """Extract the source (domain) from a URL."""
-        if not url:
-            return ""
-            
-        # Extract domain from URL
-        domain_match = re.search(r'https?://(?:www\.)?([^/]+)', url)
-        if domain_match:
-            return domain_match.group(1)
-            
-        return ""
+        return _extract_source(url)
     
     def _process_and_rank_results(self, results: List[Dict[str, Any]], entities: List[str]) -> List[Dict[str, Any]]:
         """Process and rank search results based on relevance to extracted entities."""
         processed = []
+        lowered_entities = [entity.lower() for entity in entities]
         
         for result in results:
             # Calculate a relevance score based on how many entities appear in title and snippet
             title = result.get("title", "").lower()
-            snippet = result.get("snippet", "").lower()
-            content = title + " " + snippet
+            content = title + " " + result.get("snippet", "").lower()
             
-            # Calculate relevance score
+            # Calculate relevance score, awarding points based on where the entity appears
             score = 0
-            for entity in entities:
-                if entity.lower() in content:
-                    # Award points based on where the entity appears
-                    if entity.lower() in title:
-                        score += 3  # Higher weight for title matches
-                    else:
-                        score += 1  # Lower weight for snippet matches
+            for entity in lowered_entities:
+                if entity in title:
+                    score += 3  # Higher weight for title matches
+                elif entity in content:
+                    score += 1  # Lower weight for snippet matches
             
             # Add result with score
             processed.append({
@@ -297,8 +362,67 @@ class WebSearcher:
             })
         
         # Sort by relevance score (highest first)
-        return sorted(processed, key=lambda x: x["relevance_score"], reverse=True)
+        return sorted(processed, key=itemgetter("relevance_score"), reverse=True)
+
 
+    def clear_cache(self) -> None:
+        """Forget cached SERPAPI responses."""
+        _SEARCH_CACHE.clear()
+    
+    def _cache_key(self, params: Dict[str, Any]) -> tuple:
+        """Cache key for a SERPAPI request (engine, query, num, region), ignoring the API key."""
+        return tuple(sorted((k, v) for k, v in params.items() if k != "api_key"))
+    
+    def _remember(self, key: tuple, results: Dict[str, Any]) -> Dict[str, Any]:
+        """Slim down a SERPAPI response and cache it unless it reports an error."""
+        results = _slim_response(results)
+        if "error" not in results:
+            _SEARCH_CACHE.set(key, results)
+        return results
+    
+    def _serpapi_get(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Run one SERPAPI query over the shared keep-alive HTTP session."""
+        key = self._cache_key(params)
+        cached = _SEARCH_CACHE.get(key)
+        if cached is not None:
+            return cached
+        
+        return self._remember(key, _http_session().get(_SERPAPI_URL, params=params, timeout=30).json())
+    
+    def _general_search_params(self, query: str, max_results: int) -> Dict[str, Any]:
+        """Build SERPAPI parameters for a general article search."""
+        return {
+            "engine": "google",
+            "q": f"{query} security article",
+            "api_key": self.api_key,
+            "num": max_results * 2,  # Request more to filter down
+            "gl": "us",  # Set region to US for consistent results
+        }
+    
+    def _filter_articles(self, results: Dict[str, Any], max_results: int) -> List[Dict[str, Any]]:
+        """Keep the organic results that look like articles, up to max_results."""
+        # Check if we have organic results
+        if "organic_results" not in results:
+            return []
+            
+        # Process and filter results, looking at no more than we asked SERPAPI for
+        article_results = []
+        for result in islice(results["organic_results"], max_results * 2):
+            if self._looks_like_article(result):
+                link = result.get("link", "")
+                snippet = result.get("snippet", "")
+                article_results.append({
+                    "title": result.get("title", ""),
+                    "link": link,
+                    "snippet": snippet,
+                    "date": self._extract_date(snippet),
+                    "source": self._extract_source(link),
+                })
+                
+                if len(article_results) >= max_results:
+                    break
+                    
+        return article_results
 
     def _general_search(self, query: str, max_results: int = 5) -> List[Dict[str, Any]]:
         """
@@ -311,52 +435,78 @@ class WebSearcher:
         Returns:
             List of article information
         """
-        search_params = {
-            "engine": "google",
-            "q": f"{query} security article",
-            "api_key": self.api_key,
-            "num": max_results * 2,  # Request more to filter down
-            "gl": "us",  # Set region to US for consistent results
-        }
-        
         try:
-            search = GoogleSearch(search_params)
-            results = search.get_dict()
-            
-            # Check if we have organic results
-            if "organic_results" not in results:
-                return []
-                
-            # Process and filter results
-            article_results = []
-            for result in results["organic_results"][:max_results*2]:
-                if self._looks_like_article(result):
-                    article_results.append({
-                        "title": result.get("title", ""),
-                        "link": result.get("link", ""),
-                        "snippet": result.get("snippet", ""),
-                        "date": self._extract_date(result.get("snippet", "")),
-                        "source": self._extract_source(result.get("link", "")),
-                    })
-                    
-                    if len(article_results) >= max_results:
-                        break
-                        
-            return article_results
+            results = self._serpapi_get(self._general_search_params(query, max_results))
+            return self._filter_articles(results, max_results)
             
         except Exception as e:
-            console.print(f"[bold red]Search error:[/bold red] {str(e)}")
+            _console().print(_error_prefix("Search error:"), str(e), markup=False)
             return []
+    
+    def _general_search_many(self, queries: List[str], max_results: int = 5) -> List[List[Dict[str, Any]]]:
+        """
+        Run general searches for several queries concurrently.
+        
+        Args:
+            queries: Search queries
+            max_results: Maximum number of results per query
+            
+        Returns:
+            One list of article information per query, in order
+        """
+        if len(queries) == 1:
+            return [self._general_search(queries[0], max_results)]
+        return run_sync(self._general_search_many_async(queries, max_results))
+    
+    async def _general_search_many_async(self, queries: List[str], max_results: int = 5) -> List[List[Dict[str, Any]]]:
+        """Async implementation of _general_search_many; each search reuses the shared HTTP pool."""
+        return list(await asyncio.gather(
+            *(asyncio.to_thread(self._general_search, query, max_results) for query in queries)
+        ))
+
+
+def _primary_search(searcher: WebSearcher, query: str) -> Dict[str, Any]:
+    """Run the main search for find_article: by named author if present, otherwise general."""
+    # Extract topic and author if present
+    if _NAMED_AUTHOR_RE.search(query):
+        return searcher.search_specific_content(query)
+        
+    # Use general search
+    article_results = searcher._general_search(query)
+    
+    if article_results:
+        return {
+            "found": True,
+            "query": query,
+            "results": article_results,
+            "count": len(article_results)
+        }
+    return {"found": False, "query": query, "results": [], "count": 0}
+
+
+async def _find_article_searches(searcher: WebSearcher, query: str,
+                                 author: Optional[str], topic: Optional[str]) -> list:
+    """Run the main search and, when an author was named, the author search concurrently."""
+    searches = [asyncio.to_thread(_primary_search, searcher, query)]
+    if author:
+        searches.append(asyncio.to_thread(searcher.search_article, author, topic))
+    return await asyncio.gather(*searches, return_exceptions=True)
 
 
 # Example usage function (not used directly by the CLI)
 # Function to expose to the CLI
-def find_article(query: str) -> Dict[str, Any]:
+def find_article(query: str, speculative: bool = False) -> Dict[str, Any]:
     """
     Find articles or specific content based on a natural language query.
     
+    When an author is named and the main search finds nothing, a direct
+    author search is tried next.
+    
     Args:
         query: Natural language query (e.g., "articles about AWS security best practices")
+        speculative: Run the author search alongside the main search, saving
+            a round trip on a miss at the cost of an extra SERPAPI credit
+            on every call
         
     Returns:
         Dict with search results and information
@@ -364,51 +514,41 @@ def find_article(query: str) -> Dict[str, Any]:
     try:
         searcher = WebSearcher()
         
-        # Extract topic and author if present
-        author_match = re.search(r"by\s+([A-Z][a-z]+\s+[A-Z][a-z]+)", query, re.IGNORECASE)
-        
+        # Try extracting author name if query looks like it's asking about a specific author
+        author = topic = None
+        author_match = _AUTHOR_VERB_RE.search(query)
         if author_match:
             author = author_match.group(1)
-            results = searcher.search_specific_content(query)
-        else:
-            # Use general search
-            article_results = searcher._general_search(query)
             
-            if article_results:
-                results = {
-                    "found": True,
+            # Extract topic if present
+            topic_match = _QUERY_TOPIC_RE.search(query)
+            topic = topic_match.group(1) if topic_match else None
+        
+        if speculative:
+            outcomes = run_sync(_find_article_searches(searcher, query, author, topic))
+        else:
+            outcomes = [_primary_search(searcher, query)]
+        results = outcomes[0]
+        if isinstance(results, Exception):
+            raise results
+        
+        # Check if we found any results; the author search only matters on a miss
+        if not results["found"] and author:
+            author_results = outcomes[1] if speculative else searcher.search_article(author, topic)
+            if isinstance(author_results, Exception):
+                raise author_results
+            if author_results:
+                return {
                     "query": query,
-                    "results": article_results,
-                    "count": len(article_results)
+                    "found": True,
+                    "message": f"Found {len(author_results)} articles by {author}",
+                    "results": author_results
                 }
-            else:
-                results = {"found": False, "query": query, "results": [], "count": 0}
-        
-        # Check if we found any results
-        if not results["found"]:
-            # Try extracting author name if query looks like it's asking about a specific author
-            author_match = re.search(r'([A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)*)\s+(?:wrote|posted|published|authored)', query)
-            if author_match:
-                author = author_match.group(1)
-                
-                # Extract topic if present
-                topic_match = re.search(r'(?:about|on|regarding|related to)\s+(.+?)(?:\.|\?|$)', query)
-                topic = topic_match.group(1) if topic_match else None
-                
-                # Try direct author search
-                author_results = searcher.search_article(author, topic)
-                if author_results:
-                    return {
-                        "query": query,
-                        "found": True,
-                        "message": f"Found {len(author_results)} articles by {author}",
-                        "results": author_results
-                    }
         
         return results
         
     except Exception as e:
-        console.print(f"[bold red]Error:[/bold red] {str(e)}")
+        _console().print(_error_prefix("Error:"), str(e), markup=False)
         return {
             "query": query,
             "found": False,
@@ -422,20 +562,29 @@ if __name__ == "__main__":
     query = "Maciej Pocwierz posted an article regarding S3 bucket"
     results = find_article(query)
     
-    console = Console()
+    from rich.table import Table
+    from rich.text import Text
+    
+    console = _console()
     
     if results["found"]:
         console.print(f"\n[bold green]Found results for:[/bold green] {results['query']}\n")
         
+        # One table renders in a single layout pass
+        table = Table(show_lines=True)
+        table.add_column("#", style="bold cyan")
+        table.add_column("Article")
+        table.add_column("Source", style="dim")
+        table.add_column("Date", style="dim")
+        
         for i, result in enumerate(results["results"], 1):
-            console.print(f"[bold cyan]{i}. {result['title']}[/bold cyan]")
-            if result.get("date"):
-                console.print(f"[dim]Date: {result['date']}[/dim]")
-            console.print(f"[dim]Source: {result['source']}[/dim]")
-            console.print(f"{result['snippet']}")
-            console.print(f"[link={result['link']}]{result['link']}[/link]")
-            console.print()
+            article = Text(result["title"], style="bold cyan")
+            article.append(f"\n{result['snippet']}\n", style="default")
+            article.append(result["link"], style=f"link {result['link']}")
+            table.add_row(str(i), article, result["source"], result.get("date") or "")
+        
+        console.print(table)
     else:
         console.print(f"\n[yellow]No results found for:[/yellow] {results['query']}")
         if "error" in results:
-            console.print(f"[red]Error: {results['error']}[/red]")
+            console.print(_error_prefix("Error:"), results["error"], style="red", markup=False)
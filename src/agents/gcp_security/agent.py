@@ -7,9 +7,12 @@ It supports IAM analysis, storage security, compute security, and networking.
 """
 
 import os
+import re
 import json
+import asyncio
 import logging
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Any, Optional
 from datetime import datetime
 
 from google.cloud.resourcemanager_v3 import ProjectsClient
@@ -26,6 +29,7 @@ from rich import box
 from src.audit import GCPAuditReport
 from src.audit.exporters import JSONExporter, CSVExporter, HTMLExporter
 from src.remediation import PlaybookExecutor, PlaybookLibrary
+from src.utils import TTLCache, hash_key
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -33,20 +37,82 @@ logger = logging.getLogger(__name__)
 
 console = Console()
 
+# Bucket and instance listings, shared by all agents in the process; back-to-back
+# commands on the same project reuse them for five minutes
+_LIST_CACHE = TTLCache(maxsize=256, ttl=300)
+
+# Keywords that select each security check, compiled to one pattern per check
+_COMMAND_KEYWORDS = (
+    ("iam_analysis", ("iam", "role", "permission", "service account")),
+    ("storage_analysis", ("storage", "bucket", "gcs", "cloud storage")),
+    ("compute_analysis", ("compute", "instance", "vm", "virtual machine")),
+    ("sql_analysis", ("sql", "database", "cloudsql")),
+    ("network_analysis", ("network", "vpc", "firewall")),
+)
+_COMMAND_PATTERNS = tuple(
+    (command, re.compile("|".join(map(re.escape, keywords))))
+    for command, keywords in _COMMAND_KEYWORDS
+)
+
+# Static parts of the IAM, SQL and network reports, joined once at import
+_IAM_REPORT_TEMPLATE = "\n".join([
+    "[bold]IAM Security Analysis for {project}[/bold]\n",
+    "[bold]Recommended IAM Security Best Practices:[/bold]",
+    "1. Use service accounts instead of user accounts for applications",
+    "2. Apply principle of least privilege",
+    "3. Regularly audit IAM bindings",
+    "4. Use Cloud Audit Logs to track IAM changes",
+    "5. Enable Organization Policy for access control",
+    "6. Use custom roles instead of built-in roles when applicable",
+    "7. Regularly remove unused service accounts",
+    "8. Implement group-based access management",
+    "\n[bold]Common IAM Security Issues to Check:[/bold]",
+    "• allUsers or allAuthenticatedUsers with sensitive roles",
+    "• User accounts with Owner or Editor roles",
+    "• Service accounts with overly broad permissions",
+    "• Unused or inactive service accounts",
+    "• Missing API access logging",
+])
+_SQL_REPORT = "\n".join([
+    "[bold]Cloud SQL Security Analysis[/bold]\n",
+    "[yellow]Cloud SQL analysis requires additional authentication setup[/yellow]",
+    "\n[bold]Recommended Cloud SQL Security Practices:[/bold]",
+    "1. Enable SSL/TLS for all connections",
+    "2. Use private IP addresses",
+    "3. Enable automated backups",
+    "4. Use Cloud SQL Auth Proxy",
+    "5. Restrict network access",
+    "6. Enable Binary Logging",
+])
+_NETWORK_REPORT = "\n".join([
+    "[bold]VPC and Network Security Analysis[/bold]\n",
+    "[bold]Recommended Network Security Practices:[/bold]",
+    "1. Use VPC Service Controls for sensitive data",
+    "2. Enable VPC Flow Logs for monitoring",
+    "3. Use Cloud Armor for DDoS protection",
+    "4. Implement least privilege firewall rules",
+    "5. Use Cloud NAT for outbound traffic",
+    "6. Enable Private Google Access",
+    "7. Monitor network traffic with VPC Flow Logs",
+])
+
 class GCPSecurityAgent:
     """
     An agent for assessing and analyzing security in Google Cloud Platform.
     Supports IAM, Storage, Compute, SQL, and Networking security checks.
     """
     
-    def __init__(self, project_id: Optional[str] = None, google_api_key: Optional[str] = None):
+    def __init__(self, project_id: Optional[str] = None, google_api_key: Optional[str] = None,
+                 cache_enabled: bool = True):
         """
         Initialize the GCP Security Agent.
         
         Args:
             project_id: GCP project ID (defaults to environment variable)
             google_api_key: Google API key for Gemini LLM
+            cache_enabled: Reuse bucket and instance listings for up to five minutes
         """
+        self.cache_enabled = cache_enabled
         self.project_id = project_id or os.getenv("GOOGLE_CLOUD_PROJECT")
         if not self.project_id:
             raise ValueError(
@@ -137,33 +203,8 @@ class GCPSecurityAgent:
         """
         console.print(Panel("[bold blue]Analyzing IAM Security...[/bold blue]"))
         
-        analysis = []
-        
-        try:
-            # Note: Getting IAM policy requires service account credentials
-            analysis.append(f"[bold]IAM Security Analysis for {self.project_id}[/bold]\n")
-            
-            analysis.append("[bold]Recommended IAM Security Best Practices:[/bold]")
-            analysis.append("1. Use service accounts instead of user accounts for applications")
-            analysis.append("2. Apply principle of least privilege")
-            analysis.append("3. Regularly audit IAM bindings")
-            analysis.append("4. Use Cloud Audit Logs to track IAM changes")
-            analysis.append("5. Enable Organization Policy for access control")
-            analysis.append("6. Use custom roles instead of built-in roles when applicable")
-            analysis.append("7. Regularly remove unused service accounts")
-            analysis.append("8. Implement group-based access management")
-            
-            analysis.append("\n[bold]Common IAM Security Issues to Check:[/bold]")
-            analysis.append("• allUsers or allAuthenticatedUsers with sensitive roles")
-            analysis.append("• User accounts with Owner or Editor roles")
-            analysis.append("• Service accounts with overly broad permissions")
-            analysis.append("• Unused or inactive service accounts")
-            analysis.append("• Missing API access logging")
-            
-        except Exception as e:
-            analysis.append(f"[bold red]Error analyzing IAM:[/bold red] {str(e)}")
-        
-        return "\n".join(analysis)
+        # Note: Getting IAM policy requires service account credentials
+        return _IAM_REPORT_TEMPLATE.format(project=self.project_id)
     
     def analyze_storage_security(self, bucket_name: Optional[str] = None) -> str:
         """
@@ -184,7 +225,7 @@ class GCPSecurityAgent:
             if bucket_name:
                 buckets = [self.storage_client.get_bucket(bucket_name)]
             else:
-                buckets = self.storage_client.list_buckets()
+                buckets = self._list_buckets()
             
             if not buckets:
                 analysis.append("[yellow]No buckets found in project[/yellow]")
@@ -199,27 +240,21 @@ class GCPSecurityAgent:
             table.add_column("Risk Level", style="magenta")
             
             findings = []
-            
             for bucket in buckets:
                 bucket_findings = self._analyze_bucket_security(bucket)
                 findings.extend(bucket_findings)
                 
-                versioning_status = "✓ Enabled" if bucket.versioning_enabled else "✗ Disabled"
-                encryption_status = "✓ Enabled" if bucket.encryption else "✗ Disabled"
-                
-                # Check public access
+                # Read each setting once; the public access check is an IAM call
+                versioning = bool(bucket.versioning_enabled)
+                encryption = bool(bucket.encryption)
                 public_access = self._check_bucket_public_access(bucket)
-                public_status = "✗ Public" if public_access else "✓ Private"
-                
-                # Determine risk level
-                risk_level = self._calculate_bucket_risk(bucket)
                 
                 table.add_row(
                     bucket.name,
-                    versioning_status,
-                    encryption_status,
-                    public_status,
-                    risk_level
+                    "✓ Enabled" if versioning else "✗ Disabled",
+                    "✓ Enabled" if encryption else "✗ Disabled",
+                    "✗ Public" if public_access else "✓ Private",
+                    self._bucket_risk_level(versioning, encryption, public_access)
                 )
             
             console.print(table)
@@ -257,17 +292,16 @@ class GCPSecurityAgent:
             findings = []
             instance_count = 0
             
-            for z in zones:
-                instances = self.compute_client.list(
-                    project=self.project_id,
-                    zone=z
-                )
-                
+            listings, zone_errors = self._list_instances(zones)
+            for z, instances in listings:
                 for instance in instances:
                     instance_count += 1
                     instance_findings = self._analyze_instance_security(instance, z)
                     findings.extend(instance_findings)
             
+            for z, error in zone_errors:
+                analysis.append(f"[yellow]Could not list instances in zone {z}:[/yellow] {error}")
+            
             if instance_count == 0:
                 analysis.append("[yellow]No Compute Engine instances found[/yellow]")
             else:
@@ -298,25 +332,9 @@ class GCPSecurityAgent:
         """
         console.print(Panel("[bold blue]Analyzing Cloud SQL Security...[/bold blue]"))
         
-        analysis = []
-        analysis.append("[bold]Cloud SQL Security Analysis[/bold]\n")
-        
-        try:
-            # Note: Cloud SQL API might require different authentication
-            # This is a placeholder for the implementation
-            analysis.append("[yellow]Cloud SQL analysis requires additional authentication setup[/yellow]")
-            analysis.append("\n[bold]Recommended Cloud SQL Security Practices:[/bold]")
-            analysis.append("1. Enable SSL/TLS for all connections")
-            analysis.append("2. Use private IP addresses")
-            analysis.append("3. Enable automated backups")
-            analysis.append("4. Use Cloud SQL Auth Proxy")
-            analysis.append("5. Restrict network access")
-            analysis.append("6. Enable Binary Logging")
-            
-        except Exception as e:
-            analysis.append(f"[bold red]Error analyzing SQL:[/bold red] {str(e)}")
-        
-        return "\n".join(analysis)
+        # Note: Cloud SQL API might require different authentication
+        # This is a placeholder for the implementation
+        return _SQL_REPORT
     
     def analyze_network_security(self) -> str:
         """
@@ -325,82 +343,54 @@ class GCPSecurityAgent:
         Returns:
             Network security analysis as formatted string
         """
-        analysis = []
-        analysis.append("[bold]VPC and Network Security Analysis[/bold]\n")
-        
-        try:
-            analysis.append("[bold]Recommended Network Security Practices:[/bold]")
-            analysis.append("1. Use VPC Service Controls for sensitive data")
-            analysis.append("2. Enable VPC Flow Logs for monitoring")
-            analysis.append("3. Use Cloud Armor for DDoS protection")
-            analysis.append("4. Implement least privilege firewall rules")
-            analysis.append("5. Use Cloud NAT for outbound traffic")
-            analysis.append("6. Enable Private Google Access")
-            analysis.append("7. Monitor network traffic with VPC Flow Logs")
-            
-        except Exception as e:
-            analysis.append(f"[bold red]Error analyzing network:[/bold red] {str(e)}")
-        
-        return "\n".join(analysis)
+        return _NETWORK_REPORT
     
     # Helper methods
     
     def _parse_command(self, user_input: str) -> List[tuple]:
         """Parse natural language command to specific checks."""
         user_input_lower = user_input.lower()
-        commands = []
-        
-        if any(word in user_input_lower for word in ["iam", "role", "permission", "service account"]):
-            commands.append(("iam_analysis", {}))
-        if any(word in user_input_lower for word in ["storage", "bucket", "gcs", "cloud storage"]):
-            commands.append(("storage_analysis", {}))
-        if any(word in user_input_lower for word in ["compute", "instance", "vm", "virtual machine"]):
-            commands.append(("compute_analysis", {}))
-        if any(word in user_input_lower for word in ["sql", "database", "cloudsql"]):
-            commands.append(("sql_analysis", {}))
-        if any(word in user_input_lower for word in ["network", "vpc", "firewall"]):
-            commands.append(("network_analysis", {}))
+        commands = [
+            (command, {})
+            for command, pattern in _COMMAND_PATTERNS
+            if pattern.search(user_input_lower)
+        ]
         
         # If no specific command detected, return empty
         return commands if commands else [("iam_analysis", {})]
     
-    def _analyze_iam_bindings(self, bindings: List[Any]) -> List[Dict[str, str]]:
-        """Analyze IAM bindings for security issues."""
+    def _tally_iam(self, bindings: List[Any]) -> tuple:
+        """
+        Walk IAM bindings once, counting members and flagging public access.
+        
+        Args:
+            bindings: IAM policy bindings
+            
+        Returns:
+            (service account count, external user count, findings) tuple
+        """
+        service_accounts = 0
+        external_users = 0
         findings = []
         
         for binding in bindings:
             role = binding.role
-            members = binding.members
-            
             # Check for overly permissive roles
-            if "Owner" in role or "Editor" in role:
-                for member in members:
-                    if member == "allUsers" or member == "allAuthenticatedUsers":
-                        findings.append({
-                            "issue": f"Overly permissive role {role} assigned to {member}",
-                            "severity": "Critical",
-                            "recommendation": "Remove public access and use specific service accounts instead"
-                        })
-        
-        return findings
-    
-    def _count_service_accounts(self, bindings: List[Any]) -> int:
-        """Count service accounts in IAM bindings."""
-        count = 0
-        for binding in bindings:
-            for member in binding.members:
-                if "serviceAccount" in member:
-                    count += 1
-        return count
-    
-    def _count_external_users(self, bindings: List[Any]) -> int:
-        """Count external users in IAM bindings."""
-        count = 0
-        for binding in bindings:
+            overly_permissive = "Owner" in role or "Editor" in role
+            
             for member in binding.members:
-                if "@" in member and "serviceAccount" not in member:
-                    count += 1
-        return count
+                is_service_account = "serviceAccount" in member
+                service_accounts += is_service_account
+                external_users += "@" in member and not is_service_account
+                
+                if overly_permissive and member in ("allUsers", "allAuthenticatedUsers"):
+                    findings.append({
+                        "issue": f"Overly permissive role {role} assigned to {member}",
+                        "severity": "Critical",
+                        "recommendation": "Remove public access and use specific service accounts instead"
+                    })
+        
+        return service_accounts, external_users, findings
     
     def _analyze_bucket_security(self, bucket: Any) -> List[Dict[str, str]]:
         """Analyze individual bucket for security issues."""
@@ -421,7 +411,15 @@ class GCPSecurityAgent:
         return findings
     
     def _check_bucket_public_access(self, bucket: Any) -> bool:
-        """Check if bucket has public access."""
+        """
+        Check if bucket has public access.
+        
+        Args:
+            bucket: The bucket to check
+            
+        Returns:
+            True if allUsers or allAuthenticatedUsers have any binding
+        """
         try:
             for policy in bucket.iam.get_bindings().values():
                 for member in policy:
@@ -433,14 +431,16 @@ class GCPSecurityAgent:
     
     def _calculate_bucket_risk(self, bucket: Any) -> str:
         """Calculate risk level for a bucket."""
-        risk_score = 0
-        
-        if not bucket.versioning_enabled:
-            risk_score += 2
-        if not bucket.encryption:
-            risk_score += 2
-        if self._check_bucket_public_access(bucket):
-            risk_score += 3
+        return self._bucket_risk_level(
+            bool(bucket.versioning_enabled),
+            bool(bucket.encryption),
+            self._check_bucket_public_access(bucket)
+        )
+    
+    @staticmethod
+    def _bucket_risk_level(versioning: bool, encryption: bool, public_access: bool) -> str:
+        """Calculate a bucket's risk level from its already-fetched settings."""
+        risk_score = 2 * (not versioning) + 2 * (not encryption) + 3 * public_access
         
         if risk_score >= 5:
             return "[bold red]High[/bold red]"
@@ -481,6 +481,88 @@ class GCPSecurityAgent:
             pass
         return False
     
+    def clear_cache(self) -> None:
+        """Drop cached bucket and instance listings so the next call fetches fresh ones."""
+        _LIST_CACHE.clear()
+    
+    def _cached_list(self, resource: str, fetch, *params: Any) -> Iterable[Any]:
+        """
+        Return a resource listing for this project, from the cache when possible.
+        
+        Args:
+            resource: Kind of resource listed (e.g. "buckets", "instances")
+            fetch: Callable performing the API call and returning an iterable
+            params: Extra values identifying the listing (e.g. the zone)
+            
+        Returns:
+            The cached list on a hit; otherwise an iterator over the resources
+            as their pages arrive
+        """
+        if not self.cache_enabled:
+            return fetch()
+        
+        key = hash_key(self.project_id, resource, *params)
+        cached = _LIST_CACHE.get(key)
+        if cached is not None:
+            logger.debug(f"List cache hit: {resource} {params}")
+            return cached
+        
+        logger.debug(f"List cache miss: {resource} {params}")
+        return self._iter_and_cache(key, fetch())
+    
+    @staticmethod
+    def _iter_and_cache(key: str, items: Iterable[Any]) -> Iterator[Any]:
+        """Yield items as they arrive, caching the full listing once iteration completes."""
+        seen = []
+        for item in items:
+            seen.append(item)
+            yield item
+        # Only complete listings are cached; an abandoned iteration caches nothing
+        _LIST_CACHE.set(key, seen)
+    
+    def _list_buckets(self) -> Iterable[Any]:
+        """List the project's Cloud Storage buckets, fetched in pages of 200."""
+        return self._cached_list("buckets", lambda: self.storage_client.list_buckets(page_size=200))
+    
+    def _list_instances(self, zones: List[str], max_workers: int = 16) -> tuple:
+        """
+        List Compute Engine instances in several zones concurrently.
+        
+        A zone that fails (missing permission, zone not enabled) is reported
+        and skipped; the other zones are still listed.
+        
+        Args:
+            zones: Zones to list
+            max_workers: Maximum number of concurrent list calls
+            
+        Returns:
+            ((zone, instances) pairs in zone order, (zone, error message) pairs)
+        """
+        if not zones:
+            return [], []
+        
+        def list_zone(z):
+            try:
+                return list(self._cached_list(
+                    "instances",
+                    lambda: self.compute_client.list(
+                        request={"project": self.project_id, "zone": z, "max_results": 500}
+                    ),
+                    z
+                )), None
+            except Exception as e:
+                logger.warning(f"Could not list instances in zone {z}: {e}")
+                return None, str(e)
+        
+        # Each zone is a separate blocking API round-trip; the client is
+        # thread-safe, so the workers share it
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(zones))) as pool:
+            results = list(pool.map(list_zone, zones))
+        
+        listings = [(z, instances) for z, (instances, error) in zip(zones, results) if error is None]
+        errors = [(z, error) for z, (_, error) in zip(zones, results) if error is not None]
+        return listings, errors
+    
     def _get_all_zones(self) -> List[str]:
         """Get all zones in the project."""
         # Placeholder for getting all zones
@@ -499,29 +581,86 @@ class GCPSecurityAgent:
         """
         console.print("[bold cyan]Starting Comprehensive GCP Audit...[/bold cyan]\n")
         
+        # An audit reports current state; later commands reuse its listings
+        self.clear_cache()
+        
         # Create audit report
         audit_report = GCPAuditReport(self.project_id)
         
-        # 1. IAM Security Analysis
-        console.print("[yellow]Analyzing IAM Security...[/yellow]")
-        iam_analysis = self._audit_iam_security()
-        audit_report.add_iam_analysis(iam_analysis)
+        # The audit phases are independent API passes, so run them
+        # concurrently; the report is only updated from this thread, in the
+        # canonical section order
+        phases = self._audit_phases(audit_report)
+        
+        with ThreadPoolExecutor(max_workers=len(phases)) as executor:
+            futures = []
+            for label, audit_phase, add_analysis in phases:
+                console.print(f"[yellow]Analyzing {label}...[/yellow]")
+                futures.append((executor.submit(audit_phase), add_analysis))
+            
+            for future, add_analysis in futures:
+                add_analysis(future.result())
+        
+        return self._finish_audit(audit_report, export_pdf)
+    
+    async def perform_full_audit_async(self, export_pdf: bool = True) -> Dict[str, Any]:
+        """
+        Async variant of perform_full_audit.
+        
+        Audit phases run concurrently in worker threads via asyncio.gather,
+        and PDF generation is awaited off the event loop.
         
-        # 2. Cloud Storage Security Analysis
-        console.print("[yellow]Analyzing Cloud Storage Security...[/yellow]")
-        storage_analysis = self._audit_storage_security()
-        audit_report.add_storage_analysis(storage_analysis)
+        Args:
+            export_pdf: Whether to export results as PDF
+            
+        Returns:
+            Audit report dictionary with results and PDF path
+        """
+        console.print("[bold cyan]Starting Comprehensive GCP Audit...[/bold cyan]\n")
         
-        # 3. Compute Engine Security Analysis
-        console.print("[yellow]Analyzing Compute Engine Security...[/yellow]")
-        compute_analysis = self._audit_compute_security()
-        audit_report.add_compute_analysis(compute_analysis)
+        self.clear_cache()
+        audit_report = GCPAuditReport(self.project_id)
+        phases = self._audit_phases(audit_report)
+        for label, _, _ in phases:
+            console.print(f"[yellow]Analyzing {label}...[/yellow]")
+        
+        # gather preserves order, so sections are added in canonical order
+        results = await asyncio.gather(
+            *(asyncio.to_thread(audit_phase) for _, audit_phase, _ in phases)
+        )
+        for (_, _, add_analysis), result in zip(phases, results):
+            add_analysis(result)
+        
+        return await asyncio.to_thread(self._finish_audit, audit_report, export_pdf)
+    
+    def _audit_phases(self, audit_report: GCPAuditReport) -> List[tuple]:
+        """
+        List the audit phases in report order.
         
-        # 4. VPC & Network Security Analysis
-        console.print("[yellow]Analyzing VPC & Network Security...[/yellow]")
-        network_analysis = self._audit_network_security()
-        audit_report.add_network_analysis(network_analysis)
+        Args:
+            audit_report: Report the phase results are added to
+            
+        Returns:
+            List of (label, audit function, report add method) tuples
+        """
+        return [
+            ("IAM Security", self._audit_iam_security, audit_report.add_iam_analysis),
+            ("Cloud Storage Security", self._audit_storage_security, audit_report.add_storage_analysis),
+            ("Compute Engine Security", self._audit_compute_security, audit_report.add_compute_analysis),
+            ("VPC & Network Security", self._audit_network_security, audit_report.add_network_analysis),
+        ]
+    
+    def _finish_audit(self, audit_report: GCPAuditReport, export_pdf: bool) -> Dict[str, Any]:
+        """
+        Render the summary and optional PDF for a populated audit report.
         
+        Args:
+            audit_report: Report with all sections added
+            export_pdf: Whether to export results as PDF
+            
+        Returns:
+            Audit report dictionary with results and PDF path
+        """
         console.print()
         
         # Display summary
@@ -604,12 +743,15 @@ class GCPSecurityAgent:
             if not self.storage_client:
                 raise Exception("Storage client not initialized")
             
-            buckets = list(self.storage_client.list_buckets())
+            # Tally in a single pass as pages arrive
+            total_buckets = 0
             public_buckets = 0
             unencrypted_buckets = 0
             no_versioning_buckets = 0
             
-            for bucket in buckets:
+            for bucket in self._list_buckets():
+                total_buckets += 1
+                
                 # Check public access
                 try:
                     policy = bucket.iam_configuration
@@ -623,7 +765,6 @@ class GCPSecurityAgent:
                 if not bucket.versioning_enabled:
                     no_versioning_buckets += 1
             
-            total_buckets = len(buckets)
             
             if total_buckets == 0:
                 findings.append({
@@ -696,18 +837,25 @@ class GCPSecurityAgent:
             if not self.compute_client:
                 raise Exception("Compute client not initialized")
             
-            # Get instances (simplified - would need to iterate zones in production)
-            instances = []
             zones = self._get_all_zones()
-            instances_count = 0
+            listings, zone_errors = self._list_instances(zones)
+            instances_count = sum(len(instances) for _, instances in listings)
             
             findings.append({
                 "severity": "Low",
                 "title": "Compute Engine Instances Configured",
-                "description": f"This project has Compute Engine instances deployed.",
+                "description": f"This project has {instances_count} Compute Engine instance(s) deployed in the {len(listings)} zone(s) checked.",
                 "recommendation": "Regularly review instance configurations and security settings."
             })
             
+            for z, error in zone_errors:
+                findings.append({
+                    "severity": "Low",
+                    "title": f"Could Not List Instances in {z}",
+                    "description": f"Error: {error}",
+                    "recommendation": "Check that the Compute Engine API is enabled and the credentials can list instances in this zone."
+                })
+            
             findings.append({
                 "severity": "High",
                 "title": "Use Shielded VMs",
@@ -7,6 +7,7 @@ Interactive CLI for GCP security analysis and recommendations.
 
 import os
 import sys
+import argparse
 from typing import Optional
 
 from rich.console import Console
@@ -80,11 +81,25 @@ def clear_screen():
         os.system("clear")
 
 
-def main():
-    """Main entry point for GCP Security Agent CLI."""
+def main(argv: Optional[list] = None):
+    """
+    Main entry point for GCP Security Agent CLI.
+    
+    Args:
+        argv: Command-line arguments; unrecognized ones are ignored so that
+            programs embedding the CLI can keep their own flags
+    """
+    parser = argparse.ArgumentParser(description="Google Cloud Platform Security Agent")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always fetch fresh bucket and instance listings"
+    )
+    args, _ = parser.parse_known_args(argv if argv is not None else [])
+    
     try:
         # Initialize agent
-        agent = GCPSecurityAgent()
+        agent = GCPSecurityAgent(cache_enabled=not args.no_cache)
     except ValueError as e:
         console.print(f"[bold red]Error:[/bold red] {str(e)}")
         console.print("\n[yellow]Setup Instructions:[/yellow]")
@@ -134,4 +149,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    main(sys.argv[1:])
@@ -4,23 +4,26 @@ Audit Report Generation Module
 Provides comprehensive audit report generation for AWS, GCP, and Azure.
 """
 
-from .audit_generator import (
-    AuditReport,
-    AWSAuditReport,
-    GCPAuditReport,
-    AzureAuditReport,
-    AuditHeader,
-    AuditFooter
-)
-from .chart_generator import ChartGenerator
-from .compliance_mapper import ComplianceMapper
-from .exporters import (
-    JSONExporter,
-    CSVExporter,
-    HTMLExporter,
-    EmailService,
-    EmailScheduler
-)
+import importlib
+
+# Public name -> submodule that defines it. Submodules pull in reportlab,
+# matplotlib and SMTP helpers, so they are imported on first attribute
+# access rather than when the package is imported.
+_EXPORTS = {
+    'AuditReport': '.audit_generator',
+    'AWSAuditReport': '.audit_generator',
+    'GCPAuditReport': '.audit_generator',
+    'AzureAuditReport': '.audit_generator',
+    'AuditHeader': '.audit_generator',
+    'AuditFooter': '.audit_generator',
+    'ChartGenerator': '.chart_generator',
+    'ComplianceMapper': '.compliance_mapper',
+    'JSONExporter': '.exporters',
+    'CSVExporter': '.exporters',
+    'HTMLExporter': '.exporters',
+    'EmailService': '.exporters',
+    'EmailScheduler': '.exporters',
+}
 
 __all__ = [
     'AuditReport',
@@ -37,3 +40,15 @@ __all__ = [
     'EmailService',
     'EmailScheduler',
 ]
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
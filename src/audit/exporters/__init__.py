@@ -8,10 +8,17 @@ Export audit reports in multiple formats:
 - Email delivery with SMTP integration
 """
 
-from .json_exporter import JSONExporter
-from .csv_exporter import CSVExporter
-from .html_exporter import HTMLExporter
-from .email_service import EmailService, EmailScheduler
+import importlib
+
+# Public name -> submodule that defines it, imported on first access so
+# using one exporter doesn't load the others' dependencies
+_EXPORTS = {
+    'JSONExporter': '.json_exporter',
+    'CSVExporter': '.csv_exporter',
+    'HTMLExporter': '.html_exporter',
+    'EmailService': '.email_service',
+    'EmailScheduler': '.email_service',
+}
 
 __all__ = [
     'JSONExporter',
@@ -20,3 +27,15 @@ __all__ = [
     'EmailService',
     'EmailScheduler'
 ]
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
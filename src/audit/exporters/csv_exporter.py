@@ -7,6 +7,7 @@ analysis and data import into other tools.
 """
 
 import csv
+import io
 import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime
@@ -54,7 +55,6 @@ class CSVExporter:
                 fieldnames = self._get_all_fieldnames(findings)
             
             # Generate CSV content
-            import io
             csv_buffer = io.StringIO()
             writer = csv.DictWriter(csv_buffer, fieldnames=fieldnames)
             writer.writeheader()
@@ -101,10 +101,7 @@ class CSVExporter:
             summary_row = self._create_summary_row(report_data)
             fieldnames = list(summary_row.keys())
             
-            with open(output_path, 'w', newline='') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerow(summary_row)
+            self._write_csv(output_path, fieldnames, [summary_row])
             
             self.logger.info(f"Report summary exported to CSV: {output_path}")
             return output_path
@@ -183,10 +180,7 @@ class CSVExporter:
             fieldnames = ['Framework', 'Coverage_Percentage', 'Controls_Covered',
                          'Total_Controls', 'Status', 'Gap_Count']
             
-            with open(output_path, 'w', newline='') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(rows)
+            self._write_csv(output_path, fieldnames, rows)
             
             self.logger.info(f"Compliance summary exported to CSV: {output_path}")
             return output_path
@@ -234,10 +228,7 @@ class CSVExporter:
                          'Description', 'Remediation', 'Status', 'Assigned_To',
                          'Due_Date', 'Notes']
             
-            with open(output_path, 'w', newline='') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(rows)
+            self._write_csv(output_path, fieldnames, rows)
             
             self.logger.info(f"Remediation tracker exported to CSV: {output_path}")
             return output_path
@@ -246,6 +237,21 @@ class CSVExporter:
             self.logger.error(f"Failed to export remediation tracker: {e}")
             raise
     
+    def _write_csv(
+        self,
+        output_path: str,
+        fieldnames: List[str],
+        rows: List[Dict[str, Any]]
+    ) -> None:
+        """Render rows to CSV in memory and write the file in a single call."""
+        csv_buffer = io.StringIO()
+        writer = csv.DictWriter(csv_buffer, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+        
+        with open(output_path, 'w', newline='') as csvfile:
+            csvfile.write(csv_buffer.getvalue())
+    
     def _get_all_fieldnames(self, findings: List[Dict[str, Any]]) -> List[str]:
         """Extract all unique fieldnames from findings."""
         fieldnames = set()
@@ -1,8 +1,106 @@
+import argparse
+import os
+
 from langchain_google_genai import GoogleGenerativeAIEmbeddings
 from langchain_community.vectorstores import FAISS
 
-def build_vectorstore(chunks, persist_path="data/embeddings"):
+# HNSW graph parameters: M links per node, build/search beam widths
+HNSW_M = 32
+HNSW_EF_CONSTRUCTION = 200
+HNSW_EF_SEARCH = 64
+
+# 8-bit scalar-quantized copy of the index, saved next to index.faiss
+QUANTIZED_INDEX_NAME = "index.int8.faiss"
+
+def to_hnsw(vectorstore, m=HNSW_M, ef_construction=HNSW_EF_CONSTRUCTION, ef_search=HNSW_EF_SEARCH):
+    """Replace a vector store's flat index with an HNSW index over the same vectors."""
+    import faiss
+
+    flat_index = vectorstore.index
+    vectors = flat_index.reconstruct_n(0, flat_index.ntotal)
+
+    # Same L2 metric and insertion order, so docstore ids still line up
+    hnsw_index = faiss.IndexHNSWFlat(flat_index.d, m)
+    hnsw_index.hnsw.efConstruction = ef_construction
+    hnsw_index.hnsw.efSearch = ef_search
+    hnsw_index.add(vectors)
+
+    vectorstore.index = hnsw_index
+    return vectorstore
+
+def remove_quantized_index(persist_path):
+    """Delete a quantized copy that no longer matches the index saved at persist_path."""
+    quantized_path = os.path.join(persist_path, QUANTIZED_INDEX_NAME)
+    if os.path.exists(quantized_path):
+        os.remove(quantized_path)
+        print(f"Removed stale {quantized_path}; rerun with --quantize to rebuild it")
+
+def build_vectorstore(chunks, persist_path="data/embeddings", use_hnsw=True):
     embeddings = GoogleGenerativeAIEmbeddings(model="models/embedding-001")
     vectorstore = FAISS.from_documents(chunks, embeddings)
+    if use_hnsw:
+        to_hnsw(vectorstore)
     vectorstore.save_local(persist_path, allow_dangerous_deserialization=True)
+    remove_quantized_index(persist_path)
+    return vectorstore
+
+def migrate_to_hnsw(persist_path="data/embeddings/index"):
+    """Convert an existing flat index on disk to HNSW in place."""
+    embeddings = GoogleGenerativeAIEmbeddings(model="models/embedding-001")
+    vectorstore = FAISS.load_local(persist_path, embeddings, allow_dangerous_deserialization=True)
+    if hasattr(vectorstore.index, "hnsw"):
+        print(f"{persist_path} already uses an HNSW index")
+        return vectorstore
+
+    to_hnsw(vectorstore)
+    vectorstore.save_local(persist_path)
+    remove_quantized_index(persist_path)
+    print(f"Converted {persist_path} to HNSW ({vectorstore.index.ntotal} vectors)")
     return vectorstore
+
+def recall_at_k(exact_index, approx_index, queries, k=5):
+    """Fraction of the exact top-k neighbours that the approximate index also returns."""
+    _, exact_ids = exact_index.search(queries, k)
+    _, approx_ids = approx_index.search(queries, k)
+    hits = sum(len(set(e) & set(a)) for e, a in zip(exact_ids.tolist(), approx_ids.tolist()))
+    return hits / exact_ids.size
+
+def quantize_index(persist_path="data/embeddings/index", m=HNSW_M, sample_size=1000):
+    """
+    Write an 8-bit scalar-quantized HNSW copy of a saved index and report its recall@5.
+    
+    Vectors keep their insertion order and L2 metric, so the docstore
+    mapping saved with the original index applies unchanged.
+    """
+    import faiss
+    import numpy as np
+    
+    index = faiss.read_index(os.path.join(persist_path, "index.faiss"))
+    vectors = index.reconstruct_n(0, index.ntotal)
+    
+    quantized = faiss.IndexHNSWSQ(index.d, faiss.ScalarQuantizer.QT_8bit, m)
+    quantized.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+    quantized.hnsw.efSearch = HNSW_EF_SEARCH
+    quantized.train(vectors)
+    quantized.add(vectors)
+    
+    output_path = os.path.join(persist_path, QUANTIZED_INDEX_NAME)
+    faiss.write_index(quantized, output_path)
+    
+    # Compare against exact search, using a sample of the stored vectors as queries
+    exact = faiss.IndexFlatL2(index.d)
+    exact.add(vectors)
+    rng = np.random.default_rng(0)
+    sample = vectors[rng.choice(index.ntotal, min(sample_size, index.ntotal), replace=False)]
+    recall = recall_at_k(exact, quantized, sample)
+    print(f"Wrote {output_path} ({index.ntotal} vectors, recall@5 {recall:.3f})")
+    return recall
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert a flat FAISS index to HNSW")
+    parser.add_argument("path", nargs="?", default="data/embeddings/index", help="Saved vector store directory")
+    parser.add_argument("--quantize", action="store_true", help=f"Also write an 8-bit {QUANTIZED_INDEX_NAME}")
+    args = parser.parse_args()
+    migrate_to_hnsw(args.path)
+    if args.quantize:
+        quantize_index(args.path)
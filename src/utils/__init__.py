@@ -0,0 +1,19 @@
+"""
+Shared Utilities
+
+Small helpers used across the agents:
+- In-process TTL cache for expensive lookups (LLM, search, cloud APIs)
+- Local token estimation for prompt budgeting
+- Running async pipelines from sync code
+"""
+
+from .ttl_cache import TTLCache, hash_key
+from .tokens import estimate_tokens
+from .aio import run_sync
+
+__all__ = [
+    'TTLCache',
+    'hash_key',
+    'estimate_tokens',
+    'run_sync'
+]
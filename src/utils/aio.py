@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Async Helpers
+
+Lets synchronous entry points reuse the agents' async pipelines whether
+or not they are called from inside a running event loop.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Coroutine, TypeVar
+
+T = TypeVar("T")
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion from synchronous code.
+    
+    asyncio.run refuses to start inside a running loop (Jupyter, an async
+    web handler), so in that case the coroutine gets its own loop in a
+    worker thread and the caller blocks until it finishes.
+    
+    Args:
+        coro: The coroutine to run
+        
+    Returns:
+        The coroutine's result
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Local Token Estimation
+
+Counts prompt tokens locally for budgeting and chunking, instead of calling
+a provider's remote count-tokens endpoint. Uses tiktoken's cl100k_base
+encoding when it can be loaded and a characters-per-token heuristic
+otherwise; either is close enough to Gemini's tokenizer for budgeting.
+"""
+
+from functools import lru_cache
+
+# Average characters per token for English text, used without tiktoken
+_CHARS_PER_TOKEN = 4
+
+
+@lru_cache(maxsize=1)
+def _get_encoding():
+    """
+    Load the tiktoken encoding once, or None if it is unavailable.
+    
+    tiktoken downloads the BPE file on first use unless it is already
+    cached, so offline or restricted hosts fall back to the heuristic.
+    """
+    try:
+        import tiktoken
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of LLM tokens in text.
+    
+    No network call is made per estimate; only the first tiktoken load may
+    fetch its encoding file, and failures fall back to chars / 4.
+    
+    Args:
+        text: Prompt text
+        
+    Returns:
+        Estimated token count
+    """
+    if not text:
+        return 0
+    
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text))
+    
+    return -(-len(text) // _CHARS_PER_TOKEN)
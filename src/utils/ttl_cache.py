@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+In-Process TTL Cache
+
+Thread-safe, size-bounded cache whose entries expire after a fixed
+time-to-live. Used to avoid repeating identical LLM, search and cloud
+API calls within a session.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, List, Optional, Tuple
+
+
+def hash_key(*parts: Any) -> str:
+    """
+    Build a compact cache key from arbitrary parts.
+    
+    Args:
+        parts: Values identifying the cached item (converted with str())
+        
+    Returns:
+        Hex digest of the joined parts
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(str(part).encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after ttl seconds."""
+    
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0):
+        """
+        Initialize the cache.
+        
+        Args:
+            maxsize: Maximum number of entries; least recently used are evicted
+            ttl: Seconds an entry stays valid after it is set
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Return the cached value for key, or default if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            
+            self._data.move_to_end(key)
+            return value
+    
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store value under key, evicting the oldest entry if full."""
+        with self._lock:
+            self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def dump(self) -> List[Tuple[Hashable, float, Any]]:
+        """
+        Export unexpired entries, least recently used first.
+        
+        Returns:
+            List of (key, seconds until expiry, value) tuples, suitable for load()
+        """
+        now = time.monotonic()
+        with self._lock:
+            return [
+                (key, expires_at - now, value)
+                for key, (expires_at, value) in self._data.items()
+                if expires_at > now
+            ]
+    
+    def load(self, entries: List[Tuple[Hashable, float, Any]]) -> None:
+        """Restore entries exported by dump(), keeping their remaining lifetimes."""
+        for key, remaining, value in entries:
+            if remaining > 0:
+                self.set(key, value, ttl=remaining)
+    
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+    
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+_MISSING = object()
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Tests for running async pipelines from sync code
+"""
+
+import asyncio
+import unittest
+
+from src.utils import run_sync
+
+
+async def _answer():
+    await asyncio.sleep(0)
+    return 42
+
+
+class TestRunSync(unittest.TestCase):
+    """run_sync works with and without a running event loop."""
+    
+    def test_without_running_loop(self):
+        self.assertEqual(run_sync(_answer()), 42)
+    
+    def test_inside_running_loop(self):
+        async def caller():
+            # A sync API called from async code, e.g. in a notebook
+            return run_sync(_answer())
+        
+        self.assertEqual(asyncio.run(caller()), 42)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Tests for the audit package's lazy exports
+"""
+
+import json
+import subprocess
+import sys
+import unittest
+
+
+class TestLazyExports(unittest.TestCase):
+    """Importing the audit packages defers their submodules until used."""
+    
+    def _loaded_modules(self, code):
+        # A fresh interpreter, since other tests may already have imported them
+        script = f"import json, sys\n{code}\nprint(json.dumps(sorted(m for m in sys.modules if m.startswith('src.audit'))))"
+        output = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, check=True
+        ).stdout
+        return json.loads(output)
+    
+    def test_package_import_loads_no_submodules(self):
+        self.assertEqual(self._loaded_modules("import src.audit"), ["src.audit"])
+    
+    def test_exporter_loads_only_its_module(self):
+        loaded = self._loaded_modules("from src.audit.exporters import JSONExporter")
+        self.assertEqual(loaded, ["src.audit", "src.audit.exporters", "src.audit.exporters.json_exporter"])
+    
+    def test_unknown_name_raises(self):
+        import src.audit
+        with self.assertRaises(AttributeError):
+            src.audit.NotAnExport
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Tests for the Azure audit sections
+"""
+
+import unittest
+
+from src.agents.azure_security.agent import AzureSecurityAgent
+
+
+class TestAuditSections(unittest.TestCase):
+    """Each audit gets its own copy of the static section findings."""
+    
+    def test_mutating_a_section_does_not_leak(self):
+        agent = AzureSecurityAgent.__new__(AzureSecurityAgent)
+        for audit_section in (
+            agent._audit_entra_id_security,
+            agent._audit_storage_security,
+            agent._audit_compute_security,
+            agent._audit_database_security,
+            agent._audit_network_security,
+        ):
+            first = audit_section()
+            first["findings"][0]["severity"] = "Changed"
+            first["findings"].clear()
+            second = audit_section()
+            self.assertTrue(second["findings"])
+            self.assertNotEqual(second["findings"][0].get("severity"), "Changed")
+
+
+if __name__ == "__main__":
+    unittest.main()
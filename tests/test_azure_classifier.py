@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Tests for Azure query routing
+
+Pins the keyword routing of natural language queries to analysis types.
+"""
+
+import unittest
+
+from src.agents.azure_security.agent import _classify_command
+
+
+class TestClassifyCommand(unittest.TestCase):
+    """Queries route to the same analyses as the original substring match."""
+    
+    def assertRoutes(self, query, expected):
+        self.assertEqual(_classify_command(query.lower()), expected, query)
+    
+    def test_short_plurals(self):
+        self.assertRoutes("Check my VMs", ("compute_analysis",))
+        self.assertRoutes("List my NSGs", ("network_analysis",))
+    
+    def test_ies_plurals(self):
+        self.assertRoutes("Review managed identities", ("iam_analysis",))
+    
+    def test_stem_variants(self):
+        self.assertRoutes("Review networking security", ("network_analysis",))
+        self.assertRoutes("Audit my PostgreSQL servers", ("database_analysis",))
+    
+    def test_multi_word_keywords(self):
+        self.assertRoutes("Check my file shares", ("storage_analysis",))
+        self.assertRoutes("Audit the virtual machines", ("compute_analysis",))
+    
+    def test_several_sections_keep_dispatch_order(self):
+        self.assertRoutes(
+            "Check the firewall and storage accounts",
+            ("storage_analysis", "network_analysis")
+        )
+    
+    def test_general_question(self):
+        self.assertRoutes("What is zero trust?", ("llm_response",))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Tests for the Azure Security Agent CLI helpers
+"""
+
+import importlib.util
+import tempfile
+import unittest
+from collections import Counter
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+HAS_TYPER = importlib.util.find_spec("typer") is not None
+
+
+@unittest.skipUnless(HAS_TYPER, "typer is not installed")
+class TestCommandStats(unittest.TestCase):
+    """Usage stats order the help table once per session and never break the CLI."""
+    
+    def setUp(self):
+        from src.agents.azure_security import cli
+        self.cli = cli
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        stats_path = Path(self.tmp.name) / "cmd_stats.json"
+        for patcher in (
+            patch.object(cli, "_CMD_STATS_PATH", stats_path),
+            patch.object(cli, "_CMD_HITS", Counter()),
+            patch.object(cli, "_help_rows", list(cli._HELP_ROWS)),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.stats_path = stats_path
+        self.console = MagicMock()
+    
+    def test_corrupt_stats_are_ignored(self):
+        self.stats_path.write_text('{"audit": null}')
+        self.cli._load_cmd_stats(self.console)
+        self.assertEqual(self.cli._CMD_HITS, Counter())
+        self.console.print.assert_called_once()
+    
+    def test_non_object_stats_are_ignored(self):
+        self.stats_path.write_text("[1, 2]")
+        self.cli._load_cmd_stats(self.console)
+        self.assertEqual(self.cli._CMD_HITS, Counter())
+    
+    def test_stats_round_trip(self):
+        self.cli._CMD_HITS["audit"] += 3
+        self.cli._save_cmd_stats(self.console)
+        self.cli._CMD_HITS.clear()
+        self.cli._load_cmd_stats(self.console)
+        self.assertEqual(self.cli._CMD_HITS["audit"], 3)
+        self.console.print.assert_not_called()
+    
+    def test_unwritable_stats_path(self):
+        blocker = Path(self.tmp.name) / "not-a-dir"
+        blocker.write_text("")
+        self.cli._CMD_HITS["help"] += 1
+        with patch.object(self.cli, "_CMD_STATS_PATH", blocker / "cmd_stats.json"):
+            self.cli._save_cmd_stats(self.console)
+        self.console.print.assert_called_once()
+    
+    def _help_commands(self):
+        table = MagicMock()
+        with patch("rich.table.Table", return_value=table):
+            self.cli.display_help(MagicMock())
+        return [call.args[0] for call in table.add_row.call_args_list][:len(self.cli._HELP_ROWS)]
+    
+    def test_help_lists_most_used_first(self):
+        self.stats_path.write_text('{"audit": 5, "storage": 2}')
+        self.cli._load_cmd_stats(self.console)
+        commands = self._help_commands()
+        self.assertEqual(commands[:2], ["audit", "storage"])
+        # Unused commands keep their default order
+        self.assertEqual(commands[2:], [row[0] for row in self.cli._HELP_ROWS if row[0] not in ("audit", "storage")])
+    
+    def test_help_order_fixed_within_session(self):
+        self.cli._load_cmd_stats(self.console)
+        before = self._help_commands()
+        self.cli._CMD_HITS["exit"] += 100
+        self.assertEqual(self._help_commands(), before)
+    
+    def test_suggestion(self):
+        self.assertEqual(self.cli._suggest_command("storag"), "storage")
+        self.assertIsNone(self.cli._suggest_command("check my storage"))
+
+
+if __name__ == "__main__":
+    unittest.main()
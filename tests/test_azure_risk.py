@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Tests for Azure risk scoring
+"""
+
+import unittest
+
+from src.agents.azure_security.utils import AzureRiskAssessment
+
+
+class TestCalculateRiskScore(unittest.TestCase):
+    """Severity tallies and the resulting risk level."""
+    
+    def test_no_findings(self):
+        self.assertEqual(
+            AzureRiskAssessment.calculate_risk_score([]),
+            {"overall_score": 0, "risk_level": "Low", "status": "pass"}
+        )
+    
+    def test_tallies_and_average(self):
+        findings = [
+            {"severity": "Critical"},
+            {"severity": "high"},
+            {"severity": "HIGH"},
+            {"severity": "Low"},
+            {},
+        ]
+        result = AzureRiskAssessment.calculate_risk_score(findings)
+        self.assertEqual(
+            result["severity_breakdown"],
+            {"critical": 1, "high": 2, "medium": 0, "low": 2, "pass": 0}
+        )
+        self.assertEqual(result["overall_score"], int((100 + 75 * 2 + 25 * 2) / 5))
+        self.assertEqual(result["risk_level"], "High")
+    
+    def test_unknown_severity_scores_zero_and_is_not_counted(self):
+        result = AzureRiskAssessment.calculate_risk_score([{"severity": "info"}, {"severity": "critical"}])
+        self.assertEqual(sum(result["severity_breakdown"].values()), 1)
+        self.assertEqual(result["overall_score"], 50)
+
+
+if __name__ == "__main__":
+    unittest.main()
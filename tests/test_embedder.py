@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Tests for the embeddings pipeline's quantized index handling
+"""
+
+import importlib.util
+import os
+import tempfile
+import unittest
+
+HAS_LANGCHAIN = importlib.util.find_spec("langchain_google_genai") is not None
+
+
+@unittest.skipUnless(HAS_LANGCHAIN, "langchain-google-genai is not installed")
+class TestRemoveQuantizedIndex(unittest.TestCase):
+    """A rewritten index must not be paired with an old quantized copy."""
+    
+    def test_removes_stale_copy(self):
+        from src.data_pipeline.embedder import QUANTIZED_INDEX_NAME, remove_quantized_index
+        
+        with tempfile.TemporaryDirectory() as persist_path:
+            quantized_path = os.path.join(persist_path, QUANTIZED_INDEX_NAME)
+            open(quantized_path, "wb").close()
+            remove_quantized_index(persist_path)
+            self.assertFalse(os.path.exists(quantized_path))
+    
+    def test_missing_copy_is_ignored(self):
+        from src.data_pipeline.embedder import remove_quantized_index
+        
+        with tempfile.TemporaryDirectory() as persist_path:
+            remove_quantized_index(persist_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
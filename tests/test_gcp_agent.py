@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Tests for the GCP Security Agent's resource listings
+
+GCP clients are mocked, so no project or credentials are needed.
+"""
+
+import importlib.util
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+HAS_GCP = all(
+    importlib.util.find_spec(name) is not None
+    for name in ("google.cloud.compute_v1", "rich", "langchain_google_genai", "reportlab")
+) if importlib.util.find_spec("google") else False
+
+
+def _make_agent(cache_enabled=True):
+    """Create an agent with mocked GCP clients and no LLM."""
+    from src.agents.gcp_security import agent as gcp_agent
+    
+    with patch.object(gcp_agent, "ProjectsClient"), \
+            patch.object(gcp_agent.gcp_storage, "Client"), \
+            patch.object(gcp_agent, "InstancesClient"), \
+            patch.dict(os.environ, {"GOOGLE_API_KEY": ""}):
+        agent = gcp_agent.GCPSecurityAgent(project_id="test-project", cache_enabled=cache_enabled)
+    agent.clear_cache()
+    return agent
+
+
+@unittest.skipUnless(HAS_GCP, "GCP agent dependencies are not installed")
+class TestCachedList(unittest.TestCase):
+    """Listings stream page by page and are cached only once complete."""
+    
+    def test_streams_before_caching(self):
+        agent = _make_agent()
+        consumed = []
+        
+        def fetch():
+            for name in ("a", "b", "c"):
+                consumed.append(name)
+                yield name
+        
+        listing = agent._cached_list("buckets", fetch)
+        self.assertEqual(next(iter(listing)), "a")
+        # Only the first item has been fetched, and nothing is cached yet
+        self.assertEqual(consumed, ["a"])
+        self.assertEqual(list(listing), ["b", "c"])
+        
+        # The completed listing is served from the cache without refetching
+        self.assertEqual(agent._cached_list("buckets", fetch), ["a", "b", "c"])
+        self.assertEqual(consumed, ["a", "b", "c"])
+    
+    def test_abandoned_listing_is_not_cached(self):
+        agent = _make_agent()
+        fetch = MagicMock(side_effect=lambda: iter(["a", "b"]))
+        
+        next(iter(agent._cached_list("buckets", fetch)))
+        self.assertEqual(list(agent._cached_list("buckets", fetch)), ["a", "b"])
+        self.assertEqual(fetch.call_count, 2)
+    
+    def test_cache_disabled_always_fetches(self):
+        agent = _make_agent(cache_enabled=False)
+        fetch = MagicMock(side_effect=lambda: iter(["a"]))
+        
+        list(agent._cached_list("buckets", fetch))
+        list(agent._cached_list("buckets", fetch))
+        self.assertEqual(fetch.call_count, 2)
+
+
+@unittest.skipUnless(HAS_GCP, "GCP agent dependencies are not installed")
+class TestListInstances(unittest.TestCase):
+    """A failing zone does not fail the other zones."""
+    
+    def _agent_with_zones(self, failing_zone):
+        agent = _make_agent()
+        
+        def list_zone(request):
+            if request["zone"] == failing_zone:
+                raise PermissionError("compute.instances.list denied")
+            return iter([MagicMock(name=f"vm-{request['zone']}")])
+        
+        agent.compute_client.list.side_effect = list_zone
+        return agent
+    
+    def test_failing_zone_is_reported(self):
+        agent = self._agent_with_zones("us-central1-b")
+        listings, errors = agent._list_instances(["us-central1-a", "us-central1-b", "us-central1-c"])
+        
+        self.assertEqual([z for z, _ in listings], ["us-central1-a", "us-central1-c"])
+        self.assertEqual([len(instances) for _, instances in listings], [1, 1])
+        self.assertEqual(errors, [("us-central1-b", "compute.instances.list denied")])
+    
+    def test_compute_audit_records_zone_errors(self):
+        agent = self._agent_with_zones("us-central1-b")
+        result = agent._audit_compute_security()
+        
+        titles = [finding["title"] for finding in result["findings"]]
+        self.assertIn("Could Not List Instances in us-central1-b", titles)
+        self.assertNotIn("Could Not Analyze Compute", titles)
+        self.assertIn("2 Compute Engine instance(s)", result["findings"][0]["description"])
+
+
+@unittest.skipUnless(HAS_GCP and importlib.util.find_spec("dotenv") is not None,
+                     "GCP agent dependencies are not installed")
+class TestCliArguments(unittest.TestCase):
+    """main() only reads the arguments it is given."""
+    
+    def _run_main(self, *args):
+        from src.agents.gcp_security import cli
+        
+        with patch.object(cli, "GCPSecurityAgent") as agent_cls, \
+                patch.object(cli, "display_welcome"), \
+                patch.object(cli.Prompt, "ask", side_effect=KeyboardInterrupt), \
+                patch("sys.argv", ["host-program", "--host-only-flag"]):
+            with self.assertRaises(SystemExit):
+                cli.main(*args)
+        return agent_cls
+    
+    def test_ignores_host_program_argv(self):
+        self._run_main().assert_called_once_with(cache_enabled=True)
+    
+    def test_no_cache_flag(self):
+        self._run_main(["--no-cache", "--other"]).assert_called_once_with(cache_enabled=False)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Tests for the compliance bot's SERPAPI cross-verification client
+"""
+
+import asyncio
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.agents.compliance_bot import search
+
+
+class TestAsyncSearch(unittest.TestCase):
+    """asearch goes through the pooled HTTP session."""
+    
+    def test_asearch_reuses_shared_session(self):
+        session = MagicMock()
+        session.get.return_value.json.return_value = {
+            "organic_results": [{"title": "t", "link": "l", "snippet": "s", "extra": 1}]
+        }
+        verifier = search.SearchVerifier(api_key="test-key")
+        
+        with patch.object(search, "_http_session", return_value=session):
+            first = asyncio.run(verifier.asearch("gdpr", num_results=1))
+            asyncio.run(verifier.asearch("hipaa", num_results=1))
+        
+        self.assertEqual(first, [{"title": "t", "link": "l", "snippet": "s"}])
+        self.assertEqual(session.get.call_count, 2)
+    
+    def test_asearch_raises_on_serpapi_error(self):
+        session = MagicMock()
+        session.get.return_value.json.return_value = {"error": "Invalid API key"}
+        verifier = search.SearchVerifier(api_key="test-key")
+        
+        with patch.object(search, "_http_session", return_value=session):
+            with self.assertRaises(Exception):
+                asyncio.run(verifier.asearch("gdpr"))
+
+
+if __name__ == "__main__":
+    unittest.main()
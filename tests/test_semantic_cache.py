@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Tests for the compliance bot's semantic response cache
+"""
+
+import importlib.util
+import random
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from src.agents.compliance_bot.semantic_cache import SemanticCache
+
+HAS_FAISS = importlib.util.find_spec("faiss") is not None
+
+
+@unittest.skipUnless(HAS_FAISS, "faiss is not installed")
+class TestSemanticCache(unittest.TestCase):
+    """Lookups, eviction, expiry and concurrent use of SemanticCache."""
+    
+    def test_similar_query_hits(self):
+        cache = SemanticCache(maxsize=4, threshold=0.95)
+        cache.add([1.0, 0.0, 0.0], (5, True), {"response": "a"})
+        self.assertEqual(cache.lookup([0.99, 0.01, 0.0], (5, True)), {"response": "a"})
+        self.assertIsNone(cache.lookup([0.99, 0.01, 0.0], (3, True)))
+        self.assertIsNone(cache.lookup([0.0, 1.0, 0.0], (5, True)))
+    
+    def test_evicts_least_recently_used(self):
+        cache = SemanticCache(maxsize=2, threshold=0.95)
+        cache.add([1.0, 0.0, 0.0], (), {"response": "a"})
+        cache.add([0.0, 1.0, 0.0], (), {"response": "b"})
+        cache.add([0.0, 0.0, 1.0], (), {"response": "c"})
+        self.assertIsNone(cache.lookup([1.0, 0.0, 0.0], ()))
+        self.assertEqual(len(cache.dump()), 2)
+    
+    def test_expired_entry_misses_and_is_evicted(self):
+        cache = SemanticCache(maxsize=4, threshold=0.95, ttl=10)
+        with patch("time.monotonic", return_value=100.0):
+            cache.add([1.0, 0.0, 0.0], (), {"response": "a"})
+        with patch("time.monotonic", return_value=111.0):
+            self.assertIsNone(cache.lookup([1.0, 0.0, 0.0], ()))
+        self.assertEqual(cache._index.ntotal, 0)
+        self.assertEqual(cache.dump(), [])
+    
+    def test_dump_and_load_skip_expired(self):
+        cache = SemanticCache(maxsize=4, threshold=0.95, ttl=10)
+        with patch("time.monotonic", return_value=100.0):
+            cache.add([1.0, 0.0, 0.0], (), {"response": "a"})
+            cache.add([0.0, 1.0, 0.0], (), {"response": "b"}, ttl=30)
+        with patch("time.monotonic", return_value=120.0):
+            entries = cache.dump()
+        self.assertEqual([entry[2] for entry in entries], [{"response": "b"}])
+        
+        restored = SemanticCache(maxsize=4, threshold=0.95)
+        restored.load(entries + [([0.0, 0.0, 1.0], (), {"response": "c"}, -1.0)])
+        self.assertEqual(restored.lookup([0.0, 1.0, 0.0], ()), {"response": "b"})
+        self.assertIsNone(restored.lookup([0.0, 0.0, 1.0], ()))
+    
+    def test_concurrent_add_and_lookup(self):
+        cache = SemanticCache(maxsize=32, threshold=0.95)
+        rng = random.Random(0)
+        vectors = [[rng.random() for _ in range(8)] for _ in range(200)]
+        
+        def use(i):
+            cache.add(vectors[i], (), {"response": str(i)})
+            cache.lookup(vectors[i], ())
+        
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(use, range(len(vectors))))
+        
+        # The index and entry map stay in step
+        self.assertEqual(len(cache.dump()), 32)
+        self.assertEqual(cache._index.ntotal, 32)
+
+
+if __name__ == "__main__":
+    unittest.main()
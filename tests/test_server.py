@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Tests for the compliance server socket handling
+"""
+
+import importlib.util
+import os
+import stat
+import tempfile
+import unittest
+from unittest.mock import patch
+
+HAS_TYPER = importlib.util.find_spec("typer") is not None
+
+
+@unittest.skipUnless(HAS_TYPER, "typer is not installed")
+class TestPrivateSocket(unittest.TestCase):
+    """Only the current user can reach the server socket."""
+    
+    def setUp(self):
+        from src.agents.compliance_bot import server
+        self.server = server
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.socket_dir = os.path.join(self.tmp.name, "cloudsec-agent")
+        patcher = patch.object(server, "_SOCKET_DIR", self.socket_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def _mode(self, path):
+        return stat.S_IMODE(os.stat(path).st_mode)
+    
+    def test_socket_and_dir_are_private(self):
+        socket_path = os.path.join(self.socket_dir, "compliance.sock")
+        sock = self.server._bind_private_socket(socket_path)
+        self.addCleanup(sock.close)
+        self.assertEqual(self._mode(self.socket_dir), 0o700)
+        self.assertEqual(self._mode(socket_path), 0o600)
+    
+    def test_existing_dir_is_tightened(self):
+        os.makedirs(self.socket_dir, mode=0o755)
+        os.chmod(self.socket_dir, 0o755)
+        sock = self.server._bind_private_socket(os.path.join(self.socket_dir, "compliance.sock"))
+        self.addCleanup(sock.close)
+        self.assertEqual(self._mode(self.socket_dir), 0o700)
+    
+    def test_stale_socket_is_replaced(self):
+        socket_path = os.path.join(self.socket_dir, "compliance.sock")
+        self.server._bind_private_socket(socket_path).close()
+        sock = self.server._bind_private_socket(socket_path)
+        self.addCleanup(sock.close)
+        self.assertEqual(self._mode(socket_path), 0o600)
+
+
+if __name__ == "__main__":
+    unittest.main()
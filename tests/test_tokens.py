@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Tests for local token estimation
+"""
+
+import asyncio
+import sys
+import types
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.utils import tokens
+from src.agents.azure_security import agent as azure_agent
+
+
+def _offline_tiktoken():
+    """A tiktoken module whose encoding download fails, as on an offline host."""
+    module = types.ModuleType("tiktoken")
+    module.get_encoding = MagicMock(side_effect=OSError("network unreachable"))
+    return module
+
+
+class TestEstimateTokens(unittest.TestCase):
+    """estimate_tokens never fails because the encoding cannot be loaded."""
+    
+    def setUp(self):
+        tokens._get_encoding.cache_clear()
+        self.addCleanup(tokens._get_encoding.cache_clear)
+    
+    def test_falls_back_when_encoding_download_fails(self):
+        with patch.dict(sys.modules, {"tiktoken": _offline_tiktoken()}):
+            self.assertEqual(tokens.estimate_tokens("x" * 10), 3)
+    
+    def test_falls_back_without_tiktoken(self):
+        with patch.dict(sys.modules, {"tiktoken": None}):
+            self.assertEqual(tokens.estimate_tokens("abcd" * 5), 5)
+    
+    def test_empty_text(self):
+        self.assertEqual(tokens.estimate_tokens(""), 0)
+
+
+class TestAzureBudgetCheck(unittest.TestCase):
+    """A failing budget check is reported like any other LLM error."""
+    
+    def setUp(self):
+        self.agent = azure_agent.AzureSecurityAgent(subscription_id="test-subscription")
+        self.agent.llm = MagicMock()
+        patcher = patch.object(
+            azure_agent.AzureSecurityAgent, "_check_llm_budget",
+            side_effect=RuntimeError("tokenizer unavailable")
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def test_sync_response(self):
+        response = self.agent._get_llm_response("What is zero trust?")
+        self.assertEqual(response, "Error getting response: tokenizer unavailable")
+    
+    def test_async_response(self):
+        response = asyncio.run(self.agent._get_llm_response_async("What is zero trust?"))
+        self.assertEqual(response, "Error getting response: tokenizer unavailable")
+
+
+if __name__ == "__main__":
+    unittest.main()
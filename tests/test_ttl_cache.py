@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared in-process TTL cache
+"""
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from src.utils import TTLCache, hash_key
+
+
+class TestTTLCache(unittest.TestCase):
+    """Expiry, LRU eviction, export and concurrent use."""
+    
+    def test_get_and_set(self):
+        cache = TTLCache(maxsize=4, ttl=60)
+        cache.set("a", 1)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("missing"))
+        self.assertEqual(cache.get("missing", "default"), "default")
+        self.assertIn("a", cache)
+    
+    def test_entries_expire(self):
+        cache = TTLCache(maxsize=4, ttl=60)
+        with patch("time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+            cache.set("b", 2, ttl=10)
+        with patch("time.monotonic", return_value=120.0):
+            self.assertEqual(cache.get("a"), 1)
+            self.assertIsNone(cache.get("b"))
+        with patch("time.monotonic", return_value=160.0):
+            self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 0)
+    
+    def test_evicts_least_recently_used(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+    
+    def test_dump_and_load_keep_remaining_lifetime(self):
+        cache = TTLCache(maxsize=4, ttl=60)
+        with patch("time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+            cache.set("b", 2, ttl=10)
+        with patch("time.monotonic", return_value=130.0):
+            entries = cache.dump()
+        self.assertEqual(entries, [("a", 30.0, 1)])
+        
+        restored = TTLCache(maxsize=4, ttl=60)
+        with patch("time.monotonic", return_value=500.0):
+            restored.load(entries + [("c", -1.0, 3)])
+        with patch("time.monotonic", return_value=520.0):
+            self.assertEqual(restored.get("a"), 1)
+            self.assertNotIn("c", restored)
+        with patch("time.monotonic", return_value=531.0):
+            self.assertNotIn("a", restored)
+    
+    def test_concurrent_writers_respect_maxsize(self):
+        cache = TTLCache(maxsize=50, ttl=60)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda i: cache.set(i, i), range(1000)))
+        self.assertEqual(len(cache), 50)
+
+
+class TestHashKey(unittest.TestCase):
+    """Cache keys are stable and separate their parts."""
+    
+    def test_stable(self):
+        self.assertEqual(hash_key("query", "gdpr", 5), hash_key("query", "gdpr", 5))
+    
+    def test_parts_are_delimited(self):
+        self.assertNotEqual(hash_key("ab", "c"), hash_key("a", "bc"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Tests for the compliance bot's article search helpers
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.agents.compliance_bot import web_search
+from src.agents.compliance_bot.web_search import WebSearcher
+
+
+class TestExtractEntities(unittest.TestCase):
+    """Query terms lose trailing sentence punctuation but keep inner dots."""
+    
+    def setUp(self):
+        self.searcher = WebSearcher(api_key="test-key")
+    
+    def test_keeps_dotted_terms(self):
+        entities = self.searcher._extract_entities("hardening node.js apps on example.com")
+        self.assertIn("node.js", entities)
+        self.assertIn("example.com", entities)
+    
+    def test_strips_trailing_punctuation(self):
+        entities = self.searcher._extract_entities("which bucket, policy or role?")
+        self.assertIn("bucket", entities)
+        self.assertIn("role", entities)
+        self.assertNotIn("role?", entities)
+    
+    def test_skips_bare_punctuation_and_stopwords(self):
+        entities = self.searcher._extract_entities("logging - the basics ?")
+        self.assertNotIn("", entities)
+        self.assertNotIn("the", entities)
+    
+    def test_quoted_and_capitalized_first(self):
+        entities = self.searcher._extract_entities('"zero trust" article by Jane Doe')
+        self.assertEqual(entities[:2], ["zero trust", "Jane Doe"])
+
+
+class TestFindArticleFallback(unittest.TestCase):
+    """WebSearcher.find_article prefers the specific query over the broader one."""
+    
+    def setUp(self):
+        self.searcher = WebSearcher(api_key="test-key")
+    
+    def _search_returning(self, results_by_query):
+        return patch.object(
+            self.searcher, "_general_search",
+            side_effect=lambda query, max_results=5: results_by_query.get(query, [])
+        )
+    
+    def test_falls_back_to_broader_query(self):
+        query = "find the article about S3 bucket policies"
+        broader = web_search._STRIP_RE.sub("", query).strip()
+        with self._search_returning({broader: [{"title": "broad"}]}) as search:
+            result = self.searcher.find_article(query)
+        
+        self.assertTrue(result["found"])
+        self.assertEqual(result["results"], [{"title": "broad"}])
+        self.assertEqual(search.call_count, 2)
+    
+    def test_hit_skips_broader_query(self):
+        query = "find the article about S3 bucket policies"
+        with self._search_returning({}):
+            specific = self.searcher.find_article(query)["query"]
+        
+        with self._search_returning({specific: [{"title": "specific"}]}) as search:
+            self.searcher.find_article(query)
+        # Only one SERPAPI credit is spent when the specific query hits
+        search.assert_called_once()
+    
+    def test_speculative_sends_both_queries(self):
+        query = "find the article about S3 bucket policies"
+        with self._search_returning({}):
+            specific = self.searcher.find_article(query)["query"]
+        
+        with self._search_returning({specific: [{"title": "specific"}]}) as search:
+            result = self.searcher.find_article(query, speculative=True)
+        self.assertEqual(result["results"], [{"title": "specific"}])
+        self.assertEqual(search.call_count, 2)
+    
+    def test_specific_query_wins(self):
+        query = "find the article about S3 bucket policies"
+        broader = web_search._STRIP_RE.sub("", query).strip()
+        with self._search_returning({broader: [{"title": "broad"}]}):
+            specific = self.searcher.find_article(query)["query"]
+        
+        with self._search_returning({specific: [{"title": "specific"}], broader: [{"title": "broad"}]}):
+            result = self.searcher.find_article(query)
+        self.assertEqual(result["results"], [{"title": "specific"}])
+        
+        with self._search_returning({specific: [{"title": "specific"}], broader: [{"title": "broad"}]}):
+            result = self.searcher.find_article(query, speculative=True)
+        self.assertEqual(result["results"], [{"title": "specific"}])
+    
+    def test_nothing_found(self):
+        with self._search_returning({}):
+            result = self.searcher.find_article("find the article about S3 bucket policies")
+        self.assertFalse(result["found"])
+        self.assertIsNotNone(result["suggestion"])
+
+
+class TestModuleFindArticle(unittest.TestCase):
+    """find_article only uses the author search on a miss."""
+    
+    QUERY = "Maciej Pocwierz posted an article regarding S3 bucket"
+    
+    def _run(self, general_results, author_results, speculative=False):
+        searcher = MagicMock()
+        searcher._general_search.return_value = general_results
+        if isinstance(author_results, Exception):
+            searcher.search_article.side_effect = author_results
+        else:
+            searcher.search_article.return_value = author_results
+        
+        with patch.object(web_search, "WebSearcher", return_value=searcher), \
+                patch.object(web_search, "_console"), \
+                patch.object(web_search, "_error_prefix"):
+            return web_search.find_article(self.QUERY, speculative=speculative), searcher
+    
+    def test_main_results_win(self):
+        result, searcher = self._run([{"title": "main"}], [{"title": "author"}])
+        self.assertEqual(result["results"], [{"title": "main"}])
+        # No SERPAPI credit is spent on the author search after a hit
+        searcher.search_article.assert_not_called()
+    
+    def test_speculative_main_results_win(self):
+        result, searcher = self._run([{"title": "main"}], [{"title": "author"}], speculative=True)
+        self.assertEqual(result["results"], [{"title": "main"}])
+        searcher.search_article.assert_called_once()
+    
+    def test_author_results_used_on_miss(self):
+        for speculative in (False, True):
+            result, _ = self._run([], [{"title": "author"}], speculative)
+            self.assertTrue(result["found"])
+            self.assertEqual(result["results"], [{"title": "author"}])
+    
+    def test_author_search_error_ignored_on_hit(self):
+        result, _ = self._run([{"title": "main"}], RuntimeError("quota exceeded"), speculative=True)
+        self.assertEqual(result["results"], [{"title": "main"}])
+    
+    def test_author_search_error_reported_on_miss(self):
+        for speculative in (False, True):
+            result, _ = self._run([], RuntimeError("quota exceeded"), speculative)
+            self.assertFalse(result["found"])
+            self.assertEqual(result["error"], "quota exceeded")
+
+
+if __name__ == "__main__":
+    unittest.main()